@@ -0,0 +1,199 @@
+"""Benchmark suite for the dashboard and model.
+
+Measures cold start of app.py, model and holdout loading, predict/predict_proba
+latency and throughput from 1 to 100k rows, and the render time of every
+sidebar page through Streamlit's AppTest harness. Results are written as JSON
+so runs can be compared; ``--compare`` fails if any timing regressed by more
+than ``--threshold``.
+
+Usage:
+    python -m benchmarks.run                                  # writes benchmarks/results/<time>.json
+    python -m benchmarks.run --compare benchmarks/results/baseline.json --threshold 0.2
+"""
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from pisa import HOLDOUT_PATH, MODEL_PATH, ROOT, TARGET
+from pisa.schema import HOLDOUT_SCHEMA
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+BATCH_SIZES = (1, 10, 100, 1_000, 10_000, 100_000)
+
+_COLD_START = """
+import time
+start = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file({app!r}, default_timeout=120)
+at.run()
+assert not at.exception, at.exception
+print(time.perf_counter() - start)
+"""
+
+
+def timed(func, repeat=5, number=1):
+    """Median seconds per call of ``func`` over ``repeat`` rounds of ``number`` calls."""
+    func()  # warm-up
+    rounds = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        rounds.append((time.perf_counter() - start) / number)
+    return {"median_s": statistics.median(rounds), "min_s": min(rounds)}
+
+
+def synthetic_rows(holdout, n, seed=0):
+    """``n`` rows drawn column by column from the holdout's empirical distribution."""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({name: rng.choice(holdout[name].to_numpy(), n) for name in holdout.columns})
+
+
+def bench_cold_start(repeat):
+    app = str(ROOT / "app.py")
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        out = subprocess.run([sys.executable, "-c", _COLD_START.format(app=app)], cwd=ROOT,
+                             capture_output=True, text=True, check=True)
+        runs.append({"process": time.perf_counter() - start, "render": float(out.stdout.split()[-1])})
+    return {
+        "cold_start/process": {"median_s": statistics.median(r["process"] for r in runs)},
+        "cold_start/first_render": {"median_s": statistics.median(r["render"] for r in runs)},
+    }
+
+
+def bench_loading(repeat):
+    from pisa.model import load_model, load_pipeline
+    from pisa.store import load_columns
+
+    return {
+        "load_model/artifact": timed(load_model, repeat),
+        "load_model/pickle": timed(lambda: load_pipeline(MODEL_PATH), repeat),
+        "load_holdout/csv": timed(lambda: pd.read_csv(HOLDOUT_PATH), repeat),
+        "load_holdout/store": timed(load_columns, repeat),
+        "load_holdout/store_5_columns": timed(lambda: load_columns(list(HOLDOUT_SCHEMA)[:5]), repeat),
+    }
+
+
+def bench_inference(repeat, batch_sizes):
+    from pisa.model import load_model, load_pipeline
+    from pisa.single import SingleRowScorer
+
+    holdout = pd.read_csv(HOLDOUT_PATH).drop(columns=[TARGET])
+    models = {"artifact": load_model(), "pickle": load_pipeline(MODEL_PATH)}
+    results = {}
+    for n in batch_sizes:
+        X = synthetic_rows(holdout, n)
+        number = max(1, 1000 // n)
+        for backend, model in models.items():
+            for method in ("predict", "predict_proba"):
+                timing = timed(lambda: getattr(model, method)(X), repeat, number)
+                timing["rows_per_s"] = n / timing["median_s"]
+                results[f"{method}/{backend}/{n}"] = timing
+
+    scorer = SingleRowScorer(models["artifact"])
+    row = holdout.iloc[0].to_numpy(dtype=float)
+    timing = timed(lambda: scorer.proba(row), repeat, 1000)
+    timing["rows_per_s"] = 1 / timing["median_s"]
+    results["predict_proba/single_row_scorer/1"] = timing
+    return results
+
+
+def bench_pages(repeat):
+    from streamlit.testing.v1 import AppTest
+
+    from pisa import views
+
+    results = {}
+    for label in views.PAGES:
+        at = AppTest.from_file(str(ROOT / "app.py"), default_timeout=120)
+        at.run()
+        at.sidebar.radio[0].set_value(label)
+        at.run()  # first render fills the page's caches
+        if at.exception:
+            raise RuntimeError(f"{label} raised: {at.exception[0].message}")
+        results[f"render/{label}"] = timed(at.run, repeat)
+    return results
+
+
+def compare(current, baseline, threshold):
+    """Return ``(name, baseline_s, current_s)`` for timings slower than ``1 + threshold`` times."""
+    regressions = []
+    for name, result in current["results"].items():
+        before = baseline["results"].get(name)
+        if before and result["median_s"] > before["median_s"] * (1 + threshold):
+            regressions.append((name, before["median_s"], result["median_s"]))
+    return regressions
+
+
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", help="results file (default: benchmarks/results/<timestamp>.json)")
+    parser.add_argument("--repeat", type=int, default=5, help="rounds per measurement")
+    parser.add_argument("--max-batch", type=int, default=max(BATCH_SIZES), help="largest batch size")
+    parser.add_argument("--skip", nargs="*", default=[],
+                        choices=["cold_start", "loading", "inference", "pages"])
+    parser.add_argument("--compare", help="baseline results file to check for regressions")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="allowed slowdown vs the baseline, as a fraction")
+    args = parser.parse_args(argv)
+
+    results = {}
+    if "cold_start" not in args.skip:
+        results.update(bench_cold_start(min(args.repeat, 3)))
+    if "loading" not in args.skip:
+        results.update(bench_loading(args.repeat))
+    if "inference" not in args.skip:
+        results.update(bench_inference(args.repeat, [n for n in BATCH_SIZES if n <= args.max_batch]))
+    if "pages" not in args.skip:
+        results.update(bench_pages(args.repeat))
+
+    run = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+        },
+        "results": results,
+    }
+    output = Path(args.output or RESULTS_DIR / f"{time.strftime('%Y%m%d-%H%M%S')}.json")
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(run, indent=2))
+
+    width = max(map(len, results))
+    for name, result in results.items():
+        extra = f"  {result['rows_per_s']:>14,.0f} rows/s" if "rows_per_s" in result else ""
+        print(f"{name:<{width}}  {result['median_s'] * 1000:>10.3f} ms{extra}")
+    print(f"Results written to {output}")
+
+    if args.compare:
+        regressions = compare(run, json.loads(Path(args.compare).read_text()), args.threshold)
+        for name, before, after in regressions:
+            print(f"REGRESSION {name}: {before * 1000:.3f} ms -> {after * 1000:.3f} ms "
+                  f"(+{(after / before - 1) * 100:.0f}%)")
+        if regressions:
+            sys.exit(1)
+        print(f"No regressions beyond {args.threshold:.0%} against {args.compare}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,16 @@
+"""Shared helpers for the PISA 2022 Philippines grade repetition dashboard."""
+import os
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+MODEL_PATH = ROOT / "scripts" / "gb_tk_cat.pkl"
+# Inference-only export of MODEL_PATH, see pisa.artifact
+ARTIFACT_PATH = ROOT / "scripts" / "gb_tk_cat.artifact"
+HOLDOUT_PATH = ROOT / "data" / "holdout.csv"
+
+# Derived data (prediction caches, precomputed tables); safe to delete
+CACHE_DIR = Path(os.environ.get("PISA_CACHE_DIR", ROOT / ".cache"))
+
+# Target column of the holdout set
+TARGET = "REPEAT"
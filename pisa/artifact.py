@@ -0,0 +1,218 @@
+"""Inference-only model artifact that loads in milliseconds.
+
+Unpickling ``gb_tk_cat.pkl`` imports imblearn, sklearn.neighbors and catboost
+and rebuilds the fitted NearMiss sampler, which prediction never uses. The
+artifact keeps only what inference needs, in one file::
+
+    b"PISAMDL1" | uint64 manifest length | manifest JSON | data section
+
+The JSON manifest holds the feature names, the MinMaxScaler parameters, the
+layout of the data section and its SHA-256. The data section holds the
+compiled tree arrays (see ``pisa.oblivious``) followed by the CatBoost native
+model bytes, each aligned to 64 bytes.
+
+``load_artifact`` memory-maps the file and builds the NumPy evaluator over
+views of the mapping, so nothing is copied and every worker process on a host
+shares the same page-cache pages. The evaluator is the fastest to load and to
+score a few rows, but CatBoost scores large batches several times faster, so
+bulk callers load ``backend="catboost"`` and services that see both load
+``backend="auto"``.
+"""
+import hashlib
+import json
+import mmap
+import os
+import struct
+import threading
+
+import numpy as np
+
+from pisa.oblivious import ARRAY_NAMES, CompiledModel
+
+MAGIC = b"PISAMDL1"
+FORMAT_VERSION = 1
+ALIGN = 64
+
+_HEADER = struct.Struct("<8sQ")
+
+# Largest batch the "auto" backend scores with the NumPy evaluator; CatBoost is
+# faster per row from about this size up
+SMALL_BATCH = 64
+
+
+class ArtifactError(Exception):
+    """Raised when an artifact is malformed or fails its checksum."""
+
+
+def _aligned(n):
+    return -(-n // ALIGN) * ALIGN
+
+
+def file_sha256(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def export_artifact(pipeline, path, source_path=None):
+    """Write the inference parts of a fitted pipeline to ``path``; return the manifest."""
+    scaler = pipeline.steps[0][1]
+    booster = pipeline.steps[-1][1]
+    compiled = CompiledModel.from_pipeline(pipeline)
+
+    blobs, layout, offset = [], {}, 0
+    for name, array in compiled.arrays().items():
+        array = np.ascontiguousarray(array)
+        layout[name] = {"dtype": array.dtype.str, "shape": list(array.shape), "offset": offset}
+        blobs.append((offset, array.tobytes()))
+        offset = _aligned(offset + array.nbytes)
+    native = booster._serialize_model()
+    layout["catboost"] = {"offset": offset, "length": len(native)}
+    blobs.append((offset, bytes(native)))
+    size = offset + len(native)
+
+    data = bytearray(size)
+    for start, blob in blobs:
+        data[start:start + len(blob)] = blob
+
+    manifest = {
+        "format_version": FORMAT_VERSION,
+        "feature_names": [str(name) for name in scaler.feature_names_in_],
+        "scaler": {"min": scaler.min_.tolist(), "scale": scaler.scale_.tolist()},
+        "trees": {"scale": compiled.scale, "bias": compiled.bias},
+        "layout": layout,
+        "data_length": size,
+        "sha256": hashlib.sha256(data).hexdigest(),
+    }
+    if source_path is not None:
+        # Lets pisa.model.load_model tell a stale artifact from a current one
+        manifest["source_sha256"] = file_sha256(source_path)
+
+    header = json.dumps(manifest, separators=(",", ":")).encode()
+    header += b" " * (_aligned(_HEADER.size + len(header)) - _HEADER.size - len(header))
+    # Unique per process, so concurrent re-exports never write the same file
+    tmp_path = f"{path}.tmp{os.getpid()}"
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, len(header)))
+        f.write(header)
+        f.write(data)
+    os.replace(tmp_path, path)
+    return manifest
+
+
+class Artifact:
+    """A memory-mapped model artifact."""
+
+    def __init__(self, path, verify=True):
+        self.path = str(path)
+        with open(self.path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, length = _HEADER.unpack_from(self._mmap)
+        if magic != MAGIC:
+            raise ArtifactError(f"{self.path} is not a model artifact")
+        self.manifest = json.loads(self._mmap[_HEADER.size:_HEADER.size + length])
+        if self.manifest["format_version"] != FORMAT_VERSION:
+            raise ArtifactError(f"Unsupported artifact version {self.manifest['format_version']}")
+        start = _HEADER.size + length
+        self.data = memoryview(self._mmap)[start:start + self.manifest["data_length"]]
+        if verify and hashlib.sha256(self.data).hexdigest() != self.manifest["sha256"]:
+            raise ArtifactError(f"Checksum mismatch in {self.path}")
+
+    @property
+    def checksum(self):
+        return self.manifest["sha256"]
+
+    def array(self, name):
+        spec = self.manifest["layout"][name]
+        count = int(np.prod(spec["shape"]))
+        return np.frombuffer(self.data, dtype=spec["dtype"], count=count,
+                             offset=spec["offset"]).reshape(spec["shape"])
+
+    def compiled_model(self):
+        """Build the NumPy evaluator over views of the mapped arrays."""
+        trees = self.manifest["trees"]
+        model = CompiledModel(self.manifest["feature_names"], scale=trees["scale"], bias=trees["bias"],
+                              **{name: self.array(name) for name in ARRAY_NAMES})
+        model.checksum = self.checksum
+        return model
+
+    def catboost_model(self):
+        """Load the native CatBoost model behind the stored scaler parameters."""
+        spec = self.manifest["layout"]["catboost"]
+        blob = bytes(self.data[spec["offset"]:spec["offset"] + spec["length"]])
+        model = NativeModel(self.manifest["feature_names"], self.manifest["scaler"], blob)
+        model.checksum = self.checksum
+        return model
+
+
+class NativeModel:
+    """MinMaxScaler parameters in front of a natively loaded CatBoost model."""
+
+    def __init__(self, feature_names, scaler, blob):
+        from catboost import CatBoostClassifier
+
+        self.feature_names_in_ = np.asarray(feature_names, dtype=object)
+        self.scaler_min = np.asarray(scaler["min"])
+        self.scaler_scale = np.asarray(scaler["scale"])
+        self.booster = CatBoostClassifier().load_model(blob=blob)
+        self.classes_ = np.array([0, 1])
+
+    def _scaled(self, X):
+        if hasattr(X, "columns"):
+            X = X[list(self.feature_names_in_)].to_numpy(dtype=np.float64)
+        return np.asarray(X, dtype=np.float64) * self.scaler_scale + self.scaler_min
+
+    def predict_proba(self, X):
+        return self.booster.predict_proba(self._scaled(X))
+
+    def predict(self, X):
+        return (self.predict_proba(X)[:, 1] > 0.5).astype(np.int64)
+
+
+class AutoModel:
+    """NumPy evaluator for batches of at most ``small_batch`` rows, CatBoost for larger ones.
+
+    The native model is only loaded when the first large batch arrives, so the
+    cold start is the evaluator's.
+    """
+
+    def __init__(self, artifact, small_batch=SMALL_BATCH):
+        self.compiled = artifact.compiled_model()
+        self.feature_names_in_ = self.compiled.feature_names_in_
+        self.classes_ = self.compiled.classes_
+        self.checksum = artifact.checksum
+        self.small_batch = small_batch
+        self._artifact = artifact
+        self._native = None
+        self._lock = threading.Lock()
+
+    @property
+    def native(self):
+        with self._lock:
+            if self._native is None:
+                self._native = self._artifact.catboost_model()
+        return self._native
+
+    def predict_proba(self, X):
+        model = self.compiled if len(X) <= self.small_batch else self.native
+        return model.predict_proba(X)
+
+    def predict(self, X):
+        return (self.predict_proba(X)[:, 1] > 0.5).astype(np.int64)
+
+
+def load_artifact(path, backend="numpy", verify=True):
+    """Load a model from an artifact file.
+
+    ``backend="numpy"`` (the default) returns the memory-mapped
+    ``CompiledModel`` and needs no catboost; ``backend="catboost"`` loads the
+    native CatBoost model instead, and ``backend="auto"`` picks one of the two
+    per batch by its size (see ``AutoModel``).
+    """
+    artifact = Artifact(path, verify=verify)
+    if backend == "numpy":
+        return artifact.compiled_model()
+    if backend == "catboost":
+        return artifact.catboost_model()
+    if backend == "auto":
+        return AutoModel(artifact)
+    raise ValueError(f"Unknown backend {backend!r}")
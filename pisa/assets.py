@@ -0,0 +1,138 @@
+"""Web-sized image variants and rendered charts as cached bytes.
+
+The PNGs under ``images/`` are up to 1870 px wide and 180 KB. Pages show
+them at column width, so ``build_variants`` writes WebP copies at a few
+``WIDTHS`` (never upscaled) under the cache directory, and ``image`` serves
+the smallest variant at least as wide as requested. Variants missing or
+older than their source are rebuilt on first use, so the build step
+(``scripts/build_assets.py``) only moves that work ahead of the first page
+load. The landing-page hero is downloaded by the build step and served from
+its local variants; until then pages fall back to its URL.
+
+File contents are kept in an in-process byte cache keyed by path and mtime,
+so reruns neither re-read nor re-decode images. ``figure_png`` renders a
+matplotlib figure once to PNG bytes, for charts cached by the pages.
+"""
+import io
+import os
+import threading
+import urllib.request
+
+from pisa import CACHE_DIR, ROOT
+
+IMAGES_DIR = ROOT / "images"
+ASSETS_DIR = CACHE_DIR / "assets"
+
+WIDTHS = (480, 960, 1440)
+WEBP_QUALITY = 80
+
+HERO_URL = "https://images.unsplash.com/photo-1523050854058-8df90110c9f1"
+# Downloaded at the largest variant width; the build step fetches it
+HERO_PATH = ASSETS_DIR / "hero.jpg"
+
+_bytes = {}
+_bytes_lock = threading.Lock()
+
+
+def read_bytes(path):
+    """Contents of ``path``, read from disk only when its mtime changes."""
+    path = str(path)
+    mtime = os.stat(path).st_mtime_ns
+    with _bytes_lock:
+        entry = _bytes.get(path)
+        if entry is not None and entry[0] == mtime:
+            return entry[1]
+    with open(path, "rb") as f:
+        data = f.read()
+    with _bytes_lock:
+        _bytes[path] = (mtime, data)
+    return data
+
+
+def variant_path(source, width):
+    return ASSETS_DIR / f"{os.path.splitext(os.path.basename(source))[0]}.{width}.webp"
+
+
+def _stale(path, source):
+    try:
+        return os.stat(path).st_mtime_ns < os.stat(source).st_mtime_ns
+    except FileNotFoundError:
+        return True
+
+
+def build_variants(source, widths=WIDTHS, quality=WEBP_QUALITY):
+    """Write WebP variants of ``source`` at ``widths`` (capped at its own width); return their paths.
+
+    The image is decoded once; every variant is written atomically.
+    """
+    from PIL import Image
+
+    os.makedirs(ASSETS_DIR, exist_ok=True)
+    paths = []
+    with Image.open(source) as image:
+        image.load()
+        for width in widths:
+            target = min(width, image.width)
+            height = round(image.height * target / image.width)
+            resized = image if target == image.width else image.resize((target, height), Image.LANCZOS)
+            path = variant_path(source, width)
+            tmp = f"{path}.tmp{os.getpid()}.{threading.get_ident()}"
+            resized.save(tmp, "WEBP", quality=quality, method=6)
+            os.replace(tmp, path)
+            paths.append(path)
+    return paths
+
+
+def image(source, width=WIDTHS[1]):
+    """WebP bytes of ``source`` (path, or name under ``images/``) at least ``width`` px wide.
+
+    Falls back to the widest variant when ``width`` exceeds every variant.
+    """
+    source = str(IMAGES_DIR / source) if not os.path.dirname(str(source)) else str(source)
+    chosen = next((w for w in WIDTHS if w >= width), WIDTHS[-1])
+    path = variant_path(source, chosen)
+    if _stale(path, source):
+        build_variants(source)
+    return read_bytes(path)
+
+
+def download_hero(url=HERO_URL, path=HERO_PATH, timeout=30):
+    """Fetch the hero image at the largest variant width into the cache directory."""
+    os.makedirs(ASSETS_DIR, exist_ok=True)
+    with urllib.request.urlopen(f"{url}?w={WIDTHS[-1]}&fm=jpg&q=85", timeout=timeout) as response:
+        data = response.read()
+    tmp = f"{path}.tmp{os.getpid()}.{threading.get_ident()}"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+    return path
+
+
+def hero(width=WIDTHS[1]):
+    """Hero image bytes from the local copy, or its URL when it has not been downloaded."""
+    if not HERO_PATH.exists():
+        return HERO_URL
+    return image(HERO_PATH, width)
+
+
+def build_all(hero_url=HERO_URL):
+    """Variants of every PNG under ``images/`` and of the hero; return ``{source: paths}``.
+
+    A failed hero download is reported as ``None`` (pages keep using the URL).
+    """
+    built = {str(source): build_variants(source) for source in sorted(IMAGES_DIR.glob("*.png"))}
+    try:
+        built[str(HERO_PATH)] = build_variants(download_hero(hero_url))
+    except OSError:
+        built[str(HERO_PATH)] = None
+    return built
+
+
+def figure_png(fig, dpi=200):
+    """Render a matplotlib figure to PNG bytes and close it, at ``st.pyplot``'s resolution."""
+    import matplotlib.pyplot as plt
+
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png", dpi=dpi, bbox_inches="tight")
+    plt.close(fig)
+    return buffer.getvalue()
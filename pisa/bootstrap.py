@@ -0,0 +1,144 @@
+"""Bootstrap confidence intervals for holdout metrics.
+
+Resamples are drawn as index matrices and turned into per-row counts, so
+every metric of a whole block of resamples is a matrix product with the
+block's count matrix: confusion counts are ``counts @ indicator``, and ROC AUC
+is the weighted Mann-Whitney statistic over tie groups of the scores, sorted
+once. Nothing is refitted or rescored, so the inputs are just labels and
+cached probabilities. Blocks are spread over a process pool, each seeded
+from its own ``SeedSequence`` child, so results do not depend on the number
+of workers.
+
+``paired_bootstrap`` evaluates two models on the same resamples, which gives
+a much tighter interval on their difference than two independent intervals.
+"""
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+METRICS = ("precision", "recall", "f1", "roc_auc")
+
+# Bump when the resampling or the interval layout changes, to invalidate cached intervals
+BOOTSTRAP_VERSION = 1
+
+# Resamples per block; a block's count matrix is BLOCK x rows float64
+BLOCK = 500
+
+# Below this many resampled rows in total a pool costs more than it saves
+PARALLEL_MIN_ROWS = 50_000_000
+
+
+class _Scores:
+    """Per-model quantities reused by every block of resamples."""
+
+    def __init__(self, y_true, proba, threshold):
+        order = np.argsort(proba, kind="stable")
+        sorted_proba = proba[order]
+        self.order = order
+        self.starts = np.flatnonzero(np.r_[True, np.diff(sorted_proba) != 0])
+        self.positive = y_true[order].astype(np.float64)
+        self.negative = 1.0 - self.positive
+        flagged = proba >= threshold
+        self.tp = (flagged & y_true).astype(np.float64)
+        self.fp = (flagged & ~y_true).astype(np.float64)
+
+    def metrics(self, counts, positives):
+        tp, fp = counts @ self.tp, counts @ self.fp
+        with np.errstate(divide="ignore", invalid="ignore"):
+            precision = np.where(tp + fp > 0, tp / (tp + fp), 0.0)
+            recall = np.where(positives > 0, tp / positives, np.nan)
+            f1 = np.where(positives + tp + fp > 0, 2 * tp / (positives + tp + fp), 0.0)
+
+        # Weighted Mann-Whitney: each positive beats the negatives in lower tie
+        # groups and ties half of those in its own group
+        weights = counts[:, self.order]
+        pos = np.add.reduceat(weights * self.positive, self.starts, axis=1)
+        neg = np.add.reduceat(weights * self.negative, self.starts, axis=1)
+        below = np.cumsum(neg, axis=1) - neg
+        wins = (pos * (below + 0.5 * neg)).sum(axis=1)
+        n_pos, n_neg = pos.sum(axis=1), neg.sum(axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            roc_auc = np.where((n_pos > 0) & (n_neg > 0), wins / (n_pos * n_neg), np.nan)
+        return {"precision": precision, "recall": recall, "f1": f1, "roc_auc": roc_auc}
+
+
+def resample_indices(n_rows, n_resamples, rng):
+    """``(n_resamples, n_rows)`` matrix of row indices drawn with replacement."""
+    dtype = np.int32 if n_rows < 2 ** 31 else np.int64
+    return rng.integers(0, n_rows, size=(n_resamples, n_rows), dtype=dtype)
+
+
+def _counts(indices, n_rows):
+    """How often each row appears in each resample, as a float matrix."""
+    n_resamples = len(indices)
+    offsets = np.arange(n_resamples, dtype=np.int64)[:, None] * n_rows
+    flat = np.bincount((indices + offsets).ravel(), minlength=n_resamples * n_rows)
+    return flat.reshape(n_resamples, n_rows).astype(np.float64)
+
+
+def _block(y_true, probas, threshold, seed, size):
+    """Metrics of every model on ``size`` resamples drawn from ``seed``."""
+    y_true = np.asarray(y_true, dtype=bool)
+    indices = resample_indices(len(y_true), size, np.random.default_rng(seed))
+    counts = _counts(indices, len(y_true))
+    positives = counts @ y_true.astype(np.float64)
+    return [_Scores(y_true, proba, threshold).metrics(counts, positives) for proba in probas]
+
+
+def _run(y_true, probas, threshold, n_resamples, seed, workers):
+    y_true = np.asarray(y_true).astype(bool)
+    probas = [np.asarray(proba, dtype=np.float64) for proba in probas]
+    sizes = [min(BLOCK, n_resamples - start) for start in range(0, n_resamples, BLOCK)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    if workers is None:
+        parallel = len(y_true) * n_resamples >= PARALLEL_MIN_ROWS
+        workers = min(os.cpu_count() or 1, len(sizes)) if parallel else 1
+
+    if workers <= 1:
+        blocks = [_block(y_true, probas, threshold, s, size) for s, size in zip(seeds, sizes)]
+    else:
+        # Spawned, not forked: callers such as the Streamlit server are multithreaded
+        with ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+            blocks = list(pool.map(_block, [y_true] * len(sizes), [probas] * len(sizes),
+                                   [threshold] * len(sizes), seeds, sizes))
+    return [{name: np.concatenate([block[m][name] for block in blocks]) for name in METRICS}
+            for m in range(len(probas))]
+
+
+def bootstrap_metrics(y_true, proba, threshold=0.5, n_resamples=10_000, seed=0, workers=None):
+    """Bootstrap distribution of each metric: ``{metric: array of n_resamples}``."""
+    return _run(y_true, [proba], threshold, n_resamples, seed, workers)[0]
+
+
+def confidence_interval(samples, level=0.95):
+    """Percentile interval of bootstrap ``samples``, ignoring undefined resamples."""
+    tail = (1 - level) / 2 * 100
+    low, high = np.nanpercentile(samples, [tail, 100 - tail])
+    return float(low), float(high)
+
+
+def bootstrap_ci(y_true, proba, threshold=0.5, level=0.95, **kwargs):
+    """``{metric: (low, high)}`` percentile intervals at ``level``."""
+    samples = bootstrap_metrics(y_true, proba, threshold, **kwargs)
+    return {name: confidence_interval(values, level) for name, values in samples.items()}
+
+
+def paired_bootstrap(y_true, proba_a, proba_b, threshold=0.5, level=0.95, n_resamples=10_000,
+                     seed=0, workers=None):
+    """Compare two models scored on the same rows, resampling both identically.
+
+    Returns ``{metric: {"difference": (low, high), "p_value": p}}`` for the
+    difference ``b - a``; ``p_value`` is the two-sided bootstrap p-value for
+    "no difference".
+    """
+    a, b = _run(y_true, [proba_a, proba_b], threshold, n_resamples, seed, workers)
+    result = {}
+    for name in METRICS:
+        difference = b[name] - a[name]
+        difference = difference[~np.isnan(difference)]
+        p_value = 2 * min((difference <= 0).mean(), (difference >= 0).mean()) if len(difference) else np.nan
+        result[name] = {"difference": confidence_interval(difference, level),
+                        "p_value": float(min(p_value, 1.0))}
+    return result
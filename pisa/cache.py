@@ -0,0 +1,169 @@
+"""Content-addressed, disk-persistent cache for predictions and metrics.
+
+Entries are keyed on digests of their inputs (the model's checksum, the
+scored frame's contents, ...), so a new model file or dataset simply produces
+new keys and stale entries age out. Values are pickled under the cache
+directory, which survives server restarts and is shared by every session and
+process; a small in-memory layer in front of it saves the unpickling on hot
+keys. When the directory grows past ``max_bytes`` the least recently used
+entries are evicted, using file mtimes as the access clock.
+"""
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from pisa import CACHE_DIR, profiling
+
+DEFAULT_MAX_BYTES = 512 * 1024 ** 2
+
+# Bump when cached probabilities change meaning (e.g. a new scoring convention)
+PROBA_VERSION = 1
+
+_MISSING = object()
+
+
+def digest(*parts):
+    """SHA-256 hex digest of strings/bytes ``parts``."""
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(part if isinstance(part, bytes) else str(part).encode())
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def frame_digest(df):
+    """Digest of a frame's (or array's) column names, dtypes and values."""
+    if isinstance(df, np.ndarray):
+        return digest(df.dtype.str, df.shape, np.ascontiguousarray(df).tobytes())
+    if isinstance(df, pd.Series):
+        df = df.to_frame()
+    values = pd.util.hash_pandas_object(df, index=False).to_numpy()
+    return digest(list(df.columns), [str(t) for t in df.dtypes], values.tobytes())
+
+
+def model_digest(model):
+    """Checksum of the file a model was loaded from."""
+    checksum = getattr(model, "checksum", None)
+    if checksum is None:
+        raise ValueError("Model has no checksum; load it with pisa.model.load_model()")
+    return checksum
+
+
+class DiskCache:
+    """Size-bounded LRU cache of pickled values in a directory."""
+
+    def __init__(self, directory=CACHE_DIR / "results", max_bytes=DEFAULT_MAX_BYTES, memory_items=64):
+        self.directory = str(directory)
+        self.max_bytes = max_bytes
+        self.memory_items = memory_items
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.pkl")
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return self._memory[key]
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+            os.utime(path)  # mark as recently used
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return default
+        self._remember(key, value)
+        return value
+
+    def set(self, key, value):
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, self._path(key))
+        self._remember(key, value)
+        self.evict()
+
+    def get_or_compute(self, key, compute):
+        """Return the cached value for ``key``, computing and storing it on a miss."""
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            profiling.mark_miss()
+            value = compute()
+            self.set(key, value)
+        return value
+
+    def _remember(self, key, value):
+        with self._lock:
+            self._memory[key] = value
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_items:
+                self._memory.popitem(last=False)
+
+    def evict(self):
+        """Delete least recently used entries until the directory fits in ``max_bytes``."""
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".pkl"):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            key = os.path.basename(path)[:-len(".pkl")]
+            with self._lock:
+                self._memory.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".pkl"):
+                os.remove(entry.path)
+
+
+_default = None
+_default_lock = threading.Lock()
+
+
+def default_cache():
+    """Process-wide cache shared by all sessions."""
+    global _default
+    with _default_lock:
+        if _default is None:
+            max_bytes = int(os.environ.get("PISA_CACHE_MAX_BYTES", DEFAULT_MAX_BYTES))
+            _default = DiskCache(max_bytes=max_bytes)
+        return _default
+
+
+def cached_proba(model, X, cache=None):
+    """Positive-class probabilities of ``X``, computed at most once per model and input."""
+    cache = cache or default_cache()
+    key = digest("proba", PROBA_VERSION, model_digest(model), frame_digest(X))
+    return cache.get_or_compute(key, lambda: np.asarray(model.predict_proba(X))[:, 1])
+
+
+def cached(kind, model, *inputs, compute, version, cache=None):
+    """Cache ``compute()`` under ``kind`` for a model and any number of input frames.
+
+    ``version`` is the producing module's format version (e.g.
+    ``THRESHOLDS_VERSION``): bumping it stops older pickles of a changed
+    class from being read back.
+    """
+    cache = cache or default_cache()
+    key = digest(kind, version, model_digest(model), *(frame_digest(x) for x in inputs))
+    return cache.get_or_compute(key, compute)
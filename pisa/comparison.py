@@ -0,0 +1,197 @@
+"""Cross-validated comparison of the baseline model families.
+
+Every (model, fold) fit is an independent task, run in parallel with joblib.
+Each finished fit is checkpointed under the cache directory, keyed on the
+model's parameters, the training data and the fold split, so an interrupted
+or repeated sweep only fits what is missing. The summary is written to
+``data/baseline_results.json``, which the Machine Learning Pipeline page
+renders in place of its hardcoded table.
+
+All models share the final model's preprocessing (MinMax scaling, then
+NearMiss undersampling, cached per fold by ``pisa.resample``); recall is reported on the training folds, the
+validation folds and the holdout. The ML stack is imported inside the
+harness functions, so the page can read the results without loading it.
+"""
+import json
+import os
+import time
+
+import numpy as np
+
+from pisa import CACHE_DIR, ROOT, TARGET
+from pisa.cache import digest, frame_digest
+
+RESULTS_PATH = ROOT / "data" / "baseline_results.json"
+CHECKPOINT_DIR = CACHE_DIR / "comparison"
+
+# Bump when the fitting or scoring procedure changes, to invalidate checkpoints
+HARNESS_VERSION = 1
+
+METRICS = ("train_recall", "validation_recall", "holdout_recall")
+
+
+def model_families(seed=0):
+    """Baseline classifiers by display name; XGBoost only when it is installed."""
+    from catboost import CatBoostClassifier
+    from sklearn.ensemble import AdaBoostClassifier, GradientBoostingClassifier, RandomForestClassifier
+    from sklearn.tree import DecisionTreeClassifier
+
+    families = {
+        "Decision Tree": DecisionTreeClassifier(random_state=seed),
+        "Random Forest": RandomForestClassifier(random_state=seed, n_jobs=1),
+        "Gradient Boosting": GradientBoostingClassifier(random_state=seed),
+        "AdaBoost": AdaBoostClassifier(random_state=seed),
+    }
+    try:
+        from xgboost import XGBClassifier
+    except ImportError:
+        pass
+    else:
+        families["XGBoost"] = XGBClassifier(random_state=seed, n_jobs=1, eval_metric="logloss")
+    families["CatBoost"] = CatBoostClassifier(random_seed=seed, thread_count=1, verbose=0,
+                                              allow_writing_files=False)
+    return families
+
+
+def make_model(classifier):
+    """The final model's preprocessing in front of ``classifier``."""
+    from imblearn.pipeline import make_pipeline
+    from sklearn.base import clone
+    from sklearn.preprocessing import MinMaxScaler
+
+    from pisa.resample import CachedNearMiss
+
+    return make_pipeline(MinMaxScaler(), CachedNearMiss(version=1, n_neighbors=3), clone(classifier))
+
+
+def _checkpoint_path(name, classifier, data_key, fold):
+    params = sorted((k, repr(v)) for k, v in classifier.get_params().items())
+    key = digest("comparison", HARNESS_VERSION, name, params, data_key, fold)
+    return CHECKPOINT_DIR / f"{key[:32]}.joblib"
+
+
+def _fit_fold(name, classifier, X, y, train_index, test_index, path):
+    """Fit one fold (``test_index=None``: the full training set) and checkpoint it."""
+    import joblib
+    from sklearn.metrics import recall_score
+
+    model = make_model(classifier)
+    start = time.perf_counter()
+    model.fit(X.iloc[train_index], y.iloc[train_index])
+    result = {
+        "model": name,
+        "fit_seconds": time.perf_counter() - start,
+        "train_recall": recall_score(y.iloc[train_index], model.predict(X.iloc[train_index])),
+        "validation_recall": (None if test_index is None else
+                              recall_score(y.iloc[test_index], model.predict(X.iloc[test_index]))),
+        "estimator": model,
+    }
+    os.makedirs(path.parent, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.tmp{os.getpid()}")
+    joblib.dump(result, tmp_path)
+    os.replace(tmp_path, path)
+    return result
+
+
+def _load_checkpoint(path):
+    import joblib
+
+    try:
+        return joblib.load(path)
+    except (OSError, EOFError, ValueError):
+        return None
+
+
+def run_comparison(train, holdout, families=None, folds=5, seed=0, n_jobs=-1, verbose=0):
+    """Cross-validate every model family on ``train`` and score the holdout.
+
+    ``train`` and ``holdout`` are frames with the feature columns and
+    ``REPEAT``. Returns the summary written by ``save_results``.
+    """
+    import joblib
+    from sklearn.metrics import recall_score
+    from sklearn.model_selection import StratifiedKFold
+
+    families = families or model_families(seed)
+    X, y = train.drop(columns=TARGET), train[TARGET]
+    X_holdout, y_holdout = holdout[X.columns], holdout[TARGET]
+
+    splitter = StratifiedKFold(n_splits=folds, shuffle=True, random_state=seed)
+    splits = [(f"cv{folds}-{seed}-{k}", train_index, test_index)
+              for k, (train_index, test_index) in enumerate(splitter.split(X, y))]
+    splits.append(("full", np.arange(len(X)), None))
+    data_key = frame_digest(train)
+
+    tasks, results = [], {}
+    for name, classifier in families.items():
+        for fold, train_index, test_index in splits:
+            path = _checkpoint_path(name, classifier, data_key, fold)
+            checkpoint = _load_checkpoint(path) if path.exists() else None
+            if checkpoint is not None:
+                results[name, fold] = checkpoint
+            else:
+                tasks.append(((name, fold),
+                              joblib.delayed(_fit_fold)(name, classifier, X, y, train_index,
+                                                        test_index, path)))
+    if verbose:
+        print(f"{len(results)} fits restored from checkpoints, {len(tasks)} to run")
+    if tasks:
+        fitted = joblib.Parallel(n_jobs=n_jobs, verbose=verbose)(task for _, task in tasks)
+        results.update(zip((key for key, _ in tasks), fitted))
+
+    models = {}
+    for name in families:
+        cv = [results[name, fold] for fold, _, test_index in splits if test_index is not None]
+        full = results[name, "full"]
+        validation = [r["validation_recall"] for r in cv]
+        models[name] = {
+            "train_recall": float(np.mean([r["train_recall"] for r in cv])),
+            "validation_recall": float(np.mean(validation)),
+            "validation_recall_std": float(np.std(validation)),
+            "holdout_recall": float(recall_score(y_holdout, full["estimator"].predict(X_holdout))),
+            "fit_seconds": float(sum(r["fit_seconds"] for r in cv) + full["fit_seconds"]),
+        }
+    return {
+        "generated": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "folds": folds,
+        "seed": seed,
+        "train_rows": len(train),
+        "holdout_rows": len(holdout),
+        "models": models,
+        "observations": observations(models),
+    }
+
+
+def observations(models):
+    """Plain-language takeaways from ``{model: {metric: fraction}}``."""
+    if not models:
+        return []
+    gaps = {name: m["train_recall"] - m["validation_recall"] for name, m in models.items()}
+    overfit, steady = max(gaps, key=gaps.get), min(gaps, key=gaps.get)
+    best_validation = max(models, key=lambda name: models[name]["validation_recall"])
+    best_holdout = max(models, key=lambda name: models[name]["holdout_recall"])
+    return [
+        f"{best_validation} has the best validation recall "
+        f"({models[best_validation]['validation_recall']:.1%}).",
+        f"{best_holdout} generalizes best to the holdout "
+        f"({models[best_holdout]['holdout_recall']:.1%} recall).",
+        f"{overfit} overfits the most: {models[overfit]['train_recall']:.1%} train vs "
+        f"{models[overfit]['validation_recall']:.1%} validation recall.",
+        f"{steady} has the smallest train/validation gap ({gaps[steady]:.1%}).",
+    ]
+
+
+def save_results(results, path=RESULTS_PATH):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(results, f, indent=1)
+    os.replace(tmp_path, path)
+
+
+def load_results(path=RESULTS_PATH):
+    """The saved comparison, or ``None`` if the harness has not been run."""
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
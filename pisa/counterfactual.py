@@ -0,0 +1,184 @@
+"""Counterfactual recommendations: the smallest actionable changes that lower a student's risk.
+
+Only features a school or family can act on are changed (attendance,
+punctuality, homework, digital habits, ICT resources and family support),
+each in its helpful direction and only to values observed in the holdout.
+The cost of a change is its size in the model's MinMax-scaled units, so a
+step of one on a 0-10 scale costs a tenth of flipping a 0/1 flag.
+
+``CounterfactualSearch`` is greedy and batched. At every step, for all open
+students at once, it builds every candidate (one more feature moved to any
+allowed value) and scores them on the compiled tree arrays. A candidate
+differs from the student's current row in a single feature, so only the
+trees splitting on that feature are evaluated (``CompiledModel.restrict``),
+typically a few dozen of the 750. Each student then takes the cheapest
+change that brings the risk below the threshold or, failing that, the one
+with the largest drop in log-odds per unit of cost, up to ``max_changes``.
+"""
+import numpy as np
+import pandas as pd
+
+from pisa.oblivious import CompiledModel
+
+# Feature -> (helpful direction, display label)
+ACTIONABLE = {
+    "MISSSC": (-1, "Missed more than three months of school"),
+    "SKIPPING": (-1, "Skipped whole school days"),
+    "TARDYSD": (-1, "Arrived late for school"),
+    "STUDYHMW": (+1, "Study or homework before/after school"),
+    "ICTRES": (+1, "ICT resources at home (index)"),
+    "FAMSUP": (+1, "Family support (index)"),
+    "digi_hrs_learn_school": (+1, "Digital learning hours at school"),
+    "digi_hrs_learn_b_a_school": (+1, "Digital learning hours before/after school"),
+    "digi_hrs_learn_weekends": (+1, "Digital learning hours on weekends"),
+    "digi_hrs_leisure_school": (-1, "Digital leisure hours at school"),
+    "digi_hrs_leisure_b_a_school": (-1, "Digital leisure hours before/after school"),
+    "digi_hrs_leisure_weekends": (-1, "Digital leisure hours on weekends"),
+}
+
+# Features with more distinct values than this are searched on a quantile grid
+MAX_VALUES = 16
+INDEX_STEPS = 10
+
+
+class Action:
+    """One actionable feature, its helpful direction and the values it may be moved to."""
+
+    def __init__(self, feature, direction, label, values):
+        self.feature, self.direction, self.label = feature, direction, label
+        self.values = np.unique(np.asarray(values, dtype=np.float64))
+
+    def __repr__(self):
+        return f"Action({self.feature!r}, {self.direction:+d}, {len(self.values)} values)"
+
+
+def actions_from(reference, features=ACTIONABLE):
+    """Actions over ``features`` with candidate values taken from the ``reference`` frame.
+
+    Discrete features may take any of their observed values; continuous
+    indices take the deciles of the reference.
+    """
+    actions = []
+    for feature, (direction, label) in features.items():
+        column = reference[feature].dropna().to_numpy(dtype=np.float64)
+        values = np.unique(column)
+        if len(values) > MAX_VALUES:
+            values = np.quantile(column, np.linspace(0, 1, INDEX_STEPS + 1))
+        actions.append(Action(feature, direction, label, values))
+    return actions
+
+
+class CounterfactualSearch:
+    """Greedy, batched search for low-cost changes that bring risk below ``threshold``."""
+
+    def __init__(self, model, actions, threshold=0.5, max_changes=3):
+        if not isinstance(model, CompiledModel):
+            model = CompiledModel.from_pipeline(model)
+        self.model = model
+        self.actions = list(actions)
+        self.threshold = threshold
+        self.max_changes = max_changes
+        self.features = [str(name) for name in model.feature_names_in_]
+        self._columns = [self.features.index(a.feature) for a in self.actions]
+        self._trees = [model.restrict([a.feature]) for a in self.actions]
+        # Students are flagged at proba >= threshold, i.e. raw >= logit(threshold)
+        self._target = np.log(threshold / (1 - threshold))
+
+    def _best_moves(self, current, raw, used):
+        """Per row: the chosen action, value, raw delta, cost and whether it reaches the target.
+
+        Rows with no helpful move left get action -1. Features already in
+        ``used`` are not moved again: each goes straight to its chosen value.
+        """
+        n = len(current)
+        best_action = np.full(n, -1)
+        best_value, best_delta, best_cost = np.zeros(n), np.zeros(n), np.zeros(n)
+        best_reach = np.zeros(n, dtype=bool)
+        best_key = np.full(n, -np.inf)
+
+        for a, (action, column, trees) in enumerate(zip(self.actions, self._columns, self._trees)):
+            now = current[:, column]
+            allowed = (action.direction * (action.values[None, :] - now[:, None]) > 0) & ~used[:, [a]]
+            rows, positions = np.nonzero(allowed)
+            if not len(rows):
+                continue
+            candidates = current[rows]
+            candidates[:, column] = action.values[positions]
+            # Only this feature changed, so only the trees splitting on it can move the score
+            delta = trees.predict_raw(candidates) - trees.predict_raw(current)[rows]
+            cost = np.abs(action.values[positions] - now[rows]) * abs(self.model.scaler_scale[column])
+            reach = raw[rows] + delta < self._target
+            # Reaching moves rank by (lowest) cost, the others by log-odds drop per unit cost
+            key = np.where(reach, -cost, -delta / cost)
+            useful = reach | (delta < 0)
+            rows, positions, delta, cost, reach, key = (
+                v[useful] for v in (rows, positions, delta, cost, reach, key))
+
+            # Best candidate of this action per row: sort by row, then reach, then key
+            order = np.lexsort((-key, ~reach, rows))
+            first = order[np.r_[True, rows[order][1:] != rows[order][:-1]]] if len(order) else order
+            r = rows[first]
+            better = (reach[first] & ~best_reach[r]) | ((reach[first] == best_reach[r]) & (key[first] > best_key[r]))
+            r, first = r[better], first[better]
+            best_action[r] = a
+            best_value[r] = action.values[positions[first]]
+            best_delta[r], best_cost[r] = delta[first], cost[first]
+            best_reach[r], best_key[r] = reach[first], key[first]
+        return best_action, best_value, best_delta, best_cost, best_reach
+
+    def search(self, X):
+        """Recommendations for every row of ``X`` (a frame with the model's features).
+
+        Returns ``(summary, changes)``. ``summary`` has one row per student:
+        ``risk`` and ``new_risk`` probabilities, ``at_risk``, ``reached``
+        (below the threshold after the changes), ``changes`` and ``cost``.
+        ``changes`` is long-format: one row per recommended change in the
+        order chosen, with the feature, its label, the current and suggested
+        values and the risk after the change.
+        """
+        index = X.index if hasattr(X, "index") else pd.RangeIndex(len(X))
+        current = np.array(X[self.features] if hasattr(X, "columns") else X, dtype=np.float64)
+        raw = self.model.predict_raw(current)
+        start = raw.copy()
+        cost = np.zeros(len(current))
+        used = np.zeros((len(current), len(self.actions)), dtype=bool)
+        open_ = raw >= self._target
+        records = []
+
+        for step in range(self.max_changes):
+            rows = np.flatnonzero(open_)
+            if not len(rows):
+                break
+            action, value, delta, step_cost, reach = self._best_moves(current[rows], raw[rows], used[rows])
+            moved = action >= 0
+            open_[rows[~moved]] = False
+            rows, action, value, delta, step_cost, reach = (
+                v[moved] for v in (rows, action, value, delta, step_cost, reach))
+
+            columns = np.asarray(self._columns)[action]
+            before = current[rows, columns]
+            current[rows, columns] = value
+            raw[rows] += delta
+            cost[rows] += step_cost
+            used[rows, action] = True
+            open_[rows[reach]] = False
+            records.append(pd.DataFrame({
+                "student": index[rows], "step": step + 1,
+                "feature": [self.actions[a].feature for a in action],
+                "label": [self.actions[a].label for a in action],
+                "current": before, "suggested": value, "risk_after": _proba(raw[rows]),
+            }))
+
+        changes = pd.concat(records, ignore_index=True) if records else pd.DataFrame(
+            columns=["student", "step", "feature", "label", "current", "suggested", "risk_after"])
+        changes = changes.sort_values(["student", "step"], kind="stable", ignore_index=True)
+        summary = pd.DataFrame({
+            "risk": _proba(start), "new_risk": _proba(raw),
+            "at_risk": start >= self._target, "reached": raw < self._target,
+            "changes": used.sum(axis=1), "cost": cost,
+        }, index=index)
+        return summary, changes
+
+
+def _proba(raw):
+    return 1.0 / (1.0 + np.exp(-raw))
@@ -0,0 +1,132 @@
+"""Dense aggregation cubes: counts and sums over a grid of coded dimensions.
+
+A cube is built in one pass over a frame (``np.bincount`` on the flattened
+cell index) and afterwards answers any filter and group-by over its
+dimensions by slicing and summing cells, without touching the rows again.
+Adding rows later only adds their cell counts.
+
+Dimensions map a frame to integer codes: distinct values of a column,
+histogram bins of a numeric column, or the active column of a one-hot group.
+Cubes hold only arrays and plain values, so they pickle into the disk cache.
+"""
+import numpy as np
+import pandas as pd
+
+
+class Dimension:
+    """How one cube axis is coded from a frame, and the label of every code."""
+
+    def __init__(self, name, kind, labels, column=None, values=None, edges=None, columns=None):
+        self.name, self.kind, self.labels = name, kind, list(labels)
+        self.column, self.values, self.edges, self.columns = column, values, edges, columns
+
+    def __len__(self):
+        return len(self.labels)
+
+    @classmethod
+    def categorical(cls, column, values, labels=None, name=None):
+        """One code per value in ``values``; ``labels`` maps values to display labels."""
+        values = np.sort(np.asarray(values))
+        labels = [labels.get(v.item(), str(v)) if labels else v.item() for v in values]
+        return cls(name or column, "categorical", labels, column=column, values=values)
+
+    @classmethod
+    def binned(cls, column, edges, name=None, labels=None):
+        """Histogram bins with the given edges; out-of-range values go to the end bins.
+
+        Bins are labelled by their centres unless ``labels`` are given.
+        """
+        edges = np.asarray(edges, dtype=np.float64)
+        if labels is None:
+            labels = 0.5 * (edges[:-1] + edges[1:])
+        return cls(name or column, "binned", labels, column=column, edges=edges)
+
+    @classmethod
+    def one_hot(cls, name, columns, labels, other):
+        """The first set column of ``columns``, or an extra ``other`` code when none is set."""
+        return cls(name, "one_hot", list(labels) + [other], columns=list(columns))
+
+    @property
+    def widths(self):
+        return np.diff(self.edges) if self.kind == "binned" else np.ones(len(self))
+
+    def codes(self, df):
+        if self.kind == "categorical":
+            column = df[self.column].to_numpy()
+            codes = np.searchsorted(self.values, column)
+            known = (codes < len(self.values)) & (self.values[np.minimum(codes, len(self.values) - 1)] == column)
+            if not known.all():
+                raise ValueError(f"{self.column!r} has values outside the dimension: "
+                                 f"{sorted(set(column[~known].tolist()))[:5]}")
+            return codes
+        if self.kind == "binned":
+            column = df[self.column].to_numpy(dtype=np.float64)
+            return np.clip(np.searchsorted(self.edges, column, side="right") - 1, 0, len(self) - 1)
+        flags = df[self.columns].to_numpy() != 0
+        return np.where(flags.any(axis=1), flags.argmax(axis=1), len(self.columns))
+
+    def code(self, label):
+        try:
+            return self.labels.index(label)
+        except ValueError:
+            raise KeyError(f"{label!r} is not a label of dimension {self.name!r}") from None
+
+
+class Cube:
+    """Row counts and measure sums for every cell of a grid of dimensions."""
+
+    def __init__(self, dimensions, measures=()):
+        self.dimensions = list(dimensions)
+        self.shape = tuple(len(d) for d in self.dimensions)
+        self.counts = np.zeros(self.shape, dtype=np.int64)
+        self.sums = {measure: np.zeros(self.shape) for measure in measures}
+
+    @classmethod
+    def build(cls, df, dimensions, measures=()):
+        cube = cls(dimensions, measures)
+        cube.add(df)
+        return cube
+
+    def add(self, df):
+        """Aggregate more rows into the cube."""
+        cells = np.ravel_multi_index([d.codes(df) for d in self.dimensions], self.shape)
+        size = self.counts.size
+        self.counts += np.bincount(cells, minlength=size).reshape(self.shape)
+        for measure, sums in self.sums.items():
+            sums += np.bincount(cells, weights=df[measure].to_numpy(dtype=np.float64),
+                                minlength=size).reshape(self.shape)
+        return self
+
+    def _axis(self, name):
+        for axis, dimension in enumerate(self.dimensions):
+            if dimension.name == name:
+                return axis
+        raise KeyError(f"No dimension {name!r}")
+
+    def aggregate(self, by=(), filters=None, measure=None):
+        """Counts (or sums of ``measure``) over the cells matching ``filters``, grouped ``by``.
+
+        ``filters`` maps dimension names to a label or a list of labels; the
+        result has one axis per name in ``by``, in that order.
+        """
+        values = self.counts if measure is None else self.sums[measure]
+        for name, labels in (filters or {}).items():
+            dimension = self.dimensions[self._axis(name)]
+            if not isinstance(labels, (list, tuple, set)):
+                labels = [labels]
+            values = np.take(values, [dimension.code(label) for label in labels], axis=self._axis(name))
+        by_axes = [self._axis(name) for name in by]
+        summed = tuple(axis for axis in range(len(self.shape)) if axis not in by_axes)
+        values = values.sum(axis=summed)
+        # Remaining axes are in cube order; put them in the requested order
+        kept = sorted(by_axes)
+        return np.transpose(values, [kept.index(axis) for axis in by_axes])
+
+    def frame(self, by, filters=None):
+        """``aggregate`` for the counts and every measure, as a long DataFrame."""
+        index = pd.MultiIndex.from_product([self.dimensions[self._axis(name)].labels for name in by],
+                                           names=list(by))
+        data = {"count": self.aggregate(by, filters).ravel()}
+        for measure in self.sums:
+            data[measure] = self.aggregate(by, filters, measure).ravel()
+        return pd.DataFrame(data, index=index)
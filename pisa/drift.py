@@ -0,0 +1,175 @@
+"""Streaming drift monitor against the holdout reference distribution.
+
+Every model feature is quantized like CatBoost quantizes its inputs: at most
+``MAX_BORDERS`` (32) borders, placed at the reference quantiles (midway
+between distinct values for discrete features), plus a bin for missing
+values. The reference holds the holdout's bin counts per feature and the
+decile borders of its predicted probabilities.
+
+A ``DriftMonitor`` consumes incoming batches and only adds their bin counts,
+so memory is constant however many rows stream through. At any point it
+reports, per feature, the population stability index (PSI) and the
+Kolmogorov-Smirnov distance between the binned distributions (exact at the
+borders), plus the same for the predictions.
+"""
+import numpy as np
+import pandas as pd
+
+from pisa import TARGET, store
+from pisa.cache import cached_proba, default_cache, digest, model_digest
+from pisa.model import feature_names
+
+# Bump when the reference layout changes
+DRIFT_VERSION = 1
+
+MAX_BORDERS = 32
+PREDICTION_BINS = 10
+
+# Proportions are floored at this before taking logs in the PSI
+EPSILON = 1e-4
+
+# Conventional PSI reading: below 0.1 stable, 0.1-0.25 moderate, above 0.25 major shift
+PSI_MODERATE, PSI_MAJOR = 0.1, 0.25
+
+
+def quantile_borders(values, max_borders=MAX_BORDERS):
+    """Up to ``max_borders`` borders splitting ``values`` into near-equal-frequency bins."""
+    values = np.asarray(values, dtype=np.float64)
+    values = values[~np.isnan(values)]
+    distinct = np.unique(values)
+    if len(distinct) <= max_borders + 1:
+        return 0.5 * (distinct[:-1] + distinct[1:])
+    quantiles = np.quantile(values, np.arange(1, max_borders + 1) / (max_borders + 1))
+    return np.unique(quantiles)
+
+
+class _Binner:
+    """Bins every column of a matrix at once into one flat count vector."""
+
+    def __init__(self, borders):
+        self.borders = [np.asarray(b, dtype=np.float64) for b in borders]
+        # Per column: one bin per border gap, one past the last border, one for NaN
+        sizes = np.array([len(b) + 2 for b in self.borders])
+        self.offsets = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+        self.sizes = sizes
+        self.total = int(sizes.sum())
+
+    def counts(self, X):
+        X = np.asarray(X, dtype=np.float64)
+        codes = np.empty(X.shape, dtype=np.int64)
+        for j, borders in enumerate(self.borders):
+            column = X[:, j]
+            codes[:, j] = np.where(np.isnan(column), len(borders) + 1,
+                                   np.searchsorted(borders, column, side="right"))
+        return np.bincount((codes + self.offsets).ravel(), minlength=self.total)
+
+    def split(self, flat):
+        return [flat[o:o + s] for o, s in zip(self.offsets, self.sizes)]
+
+
+def _psi(expected, actual):
+    if not expected.sum() or not actual.sum():
+        return np.nan
+    e = np.maximum(expected / expected.sum(), EPSILON)
+    a = np.maximum(actual / actual.sum(), EPSILON)
+    return float(np.sum((a - e) * np.log(a / e)))
+
+
+def _ks(expected, actual):
+    if not expected.sum() or not actual.sum():
+        return np.nan
+    return float(np.abs(np.cumsum(expected) / expected.sum() - np.cumsum(actual) / actual.sum()).max())
+
+
+class DriftReference:
+    """Quantization borders and bin counts of the reference data."""
+
+    def __init__(self, features, borders, counts, prediction_borders, prediction_counts, rows):
+        self.features = list(features)
+        self.borders = borders
+        self.counts = counts
+        self.prediction_borders = prediction_borders
+        self.prediction_counts = prediction_counts
+        self.rows = rows
+
+    @classmethod
+    def build(cls, X, proba, features=None):
+        features = list(features if features is not None else X.columns)
+        X = np.asarray(X[features] if hasattr(X, "columns") else X, dtype=np.float64)
+        borders = [quantile_borders(X[:, j]) for j in range(X.shape[1])]
+        prediction_borders = np.unique(np.quantile(proba, np.arange(1, PREDICTION_BINS) / PREDICTION_BINS))
+        counts = _Binner(borders).counts(X)
+        prediction_counts = _Binner([prediction_borders]).counts(np.asarray(proba)[:, None])
+        return cls(features, borders, counts, prediction_borders, prediction_counts, len(X))
+
+
+def load_reference(model):
+    """Drift reference of ``model`` on the current holdout, built once per version of either."""
+    key = digest("drift-reference", DRIFT_VERSION, model_digest(model), store.source_key())
+
+    def build():
+        holdout = store.load_columns()
+        proba = cached_proba(model, holdout.drop(columns=TARGET))
+        return DriftReference.build(holdout, proba, feature_names(model))
+
+    return default_cache().get_or_compute(key, build)
+
+
+class DriftMonitor:
+    """Accumulates bin counts of incoming batches and compares them with the reference."""
+
+    def __init__(self, reference):
+        self.reference = reference
+        self._features = _Binner(reference.borders)
+        self._predictions = _Binner([reference.prediction_borders])
+        self.counts = np.zeros(self._features.total, dtype=np.int64)
+        self.prediction_counts = np.zeros(self._predictions.total, dtype=np.int64)
+        self.rows = 0
+
+    def update(self, X, proba=None):
+        """Add a batch: a frame with the reference features, or a matrix in their order."""
+        if hasattr(X, "columns"):
+            X = X[self.reference.features]
+        X = np.asarray(X, dtype=np.float64)
+        self.counts += self._features.counts(X)
+        if proba is not None:
+            self.prediction_counts += self._predictions.counts(np.asarray(proba)[:, None])
+        self.rows += len(X)
+        return self
+
+    def consume(self, batches, model=None):
+        """Update from an iterable of frames (e.g. ``pd.read_csv(..., chunksize=...)``).
+
+        With ``model``, each batch is scored too, for prediction drift.
+        """
+        for batch in batches:
+            X = batch[self.reference.features]
+            self.update(X, np.asarray(model.predict_proba(X))[:, 1] if model is not None else None)
+        return self
+
+    def feature_report(self):
+        """PSI and KS per feature, most drifted first."""
+        reference = self._features.split(self.reference.counts)
+        current = self._features.split(self.counts)
+        report = pd.DataFrame({
+            "psi": [_psi(e, a) for e, a in zip(reference, current)],
+            "ks": [_ks(e, a) for e, a in zip(reference, current)],
+            "missing": [a[-1] / max(self.rows, 1) for a in current],
+        }, index=pd.Index(self.reference.features, name="feature"))
+        report["status"] = pd.cut(report["psi"], [-np.inf, PSI_MODERATE, PSI_MAJOR, np.inf],
+                                  labels=["stable", "moderate", "major"], right=False)
+        return report.sort_values("psi", ascending=False)
+
+    def prediction_drift(self):
+        """PSI and KS of the predicted probabilities, or None if no batch was scored."""
+        if not self.prediction_counts.sum():
+            return None
+        return {"psi": _psi(self.reference.prediction_counts, self.prediction_counts),
+                "ks": _ks(self.reference.prediction_counts, self.prediction_counts),
+                "rows": int(self.prediction_counts.sum())}
+
+    def histograms(self, feature):
+        """``(borders, reference counts, current counts)`` of one feature's bins."""
+        j = self.reference.features.index(feature)
+        return (self.reference.borders[j], self._features.split(self.reference.counts)[j],
+                self._features.split(self.counts)[j])
@@ -0,0 +1,102 @@
+"""Loading and scoring helpers for the grade repetition model."""
+import hashlib
+import logging
+import pickle
+import warnings
+
+import numpy as np
+
+from pisa import ARTIFACT_PATH, MODEL_PATH, TARGET
+
+logger = logging.getLogger(__name__)
+
+
+def load_pipeline(path=MODEL_PATH):
+    """Unpickle the fitted MinMaxScaler -> NearMiss -> CatBoost pipeline."""
+    with warnings.catch_warnings():
+        # The pickle was written by an older scikit-learn
+        warnings.filterwarnings("ignore", message="Trying to unpickle estimator")
+        with open(path, "rb") as f:
+            blob = f.read()
+        model = pickle.loads(blob)
+    # Identifies the model in content-addressed caches (see pisa.cache)
+    model.checksum = hashlib.sha256(blob).hexdigest()
+    return model
+
+
+def artifact_is_current(artifact_path=ARTIFACT_PATH, model_path=MODEL_PATH):
+    """Whether the artifact was exported from the pickle currently at ``model_path``.
+
+    Compares the ``source_sha256`` recorded in the artifact's manifest; an
+    artifact without one cannot be vouched for and counts as stale.
+    """
+    from pisa.artifact import Artifact, file_sha256
+
+    source = Artifact(artifact_path, verify=False).manifest.get("source_sha256")
+    return source is not None and source == file_sha256(model_path)
+
+
+def _current_artifact():
+    """Path of the default artifact, re-exported first if the pickle has changed since.
+
+    Returns None (load the pickle) when there is no artifact or re-exporting fails.
+    """
+    if not ARTIFACT_PATH.exists():
+        return None
+    if not MODEL_PATH.exists() or artifact_is_current(ARTIFACT_PATH, MODEL_PATH):
+        return ARTIFACT_PATH
+    logger.warning("%s was not exported from the current %s; re-exporting it",
+                   ARTIFACT_PATH.name, MODEL_PATH.name)
+    from pisa.artifact import export_artifact
+
+    try:
+        export_artifact(load_pipeline(MODEL_PATH), ARTIFACT_PATH, source_path=MODEL_PATH)
+    except OSError:
+        logger.warning("Re-exporting %s failed; loading the pickle instead", ARTIFACT_PATH.name,
+                       exc_info=True)
+        return None
+    return ARTIFACT_PATH
+
+
+def load_model(path=None, backend="numpy"):
+    """Load the model for inference.
+
+    Defaults to the memory-mapped artifact when it has been exported and falls
+    back to unpickling the full pipeline otherwise. The default artifact is
+    only used while it matches the pickle: after the pickle is replaced it is
+    re-exported (with a warning), or the pickle is loaded if that fails. An
+    explicit ``path`` is loaded as a pickle if it ends in ``.pkl`` and as an
+    artifact otherwise.
+
+    ``backend`` picks the artifact's scorer (see ``pisa.artifact.load_artifact``):
+    the NumPy evaluator loads fastest and wins on small batches, while bulk
+    scoring should pass ``"catboost"``. A pickle always scores with CatBoost.
+    """
+    if path is None:
+        path = _current_artifact() or MODEL_PATH
+    if str(path).endswith(".pkl"):
+        return load_pipeline(path)
+    from pisa.artifact import load_artifact
+
+    return load_artifact(path, backend=backend)
+
+
+def feature_names(model):
+    """Return the input columns the model was fitted on, in order."""
+    return list(model.feature_names_in_)
+
+
+def select_features(model, df):
+    """Return the model's feature columns from ``df``, dropping the target."""
+    columns = feature_names(model)
+    missing = [c for c in columns if c not in df.columns]
+    if missing:
+        raise KeyError(f"Input is missing {len(missing)} model features: {missing[:5]}")
+    return df[columns]
+
+
+def score_frame(model, df, threshold=0.5):
+    """Score a frame and return ``(probabilities, labels)`` for the positive class."""
+    X = select_features(model, df.drop(columns=[TARGET], errors="ignore"))
+    proba = np.asarray(model.predict_proba(X))[:, 1]
+    return proba, (proba >= threshold).astype(np.int8)
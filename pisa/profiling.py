@@ -0,0 +1,199 @@
+"""Opt-in rerun profiler.
+
+Enable it with ``PISA_PROFILE=1`` in the server's environment, or per session
+with ``?profile=1`` in the URL. Each rerun then records timing spans around the
+page sections and cached loaders: wall time, thread CPU time and, for cached
+loaders, whether the call hit the cache. The last reruns are shown in a
+sidebar diagnostics panel and can be downloaded as a Chrome trace (load it in
+chrome://tracing or https://ui.perfetto.dev).
+
+Peak traced memory is only recorded with ``PISA_PROFILE=1``: tracemalloc is
+process-wide, slows every allocation of every session 2-4x while it runs, and
+has a single peak counter. A ``?profile=1`` session therefore never starts
+it. Peaks are only meaningful while a single profiled session is rerunning,
+since concurrent reruns reset each other's counter.
+
+When profiling is off, ``span`` is a no-op context manager.
+"""
+import contextvars
+import functools
+import json
+import os
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+# Reruns kept per session for the trace export
+MAX_RUNS = 20
+
+_recorder = contextvars.ContextVar("pisa_profiler", default=None)
+
+
+class Span:
+    __slots__ = ("name", "kind", "depth", "start", "wall", "cpu", "peak", "base", "cache")
+
+    def __init__(self, name, kind, depth):
+        self.name, self.kind, self.depth = name, kind, depth
+        self.start = time.time()
+        self.wall = self.cpu = 0.0
+        self.peak = self.base = 0
+        self.cache = None
+
+
+class Recorder:
+    """Spans of the recent reruns of one session."""
+
+    def __init__(self):
+        self.runs = []
+        self._stack = []
+        self.memory = False
+
+    def begin_run(self, memory=False):
+        self.runs.append([])
+        del self.runs[:-MAX_RUNS]
+        self._stack.clear()
+        self.memory = memory and tracemalloc.is_tracing()
+
+    @contextmanager
+    def span(self, name, kind="section"):
+        memory = self.memory
+        if memory:
+            if self._stack:
+                # Fold the parent's peak so far in before the child resets the counter
+                parent = self._stack[-1]
+                parent.peak = max(parent.peak, tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+        span = Span(name, kind, len(self._stack))
+        if kind == "loader":
+            span.cache = "hit"  # until the loader's body runs, see mark_miss
+        if memory:
+            span.base = tracemalloc.get_traced_memory()[0]
+        self._stack.append(span)
+        wall, cpu = time.perf_counter(), time.thread_time()
+        try:
+            yield span
+        finally:
+            span.wall = time.perf_counter() - wall
+            span.cpu = time.thread_time() - cpu
+            if memory:
+                span.peak = max(span.peak, tracemalloc.get_traced_memory()[1])
+            self._stack.pop()
+            if memory and self._stack:
+                self._stack[-1].peak = max(self._stack[-1].peak, span.peak)
+            if self.runs:
+                self.runs[-1].append(span)
+
+    def mark_miss(self):
+        for span in reversed(self._stack):
+            if span.kind == "loader":
+                span.cache = "miss"
+                return
+
+    def chrome_trace(self):
+        """All recorded reruns as Chrome trace-event JSON, one thread row per rerun."""
+        events = []
+        for run, spans in enumerate(self.runs):
+            for span in spans:
+                args = {"cpu_ms": round(span.cpu * 1000, 3)}
+                if self.memory:
+                    args["peak_kb"] = round((span.peak - span.base) / 1024, 1)
+                if span.cache:
+                    args["cache"] = span.cache
+                events.append({"name": span.name, "cat": span.kind, "ph": "X", "pid": 1, "tid": run,
+                               "ts": span.start * 1e6, "dur": span.wall * 1e6, "args": args})
+        return json.dumps({"traceEvents": events, "displayTimeUnit": "ms"})
+
+
+def process_enabled():
+    """Whether ``PISA_PROFILE`` turns profiling (and memory tracing) on for the whole process."""
+    return os.environ.get("PISA_PROFILE", "") not in ("", "0")
+
+
+def enabled():
+    if process_enabled():
+        return True
+    import streamlit as st
+
+    return st.query_params.get("profile", "0") not in ("", "0")
+
+
+def begin_run():
+    """Start recording this rerun if profiling is enabled; return the recorder or None."""
+    import streamlit as st
+
+    if not enabled():
+        _recorder.set(None)
+        return None
+    # Memory tracing is process-wide, so only the process-level switch starts it
+    memory = process_enabled()
+    if memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    recorder = st.session_state.setdefault("_pisa_profiler", Recorder())
+    recorder.begin_run(memory)
+    _recorder.set(recorder)
+    return recorder
+
+
+@contextmanager
+def span(name, kind="section"):
+    """Time a block of the current rerun; does nothing when profiling is off."""
+    recorder = _recorder.get()
+    if recorder is None:
+        yield None
+        return
+    with recorder.span(name, kind) as current:
+        yield current
+
+
+def mark_miss():
+    """Record that the innermost ``kind="loader"`` span had to compute its value."""
+    recorder = _recorder.get()
+    if recorder is not None:
+        recorder.mark_miss()
+
+
+def loader(cache, name=None):
+    """Wrap a Streamlit-cached loader in a span that records cache hits and misses.
+
+    Use instead of the cache decorator itself::
+
+        @profiling.loader(st.cache_data)
+        def load_holdout(): ...
+    """
+    def decorate(func):
+        @functools.wraps(func)
+        def compute(*args, **kwargs):
+            mark_miss()
+            return func(*args, **kwargs)
+
+        cached = cache(compute)
+
+        @functools.wraps(func)
+        def call(*args, **kwargs):
+            with span(name or func.__name__, kind="loader"):
+                return cached(*args, **kwargs)
+
+        call.clear = getattr(cached, "clear", None)
+        return call
+    return decorate
+
+
+def sidebar_panel():
+    """Collapsible diagnostics panel for the last rerun, with the trace download."""
+    import streamlit as st
+
+    recorder = _recorder.get()
+    if recorder is None or not recorder.runs:
+        return
+    with st.sidebar.expander("🩺 Diagnostics"):
+        rows = [{
+            "span": "  " * span.depth + span.name,
+            "wall ms": round(span.wall * 1000, 1),
+            "cpu ms": round(span.cpu * 1000, 1),
+            # Only traced with PISA_PROFILE=1, see the module docstring
+            "peak KB": round((span.peak - span.base) / 1024, 1) if recorder.memory else None,
+            "cache": span.cache or "",
+        } for span in sorted(recorder.runs[-1], key=lambda s: s.start)]
+        st.dataframe(rows, hide_index=True)
+        st.download_button("Download Chrome trace", recorder.chrome_trace(),
+                           file_name="pisa-trace.json", mime="application/json")
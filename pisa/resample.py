@@ -0,0 +1,140 @@
+"""NearMiss undersampling with a blocked neighbor kernel and cached selections.
+
+``CachedNearMiss`` is a drop-in replacement for imblearn's ``NearMiss`` in a
+training pipeline. For version 1 (the one the final model uses) it finds each
+majority row's nearest minority rows with ``nearest_distances``: distances
+come from matrix products over blocks of query and reference rows, and only
+a running top-k per query row is kept, so memory stays ``O(block x block)``
+instead of ``O(rows x rows)`` and query blocks run on a thread pool (NumPy
+releases the GIL in the products and partitions).
+
+The selected row indices are cached on disk, keyed on the data and the
+sampling parameters, so refitting the downstream classifier on the same data
+(a CatBoost hyperparameter sweep, say) skips the neighbor search entirely.
+Other versions and sparse inputs fall back to imblearn.
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from imblearn.under_sampling import NearMiss
+from scipy import sparse
+
+from pisa.cache import default_cache, digest, frame_digest
+
+# Bump when the selection procedure changes, to invalidate cached selections
+RESAMPLE_VERSION = 1
+
+QUERY_BLOCK = 1024
+REFERENCE_BLOCK = 2048
+
+
+def _block_neighbors(queries, reference, reference_norms, k):
+    """Exact ``k`` nearest reference rows of ``queries``, sorted by distance."""
+    n = len(queries)
+    best = best_index = None
+    rows = np.arange(n)[:, None]
+    for start in range(0, len(reference), REFERENCE_BLOCK):
+        block = reference[start:start + REFERENCE_BLOCK]
+        # |q|^2 is the same for every candidate of a row, so it is left out of the ranking
+        squared = queries @ block.T
+        squared *= -2
+        squared += reference_norms[None, start:start + len(block)]
+        if start == 0:
+            best_index = np.argpartition(squared, k - 1, axis=1)[:, :k]
+            best = squared[rows, best_index]
+            continue
+        # Only entries beating a row's current k-th best can enter its top k;
+        # after the first block that is a small fraction, so merge just those
+        hit_rows, hit_cols = np.nonzero(squared < best.max(axis=1)[:, None])
+        if not len(hit_rows):
+            continue
+        all_rows = np.concatenate([np.repeat(np.arange(n), k), hit_rows])
+        all_values = np.concatenate([best.ravel(), squared[hit_rows, hit_cols]])
+        all_index = np.concatenate([best_index.ravel(), hit_cols + start])
+        order = np.lexsort((all_values, all_rows))
+        row_starts = np.concatenate([[0], np.cumsum(np.bincount(all_rows, minlength=n))[:-1]])
+        rank = np.arange(len(order)) - row_starts[all_rows[order]]
+        keep = order[rank < k]
+        best, best_index = all_values[keep].reshape(n, k), all_index[keep].reshape(n, k)
+
+    # The expanded form loses precision; recompute the kept distances directly
+    distances = np.sqrt(((queries[:, None, :] - reference[best_index]) ** 2).sum(axis=2))
+    order = np.argsort(distances, axis=1, kind="stable")
+    return distances[rows, order], best_index[rows, order]
+
+
+def nearest_distances(queries, reference, k, n_threads=1):
+    """Distances and indices of the ``k`` nearest ``reference`` rows of every query row.
+
+    Memory is bounded by the block sizes regardless of the number of rows.
+    """
+    queries = np.ascontiguousarray(queries, dtype=np.float64)
+    reference = np.ascontiguousarray(reference, dtype=np.float64)
+    k = min(k, len(reference), REFERENCE_BLOCK)
+    reference_norms = np.einsum("ij,ij->i", reference, reference)
+    starts = range(0, len(queries), QUERY_BLOCK)
+
+    def run(start):
+        return _block_neighbors(queries[start:start + QUERY_BLOCK], reference, reference_norms, k)
+
+    if n_threads <= 1 or len(starts) <= 1:
+        blocks = [run(start) for start in starts]
+    else:
+        with ThreadPoolExecutor(n_threads) as pool:
+            blocks = list(pool.map(run, starts))
+    if not blocks:
+        return np.empty((0, k)), np.empty((0, k), dtype=np.int64)
+    return (np.concatenate([d for d, _ in blocks]), np.concatenate([i for _, i in blocks]))
+
+
+class CachedNearMiss(NearMiss):
+    """``NearMiss`` whose version-1 selection is computed by ``nearest_distances`` and cached.
+
+    ``n_jobs`` sets the kernel's thread count (``None``: 1, ``-1``: all cores);
+    ``cache=False`` disables the disk cache.
+    """
+
+    def __init__(self, *, sampling_strategy="auto", version=1, n_neighbors=3, n_neighbors_ver3=3,
+                 n_jobs=None, cache=True):
+        super().__init__(sampling_strategy=sampling_strategy, version=version,
+                         n_neighbors=n_neighbors, n_neighbors_ver3=n_neighbors_ver3, n_jobs=n_jobs)
+        self.cache = cache
+
+    def _threads(self):
+        if self.n_jobs is None:
+            return 1
+        return (os.cpu_count() or 1) if self.n_jobs < 0 else self.n_jobs
+
+    def _fit_resample(self, X, y):
+        if self.version != 1 or not isinstance(self.n_neighbors, int) or sparse.issparse(X):
+            return super()._fit_resample(X, y)
+
+        key = digest("nearmiss", RESAMPLE_VERSION, self.n_neighbors,
+                     sorted(self.sampling_strategy_.items()), frame_digest(np.asarray(X)),
+                     frame_digest(np.asarray(y)))
+        if self.cache:
+            self.sample_indices_ = default_cache().get_or_compute(key, lambda: self._select(X, y))
+        else:
+            self.sample_indices_ = self._select(X, y)
+        return X[self.sample_indices_], y[self.sample_indices_]
+
+    def _select(self, X, y):
+        """Row indices kept by NearMiss-1, in imblearn's order."""
+        X = np.asarray(X, dtype=np.float64)
+        y = np.asarray(y)
+        classes, counts = np.unique(y, return_counts=True)
+        minority = X[y == classes[np.argmin(counts)]]
+
+        selected = []
+        for target_class in classes:
+            class_indices = np.flatnonzero(y == target_class)
+            if target_class not in self.sampling_strategy_:
+                selected.append(class_indices)
+                continue
+            distances, _ = nearest_distances(X[class_indices], minority, self.n_neighbors,
+                                             self._threads())
+            # Smallest mean distance to the nearest minority rows first, ties by position
+            order = np.argsort(distances.sum(axis=1), kind="stable")
+            selected.append(class_indices[order[:self.sampling_strategy_[target_class]]])
+        return np.concatenate(selected)
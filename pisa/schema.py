@@ -0,0 +1,129 @@
+"""Declared column types and code labels of the holdout set.
+
+Most columns are 0/1 one-hot flags (REGION_*, IMMIG_*, home_*) or small
+Likert/count codes and fit in ``uint8``; LANGN holds language codes up to 999.
+The PISA scale indices (ICTRES, BELONG, ...) and PVACAD stay ``float64``:
+their 4-7 decimal values are not exactly representable in float32.
+
+``pisa.store`` checks every conversion is lossless when it builds the
+columnar store, so a new file that no longer fits fails loudly instead of
+being truncated.
+
+The label maps below name the codes of the categorical columns for display.
+"""
+HOLDOUT_SCHEMA = {
+    "MISSSC": "uint8",
+    "SKIPPING": "uint8",
+    "WORKPAY": "uint8",
+    "FISCED": "uint8",
+    "home_vgame": "uint8",
+    "MISCED": "uint8",
+    "IMMIG_second_generation_students": "uint8",
+    "gender": "uint8",
+    "class_math": "uint8",
+    "INFOSEEK": "float64",
+    "math_tutor": "uint8",
+    "home_room": "uint8",
+    "technical_book": "uint8",
+    "digi_hrs_leisure_school": "uint8",
+    "digi_hrs_leisure_b_a_school": "uint8",
+    "math_lgroup": "uint8",
+    "home_aircon": "uint8",
+    "TARDYSD": "uint8",
+    "math_not": "uint8",
+    "home_car": "uint8",
+    "classic_book": "uint8",
+    "art_book": "uint8",
+    "GROSAGR": "float64",
+    "home_toilet": "uint8",
+    "class_subj": "uint8",
+    "math_internet": "uint8",
+    "easy_math": "uint8",
+    "math_sgroup": "uint8",
+    "digi_hrs_learn_weekends": "uint8",
+    "REGION_REGION 9": "uint8",
+    "digi_hrs_leisure_weekends": "uint8",
+    "REGION_REGION 12": "uint8",
+    "LANGN": "uint16",
+    "REGION_REGION 10": "uint8",
+    "hw_sci": "uint8",
+    "home_music": "uint8",
+    "math_video": "uint8",
+    "hw_eng": "uint8",
+    "REGION_CARAGA": "uint8",
+    "EXERPRAC": "uint8",
+    "scie_book": "uint8",
+    "REGION_REGION 4B": "uint8",
+    "home_books": "uint8",
+    "REGION_REGION 2": "uint8",
+    "REGION_REGION 11": "uint8",
+    "home_art": "uint8",
+    "help_sch_book": "uint8",
+    "dict_book": "uint8",
+    "MATHEF21": "float64",
+    "home_smartTV": "uint8",
+    "home_motor": "uint8",
+    "AGE": "float64",
+    "MATHEFF": "float64",
+    "home_bath": "uint8",
+    "digi_hrs_learn_b_a_school": "uint8",
+    "easy_sci": "uint8",
+    "siblings": "uint8",
+    "age_primary": "uint8",
+    "digi_hrs_learn_school": "uint8",
+    "hw_math": "uint8",
+    "fav_math": "uint8",
+    "life_sat": "uint8",
+    "easy_eng": "uint8",
+    "ICTRES": "float64",
+    "hw_all": "uint8",
+    "EFFORT2": "uint8",
+    "WORKHOME": "uint8",
+    "fav_sci": "uint8",
+    "home_lang": "uint8",
+    "home_transpo": "uint8",
+    "EFFORT1": "uint8",
+    "age_eccd": "uint8",
+    "fav_eng": "uint8",
+    "qual_math": "uint8",
+    "STUDYHMW": "uint8",
+    "FEELSAFE": "float64",
+    "Family_SES_Current": "uint8",
+    "TEACHSUP": "float64",
+    "FAMSUP": "float64",
+    "schl_yrs": "uint8",
+    "IMMIG_native_students": "uint8",
+    "MATHPERS": "float64",
+    "brkfst_days": "uint8",
+    "SCHRISK": "float64",
+    "BELONG": "float64",
+    "CURIOAGR": "float64",
+    "dinner_days": "uint8",
+    "Expected_SES_Age30": "uint8",
+    "BULLIED": "float64",
+    "perf_acad": "float64",
+    "nofood_freq": "uint8",
+    "PVACAD": "float64",
+    "REPEAT": "uint8",
+}
+
+# One-hot region flags; students in none of them are from the remaining regions
+REGION_COLUMNS = {
+    "REGION_REGION 2": "Region 2",
+    "REGION_REGION 4B": "Region 4B",
+    "REGION_REGION 9": "Region 9",
+    "REGION_REGION 10": "Region 10",
+    "REGION_REGION 11": "Region 11",
+    "REGION_REGION 12": "Region 12",
+    "REGION_CARAGA": "CARAGA",
+}
+OTHER_REGIONS = "Other regions"
+
+# PISA ST004D01T recoded to a flag: 1 = male, as the original prediction form encoded it
+GENDER_LABELS = {0: "Female", 1: "Male"}
+
+# ISCED levels of MISCED/FISCED (code 4 does not occur in the data)
+ISCED_LABELS = {
+    1: "Preschool", 2: "Elementary", 3: "Junior High", 5: "Senior High", 6: "TVET NonT",
+    7: "Associate", 8: "Bachelor", 9: "Master", 10: "Doctoral",
+}
@@ -0,0 +1,114 @@
+"""Per-segment model performance from a precomputed cube.
+
+The holdout is scored once per model and data version and aggregated into a
+``pisa.cube.Cube`` over region, gender, immigrant background, SES quartile,
+REPEAT and a 5-point probability band, with the probabilities summed per
+cell. Any combination of segment filters, and any operating threshold on the
+band edges, is then answered by summing cells: repetition rate, mean
+predicted risk and the confusion counts behind precision and recall.
+"""
+import numpy as np
+import pandas as pd
+
+from pisa import TARGET, store
+from pisa.cache import cached_proba, default_cache, digest, model_digest
+from pisa.cube import Cube, Dimension
+from pisa.schema import GENDER_LABELS, OTHER_REGIONS, REGION_COLUMNS
+
+# Bump when the cube layout or its labels change
+SEGMENTS_VERSION = 2
+
+# Probability bands of width 1 / PROBA_BANDS; thresholds snap to band edges
+PROBA_BANDS = 20
+
+IMMIG_COLUMNS = {
+    "IMMIG_native_students": "Native",
+    "IMMIG_second_generation_students": "Second generation",
+}
+FIRST_GENERATION = "First generation"
+
+SES_COLUMN = "Family_SES_Current"
+SES_LABELS = ["Bottom quartile", "Second quartile", "Third quartile", "Top quartile"]
+
+# Filterable dimensions, by display name
+SEGMENTS = {"Region": "region", "Gender": "gender", "Immigrant background": "immig", "SES": "ses"}
+
+
+def segment_dimensions(df):
+    """Dimensions of the segment cube.
+
+    SES quartiles are the half-open bands between the quartiles of
+    Family_SES_Current in ``df`` (the scale is discrete, so they are uneven).
+    """
+    ses_edges = np.quantile(df[SES_COLUMN], [0, 0.25, 0.5, 0.75, 1])
+    return [
+        Dimension.one_hot("region", REGION_COLUMNS, REGION_COLUMNS.values(), OTHER_REGIONS),
+        Dimension.categorical("gender", list(GENDER_LABELS), GENDER_LABELS),
+        Dimension.one_hot("immig", IMMIG_COLUMNS, IMMIG_COLUMNS.values(), FIRST_GENERATION),
+        Dimension.binned(SES_COLUMN, ses_edges, name="ses", labels=SES_LABELS),
+        Dimension.categorical(TARGET, [0, 1]),
+        Dimension.binned("proba", np.linspace(0, 1, PROBA_BANDS + 1), name="band"),
+    ]
+
+
+def build_segment_cube(df, proba):
+    """Aggregate ``df`` scored with ``proba`` into the segment cube."""
+    df = df.assign(proba=np.asarray(proba, dtype=np.float64))
+    return Cube.build(df, segment_dimensions(df), measures=("proba",))
+
+
+def load_segment_cube(model):
+    """The segment cube of ``model`` on the current holdout, built once per version of either."""
+    key = digest("segment-cube", SEGMENTS_VERSION, model_digest(model), store.source_key())
+
+    def build():
+        holdout = store.load_columns()
+        return build_segment_cube(holdout, cached_proba(model, holdout.drop(columns=TARGET)))
+
+    return default_cache().get_or_compute(key, build)
+
+
+def _band(threshold):
+    """First probability band counted as flagged at ``threshold``."""
+    return int(np.clip(np.ceil(threshold * PROBA_BANDS - 1e-9), 0, PROBA_BANDS))
+
+
+def _summarize(counts, proba_sums, threshold):
+    """Metrics from ``(..., REPEAT, band)`` count and probability arrays."""
+    band = _band(threshold)
+    students = counts.sum(axis=(-2, -1))
+    repeaters = counts[..., 1, :].sum(axis=-1)
+    flagged = counts[..., band:].sum(axis=-1)
+    tp, fp = flagged[..., 1], flagged[..., 0]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return {
+            "students": students,
+            "repetition_rate": repeaters / students,
+            "mean_risk": proba_sums.sum(axis=(-2, -1)) / students,
+            "flagged": tp + fp,
+            "precision": tp / (tp + fp),
+            "recall": tp / repeaters,
+        }
+
+
+def segment_metrics(cube, filters=None, threshold=0.5):
+    """Metrics of the students matching ``filters`` (dimension -> label or labels)."""
+    counts = cube.aggregate((TARGET, "band"), filters)
+    proba_sums = cube.aggregate((TARGET, "band"), filters, measure="proba")
+    return {name: float(value) for name, value in _summarize(counts, proba_sums, threshold).items()}
+
+
+def segment_table(cube, by, filters=None, threshold=0.5):
+    """The same metrics for every label of dimension ``by``, one row each.
+
+    A filter on ``by`` itself limits the rows to the chosen labels.
+    """
+    filters = dict(filters or {})
+    chosen = filters.pop(by, None)
+    counts = cube.aggregate((by, TARGET, "band"), filters)
+    proba_sums = cube.aggregate((by, TARGET, "band"), filters, measure="proba")
+    labels = next(d.labels for d in cube.dimensions if d.name == by)
+    table = pd.DataFrame(_summarize(counts, proba_sums, threshold), index=pd.Index(labels, name=by))
+    if chosen is not None:
+        table = table.loc[chosen if isinstance(chosen, (list, tuple)) else [chosen]]
+    return table[table["students"] > 0]
@@ -0,0 +1,250 @@
+"""Asyncio HTTP scoring service with request micro-batching.
+
+Concurrent requests are queued and coalesced into one model call of up to
+``max_batch`` rows, waiting at most ``max_wait_ms`` for a batch to fill, so
+per-call overhead is amortized under load while a lone request is answered
+almost immediately. The model runs in a worker thread so the event loop keeps
+accepting requests meanwhile.
+
+Endpoints:
+    POST /predict   JSON ({"rows": [{column: value, ...}, ...]}, a list of
+                    such objects, or one object) or CSV with a header row,
+                    keyed by the holdout column names
+    GET  /metrics   request latency and batch size histograms (JSON)
+    GET  /drift     feature and prediction drift of the scored rows against
+                    the holdout, when the server has a ``DriftMonitor``
+    GET  /health
+"""
+import asyncio
+import csv
+import io
+import json
+import time
+from bisect import bisect_left
+
+import numpy as np
+import pandas as pd
+
+from pisa.model import feature_names
+
+LATENCY_BUCKETS_MS = (0.5, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+BATCH_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024, 2048, 4096)
+
+
+class BadRequest(Exception):
+    """Raised for malformed request bodies; answered with HTTP 400."""
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the style of Prometheus."""
+
+    def __init__(self, buckets):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q):
+        """Upper bound of the bucket holding the ``q`` quantile."""
+        if not self.count:
+            return None
+        target, seen = q * self.count, 0
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            seen += count
+            if seen >= target:
+                return bound
+        return float("inf")
+
+    def snapshot(self):
+        return {
+            "buckets": {str(bound): count for bound, count in
+                        zip(self.buckets + ("+Inf",), np.cumsum(self.counts).tolist())},
+            "count": self.count,
+            "sum": self.sum,
+            "mean": self.sum / self.count if self.count else None,
+            "p50": self.quantile(0.5),
+            "p99": self.quantile(0.99),
+        }
+
+
+class MicroBatcher:
+    """Coalesce concurrent scoring requests into batched model calls."""
+
+    def __init__(self, predict, max_batch=256, max_wait_ms=2.0):
+        self.predict = predict
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self.batch_sizes = Histogram(BATCH_BUCKETS)
+        self._queue = asyncio.Queue()
+        self._task = None
+
+    def start(self):
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def submit(self, X):
+        """Score the rows of ``X`` as part of the next batch."""
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((X, future))
+        return await future
+
+    async def _next_batch(self):
+        loop = asyncio.get_running_loop()
+        batch = [await self._queue.get()]
+        rows = len(batch[0][0])
+        deadline = loop.time() + self.max_wait
+        while rows < self.max_batch:
+            timeout = deadline - loop.time()
+            try:
+                item = self._queue.get_nowait() if timeout <= 0 else \
+                    await asyncio.wait_for(self._queue.get(), timeout)
+            except (asyncio.QueueEmpty, asyncio.TimeoutError):
+                break
+            batch.append(item)
+            rows += len(item[0])
+        return batch, rows
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch, rows = await self._next_batch()
+            self.batch_sizes.observe(rows)
+            try:
+                X = np.vstack([X for X, _ in batch])
+                proba = await loop.run_in_executor(None, self.predict, X)
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            start = 0
+            for X, future in batch:
+                if not future.done():
+                    future.set_result(proba[start:start + len(X)])
+                start += len(X)
+
+
+def parse_rows(body, content_type, columns):
+    """Parse a JSON or CSV request body into a float matrix over ``columns``."""
+    try:
+        if "csv" in content_type:
+            records = list(csv.DictReader(io.StringIO(body.decode())))
+        else:
+            payload = json.loads(body)
+            records = payload.get("rows", [payload]) if isinstance(payload, dict) else payload
+        if not records:
+            raise BadRequest("No rows to score")
+        return np.array([[float(record[name]) for name in columns] for record in records])
+    except KeyError as e:
+        raise BadRequest(f"Missing column {e.args[0]!r}") from None
+    except (ValueError, TypeError, AttributeError) as e:
+        raise BadRequest(f"Malformed rows: {e}") from None
+
+
+class ScoringServer:
+    """HTTP/1.1 front end (with keep-alive) over a ``MicroBatcher``."""
+
+    def __init__(self, model, max_batch=256, max_wait_ms=2.0, threshold=0.5, drift=None):
+        self.columns = feature_names(model)
+        self.threshold = threshold
+        self.drift = drift
+        self.batcher = MicroBatcher(lambda X: np.asarray(model.predict_proba(X))[:, 1],
+                                    max_batch, max_wait_ms)
+        self.latency_ms = Histogram(LATENCY_BUCKETS_MS)
+        self.requests = 0
+        self.errors = 0
+
+    async def serve(self, host="127.0.0.1", port=8000):
+        self.batcher.start()
+        server = await asyncio.start_server(self._handle, host, port)
+        async with server:
+            await server.serve_forever()
+
+    async def _handle(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path, _ = request_line.decode("latin-1").split(" ", 2)
+                headers = {}
+                while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+                status, payload = await self._route(method, path.split("?")[0], headers, body)
+                data = json.dumps(payload).encode()
+                writer.write(f"HTTP/1.1 {status}\r\nContent-Type: application/json\r\n"
+                             f"Content-Length: {len(data)}\r\n\r\n".encode() + data)
+                await writer.drain()
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def _route(self, method, path, headers, body):
+        if method == "POST" and path == "/predict":
+            return await self._predict(headers, body)
+        if method == "GET" and path == "/metrics":
+            return "200 OK", self.metrics()
+        if method == "GET" and path == "/drift":
+            if self.drift is None:
+                return "404 Not Found", {"error": "Drift monitoring is off; start with --drift"}
+            return "200 OK", self.drift_report()
+        if method == "GET" and path == "/health":
+            return "200 OK", {"status": "ok"}
+        return "404 Not Found", {"error": f"No route for {method} {path}"}
+
+    async def _predict(self, headers, body):
+        start = time.perf_counter()
+        self.requests += 1
+        try:
+            X = parse_rows(body, headers.get("content-type", "application/json"), self.columns)
+            proba = await self.batcher.submit(X)
+        except BadRequest as e:
+            self.errors += 1
+            return "400 Bad Request", {"error": str(e)}
+        except Exception as e:
+            self.errors += 1
+            return "500 Internal Server Error", {"error": str(e)}
+        self.latency_ms.observe((time.perf_counter() - start) * 1000)
+        if self.drift is not None:
+            # Rows arrive in the model's feature order, so they are binned as is
+            self.drift.update(X, proba)
+        return "200 OK", {"probabilities": proba.tolist(),
+                          "labels": (proba >= self.threshold).astype(int).tolist()}
+
+    def metrics(self):
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "latency_ms": self.latency_ms.snapshot(),
+            "batch_size": self.batcher.batch_sizes.snapshot(),
+        }
+
+    def drift_report(self, top=10):
+        report = self.drift.feature_report().head(top)
+        return {
+            "rows": self.drift.rows,
+            "prediction": self.drift.prediction_drift(),
+            # NaN (no rows yet) is not valid JSON
+            "features": [{"feature": name,
+                          "psi": None if np.isnan(row.psi) else row.psi,
+                          "ks": None if np.isnan(row.ks) else row.ks,
+                          "status": None if pd.isna(row.status) else str(row.status)}
+                         for name, row in report.iterrows()],
+        }
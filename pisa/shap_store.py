@@ -0,0 +1,128 @@
+"""Precomputed TreeSHAP values for a scored dataset.
+
+SHAP values for the whole holdout are computed offline (``python -m
+scripts.compute_shap``) in parallel batches with CatBoost's exact TreeSHAP and
+stored per model as a float32 matrix plus the base value. Each stored row is
+keyed by a hash of its feature values, so refreshing the store only computes
+rows that are new or changed.
+
+Values are in log-odds units and are attributed to the raw (unscaled)
+features: the MinMaxScaler in front of the trees is monotone per feature, so
+it does not change the attribution.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from pisa import CACHE_DIR
+from pisa.cache import model_digest
+from pisa.model import feature_names, load_model
+
+SHAP_DIR = CACHE_DIR / "shap"
+
+# Model held by each worker process, loaded once by the pool initializer
+_MODEL = None
+
+
+def _init_worker(model_path):
+    global _MODEL
+    _MODEL = load_model(model_path, backend="catboost")
+
+
+def _native_parts(model):
+    """Return ``(scale, booster)`` for an artifact-native model or a pickled pipeline."""
+    if hasattr(model, "booster"):
+        return model._scaled, model.booster
+    scaler = model.steps[0][1]
+    return scaler.transform, model.steps[-1][1]
+
+
+def shap_batch(model, X):
+    """Return ``(values, base_value)`` for the rows of feature matrix ``X``."""
+    from catboost import Pool
+
+    scale, booster = _native_parts(model)
+    if hasattr(X, "columns"):
+        X = X[feature_names(model)]
+    raw = booster.get_feature_importance(Pool(scale(X)), type="ShapValues")
+    return raw[:, :-1].astype(np.float32), float(raw[0, -1])
+
+
+def _worker_batch(X):
+    return shap_batch(_MODEL, X)
+
+
+def row_keys(X):
+    """Stable per-row hashes of the feature values, independent of column dtypes."""
+    return pd.util.hash_pandas_object(X.astype(np.float64), index=False).to_numpy()
+
+
+def store_path(model):
+    return SHAP_DIR / f"{model_digest(model)[:16]}.npz"
+
+
+def load_store(model):
+    """Return the stored ``dict(values, base_value, keys, feature_names)`` or None."""
+    path = store_path(model)
+    if not path.exists():
+        return None
+    with np.load(path) as data:
+        return {name: data[name] for name in data.files}
+
+
+def _save_store(model, values, base_value, keys):
+    os.makedirs(SHAP_DIR, exist_ok=True)
+    path = store_path(model)
+    tmp_path = path.with_suffix(".tmp.npz")
+    np.savez(tmp_path, values=values, base_value=np.float64(base_value), keys=keys,
+             feature_names=np.asarray(feature_names(model), dtype=str))
+    os.replace(tmp_path, path)
+
+
+def update_store(model, X, model_path=None, workers=1, batch_rows=2048):
+    """Bring the store up to date with the rows of ``X`` and return it.
+
+    Rows whose hash is already stored are reused; only new or changed rows are
+    computed, in parallel batches when ``workers > 1``. The returned store is
+    aligned with the rows of ``X``.
+    """
+    X = X[feature_names(model)]
+    keys = row_keys(X)
+    stored = load_store(model)
+
+    values = np.zeros((len(X), X.shape[1]), dtype=np.float32)
+    todo = np.ones(len(X), dtype=bool)
+    base_value = None
+    if stored is not None and len(stored["keys"]):
+        order = np.argsort(stored["keys"])
+        sorted_keys = stored["keys"][order]
+        position = np.minimum(np.searchsorted(sorted_keys, keys), len(sorted_keys) - 1)
+        hit = sorted_keys[position] == keys
+        values[hit] = stored["values"][order[position[hit]]]
+        todo = ~hit
+        base_value = float(stored["base_value"])
+
+    missing = np.flatnonzero(todo)
+    if len(missing):
+        batches = [missing[i:i + batch_rows] for i in range(0, len(missing), batch_rows)]
+        if workers > 1 and len(batches) > 1:
+            with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(model_path,)) as pool:
+                results = list(pool.map(_worker_batch, (X.iloc[rows] for rows in batches)))
+        else:
+            results = [shap_batch(model, X.iloc[rows]) for rows in batches]
+        for rows, (batch_values, batch_base) in zip(batches, results):
+            values[rows] = batch_values
+            base_value = batch_base
+
+    if len(missing) or stored is None or not np.array_equal(stored["keys"], keys):
+        _save_store(model, values, base_value, keys)
+    return {"values": values, "base_value": base_value, "keys": keys,
+            "feature_names": np.asarray(feature_names(model), dtype=str), "computed": len(missing)}
+
+
+def global_importance(values, names):
+    """Mean |SHAP| per feature, most important first."""
+    importance = np.abs(values).mean(axis=0)
+    return pd.Series(importance, index=names).sort_values(ascending=False)
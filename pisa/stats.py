@@ -0,0 +1,199 @@
+"""Per-column statistics index for the Feature Browser and Summary Statistics.
+
+The index is built once per dataset version and then answers any column
+selection by lookup instead of calling ``describe()`` on the frame. For every
+column (overall and per REPEAT class) it keeps the count, missing count,
+mean, sum of squared deviations, min, max and a value histogram. Appending
+rows merges their statistics in (Chan et al.'s parallel variance update), so
+the index never rescans old data; ``load_index`` does this when rows have
+only been appended to the CSV since the index was last built.
+
+Columns with at most ``MAX_EXACT`` distinct values keep exact value counts,
+which give the same quantiles as pandas. Beyond that the counts collapse into
+a ``HISTOGRAM_BINS``-bin histogram and quantiles are interpolated within bins.
+"""
+import copy
+import os
+
+import numpy as np
+import pandas as pd
+
+from pisa import HOLDOUT_PATH, TARGET
+
+# Bump when the pickled layout of the index changes
+INDEX_VERSION = 1
+
+MAX_EXACT = 2048
+HISTOGRAM_BINS = 512
+QUANTILES = (0.25, 0.5, 0.75)
+
+
+class ColumnStats:
+    """Mergeable summary of one column."""
+
+    def __init__(self):
+        self.count = 0
+        self.missing = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+        # Exact mode: distinct values and their counts. Binned mode: bin edges too.
+        self.values = np.empty(0)
+        self.counts = np.empty(0, dtype=np.int64)
+        self.edges = None
+
+    @classmethod
+    def of(cls, values):
+        stats = cls()
+        stats.add(values)
+        return stats
+
+    def add(self, values):
+        """Merge the statistics of a batch of raw values."""
+        values = np.asarray(values, dtype=np.float64)
+        present = values[~np.isnan(values)]
+        self.missing += len(values) - len(present)
+        if not len(present):
+            return
+
+        n, mean = len(present), float(present.mean())
+        m2 = float(((present - mean) ** 2).sum())
+        total = self.count + n
+        delta = mean - self.mean
+        self.m2 += m2 + delta ** 2 * self.count * n / total
+        self.mean += delta * n / total
+        self.count = total
+        self.min = min(self.min, float(present.min()))
+        self.max = max(self.max, float(present.max()))
+
+        if self.edges is None:
+            distinct, counts = np.unique(present, return_counts=True)
+            merged = np.concatenate([self.values, distinct])
+            values, inverse = np.unique(merged, return_inverse=True)
+            self.counts = np.bincount(inverse, np.concatenate([self.counts, counts]),
+                                      minlength=len(values)).astype(np.int64)
+            self.values = values
+            if len(values) > MAX_EXACT:
+                self._to_histogram()
+        else:
+            self.counts += self._bin_counts(present)
+
+    def _to_histogram(self):
+        self.edges = np.linspace(self.min, self.max, HISTOGRAM_BINS + 1)
+        counts = self._bin_counts(self.values, weights=self.counts)
+        self.values, self.counts = 0.5 * (self.edges[:-1] + self.edges[1:]), counts
+
+    def _bin_counts(self, values, weights=None):
+        # Values beyond the original range land in the end bins; min/max stay exact
+        index = np.clip(np.searchsorted(self.edges, values, side="right") - 1, 0, HISTOGRAM_BINS - 1)
+        return np.bincount(index, weights, minlength=HISTOGRAM_BINS).astype(np.int64)
+
+    @property
+    def std(self):
+        return float(np.sqrt(self.m2 / (self.count - 1))) if self.count > 1 else np.nan
+
+    def quantile(self, q):
+        """Linear-interpolated quantile, matching ``pandas.Series.quantile`` in exact mode."""
+        if not self.count:
+            return np.nan
+        position = (self.count - 1) * q
+        cumulative = np.cumsum(self.counts)
+        if self.edges is None:
+            low = self.values[np.searchsorted(cumulative, np.floor(position), side="right")]
+            high = self.values[np.searchsorted(cumulative, np.ceil(position), side="right")]
+            return float(low + (high - low) * (position - np.floor(position)))
+        i = int(np.searchsorted(cumulative, position, side="right"))
+        before = cumulative[i - 1] if i else 0
+        fraction = (position - before) / self.counts[i] if self.counts[i] else 0.0
+        value = self.edges[i] + fraction * (self.edges[i + 1] - self.edges[i])
+        return float(np.clip(value, self.min, self.max))
+
+    def describe(self):
+        row = {"count": float(self.count), "mean": self.mean if self.count else np.nan,
+               "std": self.std, "min": self.min if self.count else np.nan}
+        for q in QUANTILES:
+            row[f"{q:.0%}"] = self.quantile(q)
+        row["max"] = self.max if self.count else np.nan
+        row["missing"] = float(self.missing)
+        return row
+
+    def histogram(self):
+        """``(values, counts)``: distinct values in exact mode, bin centres otherwise."""
+        return self.values, self.counts
+
+
+class StatsIndex:
+    """Column statistics of a dataset, overall and per target class."""
+
+    def __init__(self, target=TARGET):
+        self.target = target
+        self.rows = 0
+        self.columns = {}
+        self.by_class = {}
+
+    @classmethod
+    def build(cls, df, target=TARGET):
+        index = cls(target)
+        index.update(df)
+        return index
+
+    def update(self, df):
+        """Merge in new rows without touching the ones already indexed."""
+        self.rows += len(df)
+        for name in df.columns:
+            self.columns.setdefault(name, ColumnStats()).add(df[name].to_numpy())
+        if self.target in df.columns:
+            labels = df[self.target].to_numpy()
+            for label in np.unique(labels[~pd.isna(labels)]):
+                part = df[labels == label]
+                group = self.by_class.setdefault(label.item(), {})
+                for name in df.columns:
+                    group.setdefault(name, ColumnStats()).add(part[name].to_numpy())
+        return self
+
+    def describe(self, columns=None):
+        """``DataFrame.describe().T``-shaped table (plus missing counts) by lookup."""
+        columns = list(self.columns) if columns is None else list(columns)
+        return pd.DataFrame([self.columns[name].describe() for name in columns], index=columns)
+
+    def describe_by_class(self, columns=None):
+        """Same table for every target class, indexed by ``(column, class)``."""
+        columns = list(self.columns) if columns is None else list(columns)
+        rows, keys = [], []
+        for name in columns:
+            for label in sorted(self.by_class):
+                rows.append(self.by_class[label][name].describe())
+                keys.append((name, label))
+        return pd.DataFrame(rows, index=pd.MultiIndex.from_tuples(keys, names=["feature", self.target]))
+
+
+def load_index(csv_path=HOLDOUT_PATH):
+    """Statistics index of the dataset, built once per version of the file.
+
+    When the store has only had rows appended since the last index of
+    ``csv_path`` was built (same ``lineage``, see ``pisa.store``), those rows
+    are merged into a copy of that index with ``StatsIndex.update``; the old
+    rows are not read again.
+    """
+    from pisa.cache import default_cache, digest
+    from pisa.store import load_columns, open_store, source_key
+
+    cache = default_cache()
+    key = digest("stats-index", INDEX_VERSION, source_key(csv_path))
+    index = cache.get(key)
+    if index is not None:
+        return index
+
+    manifest = open_store(csv_path)[1]
+    latest_key = digest("stats-index-latest", INDEX_VERSION, os.path.abspath(csv_path))
+    latest = cache.get(latest_key)
+    previous = cache.get(latest["key"]) if latest and latest["lineage"] == manifest["lineage"] else None
+    if previous is not None and previous.rows <= manifest["rows"]:
+        appended = load_columns(csv_path=csv_path).iloc[previous.rows:]
+        index = copy.deepcopy(previous).update(appended)
+    else:
+        index = StatsIndex.build(load_columns(csv_path=csv_path))
+    cache.set(key, index)
+    cache.set(latest_key, {"lineage": manifest["lineage"], "key": key})
+    return index
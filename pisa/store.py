@@ -0,0 +1,271 @@
+"""Typed, memory-mapped columnar store for the holdout set.
+
+``pd.read_csv`` parses every column of ``data/holdout.csv`` as int64/float64.
+The store converts the CSV once, in chunks, to one raw binary file per column
+using the compact dtypes declared in ``pisa.schema``, plus a JSON manifest
+recording the source file it was built from. Loads memory-map only the
+requested columns, so a session holds a fraction of the memory and the
+Feature Browser reads just the columns on screen. The frame is built over
+the mapped arrays without copying them, so its columns are read-only.
+
+The store follows the CSV automatically. When the file has only grown (the
+last block before the old end is unchanged and ended a line), just the
+appended bytes are parsed and appended to the column files, and the manifest
+is swapped in after them, so readers of the old manifest keep a consistent
+prefix. Only the tail is compared, so an edit further back that keeps the
+file growing would go unnoticed; rewrite such files rather than appending.
+Any other change (size or mtime) rebuilds the store. A rebuild gets a
+new ``lineage``; appends keep it, so derived data can be extended rather than
+recomputed (see ``pisa.stats.load_index``).
+"""
+import hashlib
+import io
+import json
+import os
+import shutil
+import tempfile
+import uuid
+
+import numpy as np
+import pandas as pd
+
+from pisa import CACHE_DIR, HOLDOUT_PATH
+from pisa.cache import digest
+from pisa.schema import HOLDOUT_SCHEMA
+
+STORE_VERSION = 2
+
+# Bytes before the recorded end of the CSV that must be unchanged for an append
+TAIL_BYTES = 4096
+
+try:
+    import fcntl
+except ImportError:  # Windows: appends are skipped and the store is rebuilt instead
+    fcntl = None
+
+
+def store_dir(csv_path=HOLDOUT_PATH):
+    return CACHE_DIR / f"{os.path.basename(csv_path)}.cols"
+
+
+def _source_stamp(csv_path):
+    stat = os.stat(csv_path)
+    return {"path": os.path.abspath(csv_path), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def _tail_sha256(csv_path, size):
+    """SHA-256 of the ``TAIL_BYTES`` before ``size``, and whether they end a line (a whole row)."""
+    with open(csv_path, "rb") as f:
+        f.seek(max(size - TAIL_BYTES, 0))
+        tail = f.read(min(size, TAIL_BYTES))
+    return hashlib.sha256(tail).hexdigest(), tail.endswith(b"\n")
+
+
+def _source(csv_path):
+    source = _source_stamp(csv_path)
+    source["tail_sha256"], source["appendable"] = _tail_sha256(csv_path, source["size"])
+    return source
+
+
+def _write_manifest(directory, manifest):
+    tmp_path = os.path.join(directory, f"manifest.json.tmp{os.getpid()}")
+    with open(tmp_path, "w") as f:
+        json.dump(manifest, f, indent=1)
+    os.replace(tmp_path, os.path.join(directory, "manifest.json"))
+
+
+def _read_manifest(directory):
+    try:
+        with open(os.path.join(directory, "manifest.json")) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _compact(chunk, schema):
+    """Cast a chunk to the schema dtypes, refusing lossy conversions."""
+    out = {}
+    for name, dtype in schema.items():
+        column = chunk[name].to_numpy()
+        converted = column.astype(dtype)
+        if not np.array_equal(converted, column, equal_nan=column.dtype.kind == "f"):
+            raise ValueError(f"Column {name!r} does not fit {dtype} losslessly")
+        out[name] = converted
+    return out
+
+
+def build_store(csv_path=HOLDOUT_PATH, directory=None, schema=HOLDOUT_SCHEMA, chunksize=100_000):
+    """Convert ``csv_path`` to a columnar store; return the manifest."""
+    directory = str(directory or store_dir(csv_path))
+    os.makedirs(os.path.dirname(directory), exist_ok=True)
+    # Unique per build, so concurrent builds never share a scratch directory
+    tmp_dir = tempfile.mkdtemp(prefix=f"{os.path.basename(directory)}.tmp",
+                               dir=os.path.dirname(directory))
+
+    # Stamped before reading, so a file changed mid-build is picked up next time
+    source = _source(csv_path)
+    header = list(pd.read_csv(csv_path, nrows=0).columns)
+    files = [open(os.path.join(tmp_dir, f"{i}.bin"), "wb") for i in range(len(schema))]
+    try:
+        rows = _write_chunks(pd.read_csv(csv_path, chunksize=chunksize, usecols=list(schema)),
+                             files, schema)
+    finally:
+        for f in files:
+            f.close()
+    if _source_stamp(csv_path) != {k: source[k] for k in ("path", "size", "mtime_ns")}:
+        # Rows past the stamped size may have been read, so only a rebuild can follow this store
+        source["appendable"] = False
+
+    manifest = {
+        "version": STORE_VERSION,
+        "lineage": uuid.uuid4().hex,
+        "rows": rows,
+        "header": header,
+        "columns": [{"name": name, "dtype": dtype, "file": f"{i}.bin"}
+                    for i, (name, dtype) in enumerate(schema.items())],
+        "source": source,
+    }
+    _write_manifest(tmp_dir, manifest)
+    return _publish(tmp_dir, directory, manifest)
+
+
+def _write_chunks(chunks, files, schema):
+    rows = 0
+    for chunk in chunks:
+        for f, column in zip(files, _compact(chunk, schema).values()):
+            f.write(column.tobytes())
+        rows += len(chunk)
+    return rows
+
+
+def _appended(manifest, csv_path):
+    """Whether ``csv_path`` only has rows appended since the store was built from it."""
+    source, size = manifest["source"], os.stat(csv_path).st_size
+    return (source["appendable"] and size > source["size"]
+            and _tail_sha256(csv_path, source["size"])[0] == source["tail_sha256"])
+
+
+def append_store(csv_path=HOLDOUT_PATH, directory=None, chunksize=100_000):
+    """Parse only the rows appended to ``csv_path`` into the store; return the manifest.
+
+    Returns None when the file has changed in some other way (or appends are
+    not supported here) and the store has to be rebuilt.
+    """
+    directory = str(directory or store_dir(csv_path))
+    if fcntl is None:
+        return None
+    with open(os.path.join(directory, "append.lock"), "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        manifest = _read_manifest(directory)
+        if manifest is None or manifest.get("version") != STORE_VERSION:
+            return None
+        if _is_current(manifest, csv_path):
+            return manifest  # appended by another process while we waited
+        if not _appended(manifest, csv_path):
+            return None
+        source = _source(csv_path)
+        if not source["appendable"]:
+            return None  # still being written
+        schema = {column["name"]: column["dtype"] for column in manifest["columns"]}
+        files = []
+        try:
+            for column in manifest["columns"]:
+                f = open(os.path.join(directory, column["file"]), "r+b")
+                files.append(f)
+                # Drop the leftovers of an append that failed before its manifest was written
+                f.truncate(manifest["rows"] * np.dtype(column["dtype"]).itemsize)
+                f.seek(0, os.SEEK_END)
+            # Exactly the stamped range: bytes written after the stamp belong to the next append
+            with open(csv_path, "rb") as csv:
+                csv.seek(manifest["source"]["size"])
+                appended = io.BytesIO(csv.read(source["size"] - manifest["source"]["size"]))
+            chunks = pd.read_csv(appended, header=None, names=manifest["header"], usecols=list(schema),
+                                 chunksize=chunksize)
+            rows = _write_chunks(chunks, files, schema)
+        finally:
+            for f in files:
+                f.close()
+        # The columns are written first, so readers of the old manifest see a consistent prefix
+        manifest = dict(manifest, rows=manifest["rows"] + rows, source=source)
+        _write_manifest(directory, manifest)
+        return manifest
+
+
+def _publish(tmp_dir, directory, manifest, attempts=3):
+    """Rename a finished build into place and return the manifest of the store that won.
+
+    A directory cannot be renamed over a non-empty one. If another build got
+    there first with a store of the same source, that store is kept and this
+    build discarded; a stale store in the way is moved aside and removed
+    (open memory maps of its files stay valid).
+    """
+    for _ in range(attempts):
+        try:
+            os.rename(tmp_dir, directory)
+            return manifest
+        except OSError:
+            pass
+        existing = _read_manifest(directory)
+        if (existing is not None and existing.get("version") == STORE_VERSION
+                and existing["source"] == manifest["source"]):
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            return existing
+        aside = tempfile.mkdtemp(prefix=f"{os.path.basename(directory)}.old",
+                                 dir=os.path.dirname(directory))
+        try:
+            os.rename(directory, os.path.join(aside, "store"))
+        except OSError:
+            pass  # another build moved it first
+        shutil.rmtree(aside, ignore_errors=True)
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    raise OSError(f"Could not publish the store at {directory}")
+
+
+def _is_current(manifest, csv_path):
+    stamp = _source_stamp(csv_path)
+    stamp.pop("path")
+    return (manifest is not None and manifest.get("version") == STORE_VERSION
+            and {k: manifest["source"][k] for k in stamp} == stamp)
+
+
+def open_store(csv_path=HOLDOUT_PATH):
+    """Return ``(directory, manifest)``, updating the store if it is missing or stale."""
+    directory = store_dir(csv_path)
+    manifest = _read_manifest(directory)
+    if not _is_current(manifest, csv_path):
+        manifest = (manifest is not None and append_store(csv_path, directory)
+                    or build_store(csv_path, directory))
+    return directory, manifest
+
+
+def source_key(csv_path=HOLDOUT_PATH):
+    """Digest identifying the current version of the dataset, for caching derived data."""
+    return digest("source", sorted(open_store(csv_path)[1]["source"].items()))
+
+
+def column_names(csv_path=HOLDOUT_PATH):
+    return [column["name"] for column in open_store(csv_path)[1]["columns"]]
+
+
+def load_columns(columns=None, csv_path=HOLDOUT_PATH):
+    """Load ``columns`` (all by default) of the dataset as a compactly typed DataFrame.
+
+    Only the requested columns are read; each is memory-mapped from the store
+    and the frame is built over the mappings without copying them.
+    """
+    directory, manifest = open_store(csv_path)
+    specs = {column["name"]: column for column in manifest["columns"]}
+    if columns is None:
+        columns = list(specs)
+    unknown = [name for name in columns if name not in specs]
+    if unknown:
+        raise KeyError(f"Unknown columns: {unknown}")
+    data = {}
+    for name in columns:
+        spec = specs[name]
+        if manifest["rows"] == 0:
+            data[name] = np.empty(0, dtype=spec["dtype"])
+        else:
+            data[name] = np.memmap(os.path.join(directory, spec["file"]), dtype=spec["dtype"],
+                                   mode="r", shape=(manifest["rows"],))
+    return pd.DataFrame(data, columns=list(columns), copy=False)
@@ -0,0 +1,102 @@
+"""Every decision threshold of a scored set in one sort-and-cumsum pass.
+
+Sorting the probabilities once (descending) makes the confusion counts at
+every distinct threshold a cumulative sum of the sorted labels. Precision,
+recall, F1 and the ROC/PR curves all follow elementwise from those counts, so
+moving the operating point afterwards is a binary search instead of a
+rescoring. A row is predicted positive when its probability is ``>=`` the
+threshold, matching ``pisa.model.score_frame``.
+"""
+import numpy as np
+
+# Bump when ThresholdSweep's attributes or semantics change, to invalidate cached sweeps
+THRESHOLDS_VERSION = 1
+
+
+class ThresholdSweep:
+    """Confusion counts and metrics at every distinct threshold of ``proba``.
+
+    Point 0 is the threshold above every score (nothing predicted positive);
+    point ``i`` predicts positive every row scoring at least ``thresholds[i]``.
+    Thresholds are in descending order.
+    """
+
+    def __init__(self, y_true, proba):
+        y_true = np.asarray(y_true).astype(bool)
+        proba = np.asarray(proba, dtype=np.float64)
+        if y_true.shape != proba.shape or y_true.ndim != 1:
+            raise ValueError("y_true and proba must be 1-D arrays of the same length")
+
+        order = np.argsort(-proba, kind="stable")
+        proba, y_true = proba[order], y_true[order]
+        # Last row of each run of tied scores
+        ends = np.flatnonzero(np.diff(proba) != 0)
+        ends = np.append(ends, len(proba) - 1) if len(proba) else ends
+
+        tp = np.cumsum(y_true, dtype=np.int64)[ends]
+        fp = ends + 1 - tp
+        self.thresholds = np.concatenate([[np.inf], proba[ends]])
+        self._ascending = -self.thresholds  # searchsorted needs ascending keys
+        self.tp = np.concatenate([[0], tp])
+        self.fp = np.concatenate([[0], fp])
+        self.positives = int(y_true.sum())
+        self.negatives = len(y_true) - self.positives
+        self.fn = self.positives - self.tp
+        self.tn = self.negatives - self.fp
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            predicted = self.tp + self.fp
+            # Precision is 1 when nothing is predicted positive, as in sklearn's PR curve
+            self.precision = np.where(predicted > 0, self.tp / predicted, 1.0)
+            self.recall = self.tp / self.positives if self.positives else np.zeros(len(self.tp))
+            self.fpr = self.fp / self.negatives if self.negatives else np.zeros(len(self.fp))
+            # F1 = 2TP / (2TP + FP + FN), defined as 0 when there are no true positives
+            denominator = 2 * self.tp + self.fp + self.fn
+            self.f1 = np.where(denominator > 0, 2 * self.tp / np.maximum(denominator, 1), 0.0)
+
+    def __len__(self):
+        return len(self.thresholds)
+
+    @property
+    def roc_auc(self):
+        """Area under the ROC curve (trapezoidal, ties handled as sklearn does)."""
+        if not self.positives or not self.negatives:
+            return np.nan
+        return float(np.sum(np.diff(self.fpr) * (self.recall[1:] + self.recall[:-1])) / 2)
+
+    @property
+    def average_precision(self):
+        """Area under the PR curve as a step function, like ``average_precision_score``."""
+        if not self.positives:
+            return np.nan
+        return float(np.sum(np.diff(self.recall) * self.precision[1:]))
+
+    def index(self, threshold):
+        """Index of the sweep point that applies ``>= threshold``."""
+        return int(np.searchsorted(self._ascending, -threshold, side="right")) - 1
+
+    def at(self, threshold):
+        """Confusion counts and metrics at ``threshold``."""
+        i = self.index(threshold)
+        return {
+            "threshold": threshold,
+            "tp": int(self.tp[i]), "fp": int(self.fp[i]),
+            "fn": int(self.fn[i]), "tn": int(self.tn[i]),
+            "precision": float(self.precision[i]) if self.tp[i] + self.fp[i] else 0.0,
+            "recall": float(self.recall[i]),
+            "f1": float(self.f1[i]),
+            "fpr": float(self.fpr[i]),
+        }
+
+    def best_f1(self):
+        """Threshold with the highest F1."""
+        i = int(np.argmax(self.f1[1:])) + 1 if len(self) > 1 else 0
+        return float(self.thresholds[i])
+
+    def curves(self, max_points=2000):
+        """``(fpr, recall, precision)`` thinned to at most ``max_points`` for plotting."""
+        if len(self) <= max_points:
+            keep = slice(None)
+        else:
+            keep = np.unique(np.linspace(0, len(self) - 1, max_points).astype(np.int64))
+        return self.fpr[keep], self.recall[keep], self.precision[keep]
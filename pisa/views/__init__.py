@@ -0,0 +1,67 @@
+"""Page registry for the dashboard.
+
+Each sidebar entry maps to a module under ``pisa.views`` exposing
+``render()``. Page modules are imported the first time their page is shown,
+so heavy dependencies (matplotlib, sklearn, catboost, shap) only load for the
+pages that use them. Import times are kept for the startup report.
+"""
+import importlib
+import time
+
+import streamlit as st
+
+from pisa import profiling, warmup
+
+# Sidebar label -> page module; None for pages that have no content yet
+PAGES = {
+    "🏠 Landing Page": "landing",
+    "📊 Data Overview": "data_overview",
+    "⚙️ Feature Selection": "feature_selection",
+    "📈 EDA": "eda",
+    "🔄 Machine Learning Pipeline": "ml_pipeline",
+    "🤖 Final Model": "final_model",
+    "💡 Feature Importance": "feature_importance",
+    "🧭 Segment Analysis": "segment_analysis",
+    "📡 Drift Monitor": "drift_monitor",
+    "🎯 Recommendations": "recommendations",
+}
+
+# Sidebar label -> seconds spent importing the page module
+IMPORT_TIMES = {}
+
+
+def load_page(label):
+    """Import and return the module behind ``label``, or None if it has no page."""
+    name = PAGES[label]
+    if name is None:
+        return None
+    module_name = f"{__name__}.{name}"
+    start = time.perf_counter()
+    with profiling.span(f"import {name}", kind="import"):
+        module = importlib.import_module(module_name)
+    IMPORT_TIMES.setdefault(label, time.perf_counter() - start)
+    return module
+
+
+def render(label):
+    """Render the page behind a sidebar label."""
+    with profiling.span(f"page {label}", kind="page"):
+        module = load_page(label)
+        if module is not None:
+            module.render()
+
+
+def current_snapshot():
+    """The warm-up worker's published snapshot; stops the page with the warm-up error if there is none."""
+    with profiling.span("snapshot", kind="loader"):
+        try:
+            return warmup.snapshot()
+        except (RuntimeError, TimeoutError) as e:
+            st.error(f"The model and data could not be loaded. {e}")
+            st.stop()
+
+
+def startup_report():
+    """Return ``(label, milliseconds or None)`` import times for every page."""
+    return [(label, IMPORT_TIMES[label] * 1000 if label in IMPORT_TIMES else None)
+            for label in PAGES]
@@ -0,0 +1,37 @@
+"""📊 Data Overview page."""
+import matplotlib.pyplot as plt
+import streamlit as st
+
+from pisa import assets, profiling
+
+
+@profiling.loader(st.cache_data)
+def repetition_chart():
+    """PNG of the repetition rate comparison; its numbers are fixed, so it is drawn once."""
+    fig, ax = plt.subplots()
+    countries = ['Philippines', 'OECD Average']
+    rates = [25.4, 12.0]
+    ax.bar(countries, rates, color=['#4f46e5', '#a5b4fc'])
+    ax.set_ylabel('Repetition Rate (%)')
+    return assets.figure_png(fig)
+
+
+def render():
+    st.header("Dataset Overview")
+    
+    with st.expander("🌐 Dataset Structure", expanded=True):
+        col1, col2 = st.columns(2)
+        with col1:
+            st.markdown("""
+            **OECD PISA 2022 Student Questionnaire Dataset**
+            - International standardized assessment measuring 15-year-old students' literacy
+            - Covers reading, math, and science competencies
+            - Global dataset: 613,744 students (80 countries)
+            """)
+            
+        with col2:
+            st.metric(label = "Philippine Students", value = "7,193", delta = "1.17% of global dataset", delta_color="off")
+            st.metric(label = "Grade Repetition Rate", value = "25.4%", delta = "+13.4% vs OECD average", delta_color="inverse")
+        
+        # Add bar chart comparing repetition rates
+        st.image(repetition_chart(), use_container_width=True)
@@ -0,0 +1,92 @@
+"""📡 Drift Monitor page: how far a new cohort is from the holdout."""
+import io
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from pisa import HOLDOUT_PATH, profiling, warmup
+from pisa.drift import PSI_MAJOR, PSI_MODERATE, DriftMonitor
+from pisa.views import current_snapshot
+
+CHUNK_ROWS = 50_000
+
+
+@st.cache_data(show_spinner="Streaming the file through the drift monitor...")
+def monitor_file(data, name, version):
+    """Monitor state after streaming ``data`` (file bytes; ``name`` is for display).
+
+    ``version`` is the snapshot's, so a newly published model or holdout recomputes.
+    """
+    snapshot = warmup.snapshot()
+    monitor = DriftMonitor(snapshot.drift_reference)
+    monitor.consume(pd.read_csv(io.BytesIO(data), chunksize=CHUNK_ROWS), model=snapshot.model)
+    return monitor
+
+
+def render():
+    st.header("Drift Monitor")
+    version = current_snapshot().version
+    st.markdown(f"""
+    Compares a new cohort with the holdout the model was validated on. Every feature is
+    quantized into at most 32 quantile bins of the holdout, as CatBoost quantizes its inputs,
+    and the file is streamed in chunks, so only bin counts are kept. PSI below {PSI_MODERATE}
+    is stable, {PSI_MODERATE}–{PSI_MAJOR} a moderate shift and above {PSI_MAJOR} a major shift.
+    """)
+
+    uploaded = st.file_uploader("Student file (CSV with the model's feature columns)", type="csv")
+    if uploaded is None:
+        st.info("Upload a file to check it for drift. As a sanity check, the holdout itself is "
+                "shown below (no drift). Command line: `python -m scripts.drift_report file.csv`.")
+        data, name = HOLDOUT_PATH.read_bytes(), HOLDOUT_PATH.name
+    else:
+        data, name = uploaded.getvalue(), uploaded.name
+
+    with profiling.span("drift monitor", kind="loader"):
+        try:
+            monitor = monitor_file(data, name, version)
+        except KeyError as e:
+            st.error(f"The file is missing model features: {e}")
+            return
+    report = monitor.feature_report()
+
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Rows", f"{monitor.rows:,}")
+    col2.metric("Features with major drift", f"{(report['status'] == 'major').sum()}")
+    col3.metric("Features with moderate drift", f"{(report['status'] == 'moderate').sum()}")
+    prediction = monitor.prediction_drift()
+    if prediction:
+        col4.metric("Prediction PSI", f"{prediction['psi']:.3f}", help=f"KS {prediction['ks']:.3f}")
+
+    top = st.slider("Features shown", 5, len(report), 15)
+    shown = report.head(top)
+    st.dataframe(shown.style.format({"psi": "{:.4f}", "ks": "{:.4f}", "missing": "{:.1%}"}),
+                 use_container_width=True)
+
+    with profiling.span("figure drift"):
+        fig, ax = plt.subplots(figsize=(7, 0.3 * top + 1))
+        colors = shown["status"].map({"stable": "#66c2a5", "moderate": "#fbbf24", "major": "#ef4444"})
+        ax.barh(shown.index[::-1], shown["psi"][::-1], color=colors[::-1].tolist())
+        ax.axvline(PSI_MAJOR, color="#9ca3af", linestyle="--", linewidth=1)
+        ax.set_xlabel("PSI")
+        st.pyplot(fig)
+        plt.close(fig)
+
+    feature = st.selectbox("Compare distributions of", list(report.index))
+    with profiling.span("figure drift histogram"):
+        borders, reference, current = monitor.histograms(feature)
+        labels = ([f"< {borders[0]:.3g}"] if len(borders) else ["all"])
+        labels += [f"{lo:.3g} – {hi:.3g}" for lo, hi in zip(borders[:-1], borders[1:])]
+        labels += ([f"≥ {borders[-1]:.3g}"] if len(borders) else []) + ["missing"]
+        positions = np.arange(len(labels))
+        fig, ax = plt.subplots(figsize=(8, 3.5))
+        ax.bar(positions - 0.2, reference / max(reference.sum(), 1), width=0.4, color="#6366f1",
+               label="Holdout")
+        ax.bar(positions + 0.2, current / max(current.sum(), 1), width=0.4, color="#fc8d62",
+               label=name)
+        ax.set_xticks(positions, labels, rotation=60, ha="right", fontsize=7)
+        ax.set_ylabel("Share of rows")
+        ax.legend()
+        st.pyplot(fig)
+        plt.close(fig)
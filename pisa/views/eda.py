@@ -0,0 +1,229 @@
+"""📈 EDA page, drawn live from aggregation cubes of the holdout."""
+import matplotlib.pyplot as plt
+import numpy as np
+import streamlit as st
+
+from pisa import TARGET, assets, profiling, store
+from pisa.cache import default_cache, digest
+from pisa.cube import Cube, Dimension
+from pisa.schema import GENDER_LABELS, ISCED_LABELS, OTHER_REGIONS, REGION_COLUMNS
+
+# Bump when the cube layout below or its labels change
+EDA_CUBES_VERSION = 2
+
+HISTOGRAM_BINS = 30
+
+# Charted variables: categorical columns keep their codes, the rest are binned
+CATEGORICAL = {"MISSSC": {0: "No", 1: "Yes"}, "MISCED": ISCED_LABELS, "FISCED": ISCED_LABELS}
+BINNED = ("FEELSAFE", "BELONG", "BULLIED", "PVACAD", "FAMSUP", "TEACHSUP", "ICTRES")
+
+COLORS = {0: "#66c2a5", 1: "#fc8d62"}
+CLASS_LABELS = {0: "Not Repeat", 1: "Repeat"}
+
+ALL_REGIONS, ALL_STUDENTS = "All regions", "All students"
+
+
+def build_cubes(df):
+    """One (region, gender, REPEAT, variable) cube per charted variable."""
+    common = [
+        Dimension.one_hot("region", REGION_COLUMNS, REGION_COLUMNS.values(), OTHER_REGIONS),
+        Dimension.categorical("gender", list(GENDER_LABELS), GENDER_LABELS),
+        Dimension.categorical(TARGET, [0, 1]),
+    ]
+    cubes = {}
+    for column, labels in CATEGORICAL.items():
+        values = sorted(set(labels) | set(np.unique(df[column]).tolist()))
+        cubes[column] = Cube.build(df, common + [Dimension.categorical(column, values, labels)])
+    for column in BINNED:
+        edges = np.linspace(df[column].min(), df[column].max(), HISTOGRAM_BINS + 1)
+        cubes[column] = Cube.build(df, common + [Dimension.binned(column, edges)])
+    return cubes
+
+
+def load_cubes():
+    """The EDA cubes of the current holdout, built once per version of the file."""
+    key = digest("eda-cubes", EDA_CUBES_VERSION, store.source_key())
+    return default_cache().get_or_compute(key, lambda: build_cubes(store.load_columns()))
+
+
+def _class_distribution(ax, cube, column, filters):
+    """Per-class density of ``column``, overlaid as in the notebook figures."""
+    counts = cube.aggregate((TARGET, column), filters).astype(np.float64)
+    dimension = cube.dimensions[-1]
+    totals = np.maximum(counts.sum(axis=1, keepdims=True), 1)
+    density = counts / totals / dimension.widths
+    if dimension.kind == "binned":
+        positions, widths = np.asarray(dimension.labels), dimension.widths
+    else:
+        positions, widths = np.arange(len(dimension)), np.full(len(dimension), 0.8)
+        ax.set_xticks(positions, dimension.labels, rotation=45, ha="right")
+    for label in (0, 1):
+        ax.bar(positions, density[label], width=widths, color=COLORS[label], alpha=0.6,
+               edgecolor="black", linewidth=0.5, label=CLASS_LABELS[label])
+
+
+def _distribution_figure(cubes, columns, titles, filters, ylabel="Density"):
+    fig, axes = plt.subplots(1, len(columns), figsize=(5 * len(columns), 4.5), sharey=True)
+    axes = np.atleast_1d(axes)
+    for ax, column, title in zip(axes, columns, titles):
+        _class_distribution(ax, cubes[column], column, filters)
+        ax.set_xlabel(title)
+    axes[0].set_ylabel(ylabel)
+    axes[-1].legend(frameon=False)
+    fig.tight_layout()
+    return fig
+
+
+def _missed_school_figure(cube, filters):
+    counts = cube.aggregate((TARGET, "MISSSC"), filters).astype(np.float64)
+    shares = counts / np.maximum(counts.sum(axis=1, keepdims=True), 1)
+    fig, ax = plt.subplots(figsize=(7, 4.5))
+    bottom = np.zeros(2)
+    for missed, label in ((0, "No"), (1, "Yes")):
+        ax.bar(["No", "Yes"], shares[:, missed], bottom=bottom, width=0.5, color=COLORS[missed], label=label)
+        for x in range(2):
+            if shares[x, missed] > 0.04:
+                ax.text(x, bottom[x] + shares[x, missed] / 2, f"{shares[x, missed]:.1%}",
+                        ha="center", va="center", fontweight="bold")
+        bottom += shares[:, missed]
+    ax.set_yticks([])
+    ax.set_xlabel("Repeated Grade")
+    ax.set_title("Proportion of Students Missing School")
+    ax.legend(title="Missed School > 3mos", loc="lower center")
+    return fig
+
+
+# Chart name -> figure of (cubes, filters)
+CHARTS = {
+    "missed school": lambda cubes, filters: _missed_school_figure(cubes["MISSSC"], filters),
+    "safety and belonging": lambda cubes, filters: _distribution_figure(
+        cubes, ["FEELSAFE", "BELONG", "BULLIED"],
+        ["Sense of safety", "Sense of belonging", "Experience of school bullying"], filters),
+    # The holdout carries the average of the math, reading and science scores
+    "scores": lambda cubes, filters: _distribution_figure(
+        cubes, ["PVACAD"], ["Average PISA score (math, reading, science)"], filters),
+    "parental education": lambda cubes, filters: _distribution_figure(
+        cubes, ["MISCED", "FISCED"],
+        ["Mother's Educational Attainment", "Father's Educational Attainment"], filters,
+        ylabel="Share of students"),
+    "support": lambda cubes, filters: _distribution_figure(
+        cubes, ["FAMSUP", "TEACHSUP"], ["Family Support", "Teacher Support"], filters),
+    "digital access": lambda cubes, filters: _distribution_figure(
+        cubes, ["ICTRES"], ["ICT Resources Score"], filters),
+}
+
+
+@st.cache_data(max_entries=256)
+def chart_png(name, filters, source):
+    """PNG bytes of chart ``name`` for a filter selection; ``source`` (dataset version) keys the cache."""
+    return assets.figure_png(CHARTS[name](load_cubes(), filters))
+
+
+def _figure(name, filters):
+    with profiling.span(f"figure {name}"):
+        st.image(chart_png(name, filters, store.source_key()), use_container_width=True)
+
+
+def render():
+    with profiling.span("eda cubes", kind="loader"):
+        cubes = load_cubes()
+    region_dim, gender_dim = cubes["MISSSC"].dimensions[:2]
+
+    col1, col2 = st.columns(2)
+    region = col1.selectbox("Region", [ALL_REGIONS] + region_dim.labels)
+    gender = col2.selectbox("Gender", [ALL_STUDENTS] + gender_dim.labels)
+    filters = {}
+    if region != ALL_REGIONS:
+        filters["region"] = region
+    if gender != ALL_STUDENTS:
+        filters["gender"] = gender
+    by_class = cubes["MISSSC"].aggregate((TARGET,), filters)
+    if not by_class.sum():
+        st.warning("No students in this selection.")
+        return
+    st.caption(f"{by_class.sum():,} holdout students, {by_class[1] / by_class.sum():.1%} of whom repeated a grade.")
+
+    st.header("Theme 1: Engagement in School", divider=True)
+    
+    # EDA Item 1.1
+    with st.container():
+        col1, col2 = st.columns([3, 2])
+        with col1:
+            _figure("missed school", filters)
+            st.caption("Figure 1: Grade Repetition of Students Missing School")
+        with col2:
+            st.markdown("""
+            **Absences**:  
+            73% of Grade Repeaters have missed school for more than 3 months,
+            indicating strong correlation between absences and chances of repeating a grade.
+            """)
+    
+    st.divider()
+    
+    # EDA Item 1.2
+    with st.container():
+        col1, col2 = st.columns([2, 3])
+        with col1:
+            st.markdown("""
+            **Experience in School**:  
+            Grade Repeaters feel less safe, have a weaker sense of belonging, and experience more bullying in school.
+            """)
+        with col2:
+            _figure("safety and belonging", filters)
+            st.caption("Figure 2: Grade Repetition vs Safety and Belonging")
+
+    st.divider()
+
+    # EDA Item 1.3
+    with st.container():
+        col1, col2 = st.columns([3, 2])
+        with col1:
+            _figure("scores", filters)
+            st.caption("Figure 3: Performance on Standardized Exams")
+        with col2:
+            st.markdown("""
+            **Standardized Testing**:  
+            Grade Repeaters perform below average PISA scores for Mathematics, Reading and Science.
+            """)
+
+    st.header("Theme 2: Socioeconomic Profile", divider=True)
+    
+    # EDA Item 2.1
+    with st.container():
+        col1, col2 = st.columns([3, 2])
+        with col1:
+            st.markdown("""
+            **Parental Education**:  
+            A large proportion of Repeaters have parents with higher levels of education.
+            """)
+        with col2:
+            _figure("parental education", filters)
+            st.caption("Figure 4: Grade Repetition vs Parental Education")
+    
+    st.divider()
+    
+    # EDA Item 2.2
+    with st.container():
+        col1, col2 = st.columns([2, 3])
+        with col1:
+            _figure("support", filters)
+            st.caption("Figure 5: Grade Repetition vs Support Received")
+        with col2:
+            st.markdown("""
+            **Familial and Teacher Support**:  
+            Grade Repeaters generally receive less frequent support from their family.
+            """)
+
+    st.header("Theme 3: Digital Learning and Access", divider=True)
+    
+    # EDA Item 3.1
+    with st.container():
+        col1, col2 = st.columns([3, 2])
+        with col1:
+            st.markdown("""
+            **ICT Resources**:  
+            Grade Repeaters report lower digital access at home.
+            """)
+        with col2:
+            _figure("digital access", filters)
+            st.caption("Figure 6: Grade Repetition vs digital resource availability")
@@ -0,0 +1,97 @@
+"""💡 Feature Importance page, rendered from the precomputed SHAP store."""
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from pisa import TARGET, profiling, warmup
+from pisa import model as pisa_model
+from pisa.shap_store import global_importance, load_store, row_keys, store_path, update_store
+from pisa.views import current_snapshot
+
+
+@profiling.loader(st.cache_data)
+def load_shap(path, mtime):
+    # ``path`` and ``mtime`` key the cache; the model picks the file
+    return load_store(warmup.snapshot().model)
+
+
+def _waterfall(contributions, base_value, top=10):
+    order = np.argsort(-np.abs(contributions.to_numpy()))
+    shown = contributions.iloc[order[:top]]
+    rest = contributions.iloc[order[top:]].sum()
+    steps = list(shown.items())
+    if len(order) > top:
+        steps.append((f"{len(order) - top} other features", rest))
+    steps.reverse()
+
+    fig, ax = plt.subplots(figsize=(7, 0.4 * len(steps) + 1))
+    position = base_value + sum(value for _, value in steps)
+    for i, (name, value) in enumerate(steps):
+        position -= value
+        ax.barh(i, value, left=position, color="#ef4444" if value > 0 else "#3b82f6")
+    ax.set_yticks(range(len(steps)), [name for name, _ in steps])
+    ax.axvline(base_value, color="#9ca3af", linestyle="--", linewidth=1)
+    ax.set_xlabel("Log-odds of repeating (dashed: base value)")
+    return fig
+
+
+def render():
+    st.header("Feature Importance")
+
+    snapshot = current_snapshot()
+    model, holdout = snapshot.model, snapshot.holdout
+    path = store_path(model)
+    store = load_shap(str(path), path.stat().st_mtime if path.exists() else None)
+
+    features = list(pisa_model.feature_names(model))
+    if store is None or not np.array_equal(store["keys"], row_keys(holdout[features])):
+        st.info("SHAP values for the current model and holdout have not been computed yet. "
+                "Run `python -m scripts.compute_shap`, or compute them here.")
+        if st.button("Compute SHAP values"):
+            with st.spinner("Computing SHAP values for new or changed rows..."):
+                update_store(pisa_model.load_model(backend="catboost"), holdout)
+            st.rerun()
+        return
+
+    values = store["values"]
+    shap_frame = pd.DataFrame(values, columns=features)
+    importance = global_importance(values, features)
+
+    tab1, tab2, tab3 = st.tabs(["🌐 Global Importance", "📉 Dependence", "🧑‍🎓 Student Explanation"])
+
+    with tab1:
+        with profiling.span("figure global importance"):
+            top = st.slider("Features shown", 5, len(features), 20)
+            shown = importance.head(top)[::-1]
+            fig, ax = plt.subplots(figsize=(7, 0.3 * top + 1))
+            ax.barh(shown.index, shown.to_numpy(), color="#6366f1")
+            ax.set_xlabel("Mean |SHAP value| (log-odds)")
+            st.pyplot(fig)
+            plt.close(fig)
+
+    with tab2:
+        with profiling.span("figure dependence"):
+            feature = st.selectbox("Feature", list(importance.index))
+            fig, ax = plt.subplots()
+            scatter = ax.scatter(holdout[feature], shap_frame[feature], c=holdout[TARGET],
+                                 cmap="coolwarm", s=12, alpha=0.7)
+            ax.axhline(0, color="#9ca3af", linewidth=1)
+            ax.set_xlabel(feature)
+            ax.set_ylabel(f"SHAP value of {feature}")
+            ax.legend(*scatter.legend_elements(), title=TARGET)
+            st.pyplot(fig)
+            plt.close(fig)
+
+    with tab3:
+        with profiling.span("figure waterfall"):
+            row = st.number_input("Holdout row", 0, len(holdout) - 1, 0)
+            base_value = float(store["base_value"])
+            contributions = shap_frame.iloc[row]
+            log_odds = base_value + contributions.sum()
+            col1, col2 = st.columns(2)
+            col1.metric("Predicted risk", f"{1 / (1 + np.exp(-log_odds)):.1%}")
+            col2.metric("Actual", "Repeater" if holdout[TARGET].iloc[row] == 1 else "Non-repeater")
+            fig = _waterfall(contributions, base_value)
+            st.pyplot(fig)
+            plt.close(fig)
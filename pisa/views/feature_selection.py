@@ -0,0 +1,67 @@
+"""⚙️ Feature Selection page."""
+import matplotlib.pyplot as plt
+import streamlit as st
+
+from pisa import assets, profiling
+
+
+@profiling.loader(st.cache_data)
+def feature_reduction_chart():
+    """PNG of the feature reduction pie; its numbers are fixed, so it is drawn once."""
+    labels = ['Missing Values', 'Collinearity', 'Irrelevance', 'Feature Engineering', 'Retained']
+    sizes = [863, 55, 243, 27, 90]
+    colors = ['#ef4444', '#f59e0b', '#10b981', '#3b82f6', '#6366f1']
+
+    fig, ax = plt.subplots()
+    ax.pie(sizes, labels=labels, colors=colors, autopct='%1.1f%%',
+           startangle=90, wedgeprops={'edgecolor': 'white'})
+    ax.axis('equal')
+    return assets.figure_png(fig)
+
+
+def render():
+    st.header("Data Preparation & Feature Selection")
+        
+    with st.expander("🔧 Feature Engineering Process (Summary)", expanded=True):
+        col1, col2 = st.columns([1, 2])
+        with col1:
+            st.markdown("""
+            **Original Features**: 1,278  
+            **Final Features**: 90  
+            
+            **Feature Reduction**:
+            - 863: High missing values (484 empty)
+            - 55: Collinear features
+            - 243: Irrelevant features
+            - 33: Feature Engineering
+            """)
+
+        # with col2:
+        #     st.image("images/0_Data_Prep_Funnel_Chart.png", 
+        #             caption="Figure 1: Feature Engineering Funnel Chart",
+        #             use_container_width=True)
+        
+        with col2:
+            st.image(feature_reduction_chart(), use_container_width=True)
+
+    with st.expander("🔧 Feature Engineering Process (Detailed)", expanded=True):
+        col1, col2 = st.columns([3, 2])
+        with col1:
+            with profiling.span("image 0_Data_Prep_Funnel_Chart.png"):
+                st.image(assets.image("0_Data_Prep_Funnel_Chart.png"),
+                        caption="Figure 1: Feature Engineering Funnel Chart",
+                        use_container_width=True)
+            
+        with col2:
+            st.markdown("""
+            **Key Observations about the Dataset**:  
+            The dataset initially contained **1,278 features**, but it underwent significant refinement to ensure quality and relevance.  
+    
+            - **863 features** were removed because they exceeded the **20% missing value threshold**, with **484 of these being completely empty**, rendering them unusable for analysis.  
+            - An additional **55 features** were eliminated due to **collinearity**, as they provided redundant information.  
+            - **243 features** were removed for being **irrelevant** to the study's objectives, streamlining the dataset further.  
+            - **33 features**, which represented scores in **Math, Reading, and Science**, were consolidated into **two (2) representative features**, reducing dimensionality while preserving critical information.  
+            - Finally, **4 new features** were added after applying **One Hot Encoding and VIF filtering**, enhancing the dataset's quality and utility.  
+    
+            By the end of this rigorous filtering process, the dataset was optimized for analysis, retaining only the **90** most meaningful and actionable features.  
+            """)
@@ -0,0 +1,190 @@
+"""🤖 Final Model page."""
+import matplotlib.pyplot as plt
+import pandas as pd
+import streamlit as st
+
+from pisa import profiling, store
+from pisa.single import SingleRowScorer
+from pisa.views import current_snapshot
+
+@profiling.loader(st.cache_data)
+def load_columns(columns):
+    """Column-projected read for the Feature Browser."""
+    return store.load_columns(list(columns))
+
+
+@st.cache_data
+def feature_widgets(df, features):
+    """Slider/checkbox spec per feature: ``(name, binary, low, high, default, step)``."""
+    specs = []
+    for name in features:
+        column = df[name]
+        low, high, median = column.min(), column.max(), column.median()
+        integral = pd.api.types.is_integer_dtype(column) or (column % 1 == 0).all()
+        binary = integral and set(column.unique()) <= {0, 1}
+        if integral:
+            specs.append((name, binary, int(low), int(high), int(round(median)), 1))
+        else:
+            step = round(float(high - low) / 100, 4) or 0.0001
+            specs.append((name, False, float(low), float(high), float(median), step))
+    return specs
+
+
+def _reset_what_if(specs, overwrite=True):
+    for name, binary, _, _, default, _ in specs:
+        key = f"whatif_{name}"
+        if overwrite or key not in st.session_state:
+            st.session_state[key] = bool(default) if binary else default
+
+
+@st.fragment
+def threshold_analysis(sweep):
+    """Move the operating point along a precomputed sweep; nothing is rescored."""
+    st.write("### Threshold Analysis")
+    threshold = st.slider("Decision threshold", 0.0, 1.0, 0.5, 0.01, key="operating_threshold",
+                          help="Students scoring at or above the threshold are flagged as at risk")
+    point = sweep.at(threshold)
+
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Precision", f"{point['precision']:.2f}")
+    col2.metric("Recall", f"{point['recall']:.2f}")
+    col3.metric("F1 Score", f"{point['f1']:.2f}")
+    col4.metric("Flagged", f"{point['tp'] + point['fp']:,}")
+    st.caption(f"Highest F1 at threshold {sweep.best_f1():.2f}")
+
+    st.dataframe(pd.DataFrame(
+        [[point["tn"], point["fp"]], [point["fn"], point["tp"]]],
+        index=["Actual non-repeater", "Actual repeater"],
+        columns=["Predicted non-repeater", "Predicted repeater"],
+    ))
+
+    with profiling.span("figure threshold curves"):
+        fpr, recall, precision = sweep.curves()
+        fig, (roc_ax, pr_ax) = plt.subplots(1, 2, figsize=(10, 4))
+        roc_ax.plot(fpr, recall, color="#6366f1")
+        roc_ax.plot([0, 1], [0, 1], color="#9ca3af", linestyle="--", linewidth=1)
+        roc_ax.scatter([point["fpr"]], [point["recall"]], color="#ef4444", zorder=3)
+        roc_ax.set(xlabel="False positive rate", ylabel="True positive rate",
+                   title=f"ROC (AUC {sweep.roc_auc:.2f})")
+        pr_ax.plot(recall, precision, color="#6366f1")
+        pr_ax.scatter([point["recall"]], [point["precision"]], color="#ef4444", zorder=3)
+        pr_ax.set(xlabel="Recall", ylabel="Precision",
+                  title=f"Precision-Recall (AP {sweep.average_precision:.2f})")
+        st.pyplot(fig)
+        plt.close(fig)
+
+
+@st.fragment
+def what_if(model, holdout_data):
+    """Live single-student risk over every model feature, starting from holdout medians."""
+    st.subheader("Predict Student Risk")
+    # Rebuilt when the warm-up worker publishes a new model
+    if st.session_state.get("what_if_model") is not model:
+        st.session_state["what_if_scorer"] = SingleRowScorer(model)
+        st.session_state["what_if_model"] = model
+    scorer = st.session_state["what_if_scorer"]
+    specs = feature_widgets(holdout_data, scorer.feature_names)
+
+    _reset_what_if(specs, overwrite=False)
+
+    risk = st.empty()
+    st.button("Reset to holdout medians", on_click=_reset_what_if, args=(specs,))
+    with st.expander("Student features", expanded=False):
+        cols = st.columns(3)
+        for i, (name, binary, low, high, _, step) in enumerate(specs):
+            with cols[i % 3]:
+                if binary:
+                    value = st.checkbox(name, key=f"whatif_{name}")
+                else:
+                    value = st.slider(name, low, high, step=step, key=f"whatif_{name}")
+            scorer.set(name, float(value))
+
+    prediction = scorer.proba()
+    risk.metric("Grade Repetition Risk",
+                f"{prediction:.1%}",
+                "High Risk" if prediction > 0.5 else "Low Risk",
+                delta_color="inverse" if prediction > 0.5 else "normal")
+
+
+def render():
+    st.header("Grade Repetition Predictor")
+
+    # Model, holdout and everything derived from them come from the snapshot
+    # published by the warm-up worker (see pisa.warmup); one per rerun
+    with st.spinner("Loading resources..."):
+        snapshot = current_snapshot()
+    model, holdout_data = snapshot.model, snapshot.holdout
+
+    st.header("Holdout Data Preview")
+    st.write(holdout_data.head(5))
+    
+    # Column exploration section
+    with st.container():
+        st.write("Explore the features in the holdout dataset:")
+        
+        # Display column names with checkboxes
+        col1, col2 = st.columns([2, 3])
+        
+        with col1:
+            st.write("### Feature Browser")
+            columns = store.column_names()
+            selected_columns = st.multiselect(
+                "Select features to display",
+                options=columns,
+                default=columns[:5]  # Show first 5 columns by default
+            )
+        
+        browsed = load_columns(tuple(selected_columns))
+        
+        with col2:
+            st.write("### Feature Data Preview")
+            if selected_columns:
+                st.dataframe(
+                    browsed.head(),
+                    use_container_width=True,
+                    height=300
+                )
+            else:
+                st.warning("No features selected. Please choose features to view data.")
+        
+        # Display summary statistics, looked up in the precomputed index
+        st.write("### Summary Statistics")
+        stats_index = snapshot.stats
+        by_class = st.checkbox("Break down by REPEAT")
+        if by_class:
+            summary_stats = stats_index.describe_by_class(selected_columns)
+        else:
+            summary_stats = stats_index.describe(selected_columns)
+        st.dataframe(
+            summary_stats,
+            use_container_width=True
+        )
+
+    # Predictions, the threshold sweep and the 95% bootstrap intervals were
+    # computed by the warm-up worker, so the page never runs inference
+    sweep, intervals = snapshot.sweep, snapshot.intervals
+    metrics = sweep.at(0.5)
+
+    # Create columns for metrics
+    st.write("Model Performance Metrics:")
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.metric("Precision", f"{metrics['precision']:.2f}")
+        st.caption("95% CI {:.2f} – {:.2f}".format(*intervals["precision"]))
+    
+    with col2:
+        st.metric("F1 Score", f"{metrics['f1']:.2f}")
+        st.caption("95% CI {:.2f} – {:.2f}".format(*intervals["f1"]))
+    
+    with col3:
+        st.metric("ROC AUC", f"{sweep.roc_auc:.2f}")
+        st.caption("95% CI {:.2f} – {:.2f}".format(*intervals["roc_auc"]))
+
+    st.success("Model performance metrics loaded successfully!")
+
+    threshold_analysis(sweep)
+
+    # Prediction form
+    with profiling.span("what-if form"):
+        what_if(model, holdout_data)
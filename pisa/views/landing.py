@@ -0,0 +1,90 @@
+"""🏠 Landing Page."""
+import streamlit as st
+
+from pisa import assets
+
+
+def render():
+    # Hero Section
+    col1, col2 = st.columns([2, 3])
+    with col1:
+        st.markdown("""
+        <div style="margin-top: 20px;">
+            <h1 style="font-size: 2.5rem; color: #3730a3;">PISA 2022 Philippines</h1>
+            <h2 style="font-size: 1.8rem; color: #4f46e5;">Grade Repetition Analysis</h2>
+            <p style="font-size: 1.1rem; color: #6b7280; margin-top: 20px;">
+                This analysis examines the factors contributing to grade repetition among Filipino students 
+                based on the PISA 2022 dataset. Our goal is to identify key predictors and provide 
+                actionable recommendations.
+            </p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        # Local WebP copy once scripts/build_assets.py has fetched it, the URL until then
+        st.image(assets.hero(), use_container_width=True, caption="Philippine Students")
+
+    # Key Metrics Cards
+    st.markdown('<div class="divider"></div>', unsafe_allow_html=True)
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.markdown("""
+        <div class="metric-card">
+            <h3 style="color: #3730a3; margin: 0;">👨 Total Students</h3>
+            <p style="font-size: 2rem; margin: 10px 0;">7,193</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown("""
+        <div class="metric-card">
+            <h3 style="color: #3730a3; margin: 0;">📈 Repetition Rate</h3>
+            <p style="font-size: 2rem; margin: 10px 0;">25.4%</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col3:
+        st.markdown("""
+        <div class="metric-card">
+            <h3 style="color: #3730a3; margin: 0;">📋 Features Analyzed</h3>
+            <p style="font-size: 2rem; margin: 10px 0;">90</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    # Key Findings
+    st.markdown('<div class="divider"></div>', unsafe_allow_html=True)
+    st.header("Key Findings")
+    
+    findings = [
+        {"icon": "📚", "title": "Access to Books", 
+         "content": "Fewer books of certain types don’t raise the likelihood of predicting a student as a repeater."},
+        {"icon": "🎓", "title": "School Engagement", 
+         "content": "A student's engagement in school plays a factor in repeating a grade."},
+        {"icon": "💻", "title": "Digital Access and Usage", 
+         "content": "Less access to digital tools as well as improper usage plays a factor in repeating a grade."},
+        {"icon": "⏳", "title": "Learning Time", 
+         "content": "More time spent learning leads to better performance and a lower chance of repeating a grade."},
+        {"icon": "📅", "title": "School Absences", 
+         "content": "Prolonged absence in school increases the chance of repeating a grade."},
+        {"icon": "❤️", "title": "Sense of Belonging", 
+         "content": "Increased feelings of safety and belongingness lower the chance of repeating a grade."},
+        {"icon": "🧠", "title": "Student Curiosity and Engagement", 
+         "content": "The more curious and engaged a student is, the lower the chance of repeating a grade."}
+    ]
+    
+    # Create two rows of columns
+    for i in range(2):
+        cols = st.columns(3)
+        for j in range(3):
+            idx = i * 3 + j
+            if idx >= len(findings):
+                break
+            finding = findings[idx]
+            with cols[j]:
+                st.markdown(f"""
+                <div class="metric-card">
+                    <div style="font-size: 2rem; margin-bottom: 10px;">{finding['icon']}</div>
+                    <h3 style="color: #3730a3; margin: 0 0 10px 0;">{finding['title']}</h3>
+                    <p style="color: #6b7280;">{finding['content']}</p>
+                </div>
+                """, unsafe_allow_html=True)
@@ -0,0 +1,67 @@
+"""🔄 Machine Learning Pipeline page."""
+import pandas as pd
+import streamlit as st
+
+from pisa import assets, profiling
+from pisa.comparison import load_results, observations
+
+METRIC_LABELS = {
+    "train_recall": "Train Recall",
+    "validation_recall": "Validation Recall",
+    "holdout_recall": "Holdout Recall",
+}
+
+# Shown until scripts/compare_models.py has written data/baseline_results.json
+BASELINE_RESULTS = {
+    "Metric": ["Train Recall", "Validation Recall", "Holdout Recall"],
+    "Decision Tree": ['100%', '55.05%', '64.20%'],
+    "Random Forest": ['100%', '59.63%', '55.80%'],
+    "Gradient Boosting": ['69.14%', '62.68%', '58.93%'],
+    "AdaBoost": ['86.38%', '63.64%', '58.71%'],
+    "XGBoost": ['87.59%', '61.65%', '67.16%'],
+    "CatBoost": ['88.45%', '61.72%', '67.16%'],
+}
+
+
+def baseline_table():
+    """``(table, notes, caption)`` from the harness results, or the recorded baseline."""
+    results = load_results()
+    if results is None:
+        df = pd.DataFrame(BASELINE_RESULTS).set_index("Metric")
+        models = {name: {key: float(df.loc[label, name].rstrip("%")) / 100
+                         for key, label in METRIC_LABELS.items()} for name in df.columns}
+        caption = "Recorded baseline. Run `python -m scripts.compare_models` to regenerate it."
+        return df, observations(models), caption
+
+    models = results["models"]
+    df = pd.DataFrame({name: [f"{m[key]:.2%}" for key in METRIC_LABELS] for name, m in models.items()},
+                      index=pd.Index(list(METRIC_LABELS.values()), name="Metric"))
+    caption = (f"{results['folds']}-fold cross-validation on {results['train_rows']:,} training rows, "
+               f"holdout of {results['holdout_rows']:,} rows; generated {results['generated']}.")
+    return df, results["observations"], caption
+
+
+def render():
+    st.header("Machine Learning Pipeline")
+    
+    # Title block with image
+    with profiling.span("image 7_MS_Pipeline.png"):
+        st.image(assets.image("7_MS_Pipeline.png", 1440),
+                caption="Figure 1: Machine Learning Pipeline",
+                use_container_width=True)
+    
+    with st.expander("📊 Baseline Results", expanded=True):
+        st.subheader("Model Performance Comparison (Baseline)")
+        
+        # Create a table of baseline results
+        st.markdown("### Baseline Metrics")
+        
+        # Written by scripts/compare_models.py
+        df, notes, caption = baseline_table()
+        
+        # Display the table
+        st.table(df)
+        st.caption(caption)
+        
+        # Add interpretation of results
+        st.markdown("### Key Observations:\n" + "\n".join(f"- {note}" for note in notes))
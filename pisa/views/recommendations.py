@@ -0,0 +1,108 @@
+"""🎯 Recommendations page: per-student counterfactual interventions from the model."""
+import io
+
+import matplotlib.pyplot as plt
+import pandas as pd
+import streamlit as st
+
+from pisa import HOLDOUT_PATH, TARGET, profiling, warmup
+from pisa.counterfactual import ACTIONABLE, CounterfactualSearch, actions_from
+from pisa.views import current_snapshot
+
+
+@profiling.loader(st.cache_resource)
+def load_search(threshold, max_changes, version):
+    """Search over the actionable features, with candidate values from the holdout.
+
+    ``version`` is the snapshot's, so a newly published model or holdout rebuilds it.
+    """
+    snapshot = warmup.snapshot()
+    return CounterfactualSearch(snapshot.model, actions_from(snapshot.holdout), threshold, max_changes)
+
+
+@st.cache_data(show_spinner="Searching for recommendations...")
+def recommend_file(data, name, threshold, max_changes, version):
+    """``(summary, changes)`` for every student in ``data`` (CSV bytes; ``name`` is for display)."""
+    roster = pd.read_csv(io.BytesIO(data))
+    search = load_search(threshold, max_changes, version)
+    return search.search(roster.drop(columns=[TARGET], errors="ignore"))
+
+
+def _describe(changes):
+    """One line per student: the recommended changes in order."""
+    text = [f"{label}: {current:.3g} → {suggested:.3g}"
+            for label, current, suggested in zip(changes["label"], changes["current"], changes["suggested"])]
+    return pd.Series(text, index=changes.index).groupby(changes["student"], sort=False).agg("; ".join)
+
+
+def render():
+    st.header("Personalized Recommendations")
+    version = current_snapshot().version
+    st.markdown("""
+    For every student the model flags, the smallest changes to actionable factors (attendance,
+    punctuality, homework, digital habits, ICT resources and family support) that bring the
+    predicted risk below the threshold. Factors only move in their helpful direction and to
+    values observed among Filipino students; the search runs over the whole roster at once.
+    """)
+
+    uploaded = st.file_uploader("School roster (CSV with the model's feature columns)", type="csv")
+    if uploaded is None:
+        st.info("Upload a roster to get recommendations for its students; the holdout is shown below.")
+        data, name = HOLDOUT_PATH.read_bytes(), HOLDOUT_PATH.name
+    else:
+        data, name = uploaded.getvalue(), uploaded.name
+
+    col1, col2 = st.columns(2)
+    threshold = col1.slider("Risk threshold", 0.05, 0.95, 0.5, 0.05,
+                            help="Students scoring at or above the threshold are flagged as at risk")
+    max_changes = col2.slider("Most changes per student", 1, len(ACTIONABLE), 3)
+
+    with profiling.span("counterfactual search", kind="loader"):
+        try:
+            summary, changes = recommend_file(data, name, threshold, max_changes, version)
+        except KeyError as e:
+            st.error(f"The roster is missing model features: {e}")
+            return
+
+    at_risk = summary[summary["at_risk"]]
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Students", f"{len(summary):,}")
+    col2.metric("Flagged at Risk", f"{len(at_risk):,}")
+    col3.metric("Brought Below Threshold", f"{at_risk['reached'].sum():,}")
+    col4.metric("Mean Risk Reduction", "–" if at_risk.empty else
+                f"{(at_risk['risk'] - at_risk['new_risk']).mean():.1%}")
+    if at_risk.empty:
+        st.success("No student is at or above the threshold.")
+        return
+
+    st.write("### Recommendations by Student")
+    table = at_risk[["risk", "new_risk", "reached", "changes"]].assign(
+        recommendations=_describe(changes)).sort_values("risk", ascending=False)
+    st.dataframe(table.style.format({"risk": "{:.1%}", "new_risk": "{:.1%}"}, na_rep="–"),
+                 use_container_width=True)
+    st.download_button("Download recommendations (CSV)", changes.to_csv(index=False),
+                       file_name=f"recommendations_{name}", mime="text/csv")
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.write("### Most Frequent Interventions")
+        with profiling.span("figure interventions"):
+            counts = changes["label"].value_counts().sort_values()
+            fig, ax = plt.subplots(figsize=(6, 0.35 * len(counts) + 1))
+            ax.barh(counts.index, counts.values, color="#6366f1")
+            ax.set_xlabel("Students")
+            st.pyplot(fig)
+            plt.close(fig)
+
+    with col2:
+        st.write("### Student Detail")
+        student = st.selectbox("Student (row of the roster)", list(table.index))
+        steps = changes[changes["student"] == student]
+        st.metric("Predicted Risk", f"{summary.at[student, 'new_risk']:.1%}",
+                  f"{summary.at[student, 'new_risk'] - summary.at[student, 'risk']:+.1%}",
+                  delta_color="inverse")
+        if steps.empty:
+            st.warning("No actionable change lowers this student's risk.")
+        for row in steps.itertuples():
+            st.markdown(f"**{row.step}. {row.label}:** {row.current:.3g} → {row.suggested:.3g} "
+                        f"(risk {row.risk_after:.1%})")
@@ -0,0 +1,63 @@
+"""🧭 Segment Analysis page: model performance by cohort, from the segment cube."""
+import matplotlib.pyplot as plt
+import streamlit as st
+
+from pisa import profiling
+from pisa.segments import PROBA_BANDS, SEGMENTS, segment_metrics, segment_table
+from pisa.views import current_snapshot
+
+
+def render():
+    st.header("Segment Analysis")
+    st.markdown("Repetition rates, predicted risk and model performance for any cohort of the holdout.")
+
+    # Built by the warm-up worker for the published model and holdout
+    cube = current_snapshot().segments
+    dimensions = {d.name: d for d in cube.dimensions}
+
+    # Empty selections mean "all"; every answer is a sum over cube cells
+    filters = {}
+    columns = st.columns(len(SEGMENTS))
+    for column, (label, name) in zip(columns, SEGMENTS.items()):
+        chosen = column.multiselect(label, dimensions[name].labels, placeholder="All")
+        if chosen:
+            filters[name] = chosen
+    threshold = st.slider("Decision threshold", 0.0, 1.0, 0.5, 1 / PROBA_BANDS,
+                          help="Students scoring at or above the threshold are flagged as at risk")
+
+    metrics = segment_metrics(cube, filters, threshold)
+    if not metrics["students"]:
+        st.warning("No students in this segment.")
+        return
+
+    col1, col2, col3, col4, col5 = st.columns(5)
+    col1.metric("Students", f"{metrics['students']:,.0f}")
+    col2.metric("Repetition Rate", f"{metrics['repetition_rate']:.1%}")
+    col3.metric("Mean Predicted Risk", f"{metrics['mean_risk']:.1%}")
+    col4.metric("Precision", "–" if metrics["flagged"] == 0 else f"{metrics['precision']:.2f}")
+    col5.metric("Recall", "–" if metrics["repetition_rate"] == 0 else f"{metrics['recall']:.2f}")
+
+    st.write("### Breakdown")
+    label = st.selectbox("Break down by", list(SEGMENTS))
+    table = segment_table(cube, SEGMENTS[label], filters, threshold)
+    st.dataframe(
+        table.style.format({
+            "students": "{:,.0f}", "flagged": "{:,.0f}", "repetition_rate": "{:.1%}",
+            "mean_risk": "{:.1%}", "precision": "{:.2f}", "recall": "{:.2f}",
+        }, na_rep="–"),
+        use_container_width=True,
+    )
+
+    with profiling.span("figure segments"):
+        fig, ax = plt.subplots(figsize=(8, 0.45 * len(table) + 1.2))
+        positions = range(len(table))
+        ax.barh([p + 0.2 for p in positions], table["repetition_rate"], height=0.4,
+                color="#fc8d62", label="Repetition rate")
+        ax.barh([p - 0.2 for p in positions], table["mean_risk"], height=0.4,
+                color="#6366f1", label="Mean predicted risk")
+        ax.set_yticks(list(positions), [str(index) for index in table.index])
+        ax.invert_yaxis()
+        ax.xaxis.set_major_formatter(lambda x, _: f"{x:.0%}")
+        ax.legend(loc="lower right")
+        st.pyplot(fig)
+        plt.close(fig)
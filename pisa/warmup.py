@@ -0,0 +1,178 @@
+"""Background warm-up: one worker thread owns the model, the data and what is derived from them.
+
+Sessions never load or compute these themselves. The worker builds a
+``Snapshot`` holding the loaded model, the holdout, its predictions and the
+precomputed aggregates (threshold sweep, bootstrap intervals, summary index,
+segment cube, drift reference), then publishes it by swapping one reference.
+A session takes the current snapshot once per rerun and reads only that, so
+every page of a rerun sees one consistent version.
+
+The worker polls the model pickle and the holdout CSV. The artifact is not
+watched: it is derived from the pickle, and the build itself may re-export it
+(see ``pisa.model.load_model``), which must not count as a change. When a
+watched file changes the worker builds the next snapshot in the background while sessions keep reading the previous
+one, then swaps it in; if the build fails the previous snapshot stays
+published. Only the very first snapshot of a process is waited for:
+``scripts/run_app.py`` starts the worker before the server accepts sessions,
+and ``scripts/warmup.py`` fills the disk cache beforehand so that build only
+reads results back. The model, data and aggregate modules are imported by the
+build on the worker thread, so importing this module (as ``app.py`` does on
+the first run) stays cheap.
+"""
+import logging
+import os
+import threading
+import time
+
+from pisa import HOLDOUT_PATH, MODEL_PATH, TARGET
+
+logger = logging.getLogger(__name__)
+
+POLL_SECONDS = 2.0
+
+WATCHED_PATHS = (MODEL_PATH, HOLDOUT_PATH)
+
+
+def source_stamp(paths=WATCHED_PATHS):
+    """``(path, size, mtime)`` of every watched file; missing files stamp as ``None``."""
+    stamp = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            stamp.append((str(path), stat.st_size, stat.st_mtime_ns))
+        except FileNotFoundError:
+            stamp.append((str(path), None, None))
+    return tuple(stamp)
+
+
+class Snapshot:
+    """Everything sessions read, built together from one version of the model and the data.
+
+    Published snapshots are never modified: treat the frames and arrays in
+    them as read-only. A refresh builds a new snapshot.
+    """
+
+    __slots__ = ("version", "stamp", "model", "holdout", "proba", "sweep", "intervals",
+                 "stats", "segments", "drift_reference", "seconds")
+
+    def __init__(self, **fields):
+        for name in self.__slots__:
+            object.__setattr__(self, name, fields[name])
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Snapshots are immutable")
+
+    def __repr__(self):
+        return f"Snapshot(version={self.version}, rows={len(self.holdout)}, seconds={self.seconds:.1f})"
+
+
+def build_snapshot(version=1):
+    """Load the model and the holdout and compute everything derived from them.
+
+    Derived values go through the disk cache, so rebuilding an unchanged
+    version only reads them back.
+    """
+    from pisa import model as pisa_model
+    from pisa import store
+    from pisa.bootstrap import BOOTSTRAP_VERSION, bootstrap_ci
+    from pisa.cache import cached, cached_proba
+    from pisa.drift import load_reference
+    from pisa.segments import load_segment_cube
+    from pisa.stats import load_index
+    from pisa.thresholds import THRESHOLDS_VERSION, ThresholdSweep
+
+    start = time.perf_counter()
+    # Stamped before loading, so a file replaced mid-build triggers another refresh
+    stamp = source_stamp()
+    model = pisa_model.load_model()
+    holdout = store.load_columns()
+    X, y = holdout.drop(columns=TARGET), holdout[TARGET]
+    proba = cached_proba(model, X)
+    proba.flags.writeable = False
+    return Snapshot(
+        version=version, stamp=stamp, model=model, holdout=holdout, proba=proba,
+        sweep=cached("threshold-sweep", model, X, y, compute=lambda: ThresholdSweep(y, proba),
+                     version=THRESHOLDS_VERSION),
+        intervals=cached("bootstrap-ci", model, X, y, compute=lambda: bootstrap_ci(y, proba),
+                         version=BOOTSTRAP_VERSION),
+        stats=load_index(),
+        segments=load_segment_cube(model),
+        drift_reference=load_reference(model),
+        seconds=time.perf_counter() - start,
+    )
+
+
+class Worker:
+    """Builds snapshots on a daemon thread and publishes them with an atomic swap."""
+
+    def __init__(self, poll=POLL_SECONDS, build=build_snapshot, paths=WATCHED_PATHS):
+        self.poll = poll
+        self.paths = paths
+        self.error = None
+        self._build = build
+        self._snapshot = None
+        self._published = threading.Event()
+        self._stopping = threading.Event()
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def start(self):
+        """Start the thread unless it is already running."""
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._stopping.clear()
+                self._thread = threading.Thread(target=self._run, name="pisa-warmup", daemon=True)
+                self._thread.start()
+        return self
+
+    def stop(self, timeout=None):
+        self._stopping.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _run(self):
+        stamp = None
+        while not self._stopping.is_set():
+            current = source_stamp(self.paths)
+            if current != stamp:
+                version = self._snapshot.version + 1 if self._snapshot else 1
+                try:
+                    snapshot = self._build(version=version)
+                except Exception as e:
+                    # Keep serving the previous snapshot; retry when the files change again
+                    logger.exception("Building snapshot %d failed", version)
+                    self.error = e
+                else:
+                    self._snapshot = snapshot
+                    self.error = None
+                    logger.info("Published %r", snapshot)
+                stamp = current
+                self._published.set()
+            self._stopping.wait(self.poll)
+
+    def snapshot(self, timeout=None):
+        """The latest published snapshot, waiting for the first one if there is none yet."""
+        if not self._published.wait(timeout):
+            raise TimeoutError("No snapshot has been published yet")
+        snapshot = self._snapshot
+        if snapshot is None:
+            raise RuntimeError(f"Warm-up failed: {self.error}") from self.error
+        return snapshot
+
+
+_default = None
+_default_lock = threading.Lock()
+
+
+def default_worker():
+    """Process-wide worker shared by all sessions, started on first use."""
+    global _default
+    with _default_lock:
+        if _default is None:
+            _default = Worker()
+        return _default.start()
+
+
+def snapshot(timeout=None):
+    """The current snapshot of the process-wide worker."""
+    return default_worker().snapshot(timeout)
@@ -0,0 +1,32 @@
+"""Build the web-sized image variants the dashboard serves.
+
+Writes WebP copies of every PNG under images/ at the widths in
+pisa.assets.WIDTHS, and downloads the landing-page hero image so the app no
+longer fetches it from the network. Pages build missing variants on demand,
+so this only moves that work ahead of the first page load.
+
+Usage:
+    python -m scripts.build_assets && streamlit run app.py
+"""
+import argparse
+import os
+
+from pisa.assets import HERO_URL, build_all
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--hero-url", default=HERO_URL)
+    args = parser.parse_args(argv)
+
+    for source, paths in build_all(args.hero_url).items():
+        if paths is None:
+            print(f"{os.path.basename(source)}: download failed, pages will use {args.hero_url}")
+            continue
+        original = os.path.getsize(source)
+        sizes = ", ".join(f"{os.path.getsize(p) / 1024:.0f} KB" for p in paths)
+        print(f"{os.path.basename(source)} ({original / 1024:.0f} KB) -> {sizes}")
+
+
+if __name__ == "__main__":
+    main()
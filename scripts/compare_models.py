@@ -0,0 +1,48 @@
+"""Regenerate the Baseline Results table of the Machine Learning Pipeline page.
+
+Cross-validates every baseline model family on the training set, scores the
+holdout and writes data/baseline_results.json. Finished fits are checkpointed
+in the cache directory, so rerunning after an interruption resumes the sweep.
+
+Usage:
+    python -m scripts.compare_models --train data/train.csv --jobs 8
+"""
+import argparse
+import time
+
+import pandas as pd
+
+from pisa import HOLDOUT_PATH
+from pisa.comparison import RESULTS_PATH, model_families, run_comparison, save_results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--train", required=True, help="training CSV with the feature columns and REPEAT")
+    parser.add_argument("--holdout", default=str(HOLDOUT_PATH))
+    parser.add_argument("--out", default=str(RESULTS_PATH))
+    parser.add_argument("--folds", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--jobs", type=int, default=-1, help="parallel fits (default: all cores)")
+    parser.add_argument("--models", nargs="+", help="subset of model families to run")
+    args = parser.parse_args(argv)
+
+    families = model_families(args.seed)
+    if args.models:
+        unknown = set(args.models) - set(families)
+        if unknown:
+            parser.error(f"unknown models {sorted(unknown)}; choose from {list(families)}")
+        families = {name: families[name] for name in args.models}
+
+    train, holdout = pd.read_csv(args.train), pd.read_csv(args.holdout)
+    start = time.perf_counter()
+    results = run_comparison(train, holdout, families, folds=args.folds, seed=args.seed,
+                             n_jobs=args.jobs, verbose=1)
+    save_results(results, args.out)
+
+    print(pd.DataFrame(results["models"]).T.to_string(float_format="{:.3f}".format))
+    print(f"Done in {time.perf_counter() - start:.1f}s -> {args.out}")
+
+
+if __name__ == "__main__":
+    main()
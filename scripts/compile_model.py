@@ -0,0 +1,47 @@
+"""Compile the pickled pipeline into the NumPy oblivious-tree evaluator.
+
+Usage:
+    python -m scripts.compile_model                # writes scripts/gb_tk_cat.npz
+    python -m scripts.compile_model --check        # also verify against the pipeline
+"""
+import argparse
+import sys
+
+import pandas as pd
+
+from pisa import HOLDOUT_PATH, MODEL_PATH, TARGET
+from pisa.model import load_pipeline
+from pisa.oblivious import CompiledModel, max_abs_difference
+
+
+def check(pipeline, compiled, holdout_path=HOLDOUT_PATH, tolerance=1e-9):
+    """Compare probabilities on the holdout; return the max difference and whether it passes."""
+    X = pd.read_csv(holdout_path).drop(columns=[TARGET])
+    difference = max_abs_difference(pipeline, compiled, X)
+    return difference, difference <= tolerance
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--model", default=str(MODEL_PATH), help="pickled model pipeline")
+    parser.add_argument("--output", default=str(MODEL_PATH.with_suffix(".npz")))
+    parser.add_argument("--check", action="store_true",
+                        help="compare predict_proba against the pipeline on the holdout")
+    parser.add_argument("--tolerance", type=float, default=1e-9)
+    args = parser.parse_args(argv)
+
+    pipeline = load_pipeline(args.model)
+    compiled = CompiledModel.from_pipeline(pipeline)
+    compiled.save(args.output)
+    print(f"Compiled {compiled.n_trees} trees of depth {compiled.depth} "
+          f"({len(compiled.borders)} borders) -> {args.output}")
+
+    if args.check:
+        difference, ok = check(pipeline, compiled, tolerance=args.tolerance)
+        print(f"Max |predict_proba difference| on holdout: {difference:.3e}")
+        if not ok:
+            sys.exit(f"Compiled model differs from the pipeline by more than {args.tolerance}")
+
+
+if __name__ == "__main__":
+    main()
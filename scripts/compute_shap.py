@@ -0,0 +1,38 @@
+"""Compute or refresh the stored TreeSHAP values for the holdout.
+
+Only rows that are new or changed since the last run are recomputed.
+
+Usage:
+    python -m scripts.compute_shap --workers 4
+"""
+import argparse
+import os
+import time
+
+import pandas as pd
+
+from pisa import HOLDOUT_PATH
+from pisa.model import load_model
+from pisa.shap_store import store_path, update_store
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--data", default=str(HOLDOUT_PATH), help="CSV with the model's feature columns")
+    parser.add_argument("--model", default=None,
+                        help="model artifact or pickled pipeline (default: artifact if exported)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--batch-rows", type=int, default=2048)
+    args = parser.parse_args(argv)
+
+    model = load_model(args.model, backend="catboost")
+    X = pd.read_csv(args.data)
+    start = time.perf_counter()
+    store = update_store(model, X, model_path=args.model, workers=args.workers,
+                         batch_rows=args.batch_rows)
+    print(f"Computed {store['computed']:,} of {len(X):,} rows in {time.perf_counter() - start:.2f}s "
+          f"-> {store_path(model)}")
+
+
+if __name__ == "__main__":
+    main()
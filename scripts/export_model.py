@@ -0,0 +1,48 @@
+"""Export the pickled pipeline as a memory-mappable inference artifact.
+
+Usage:
+    python -m scripts.export_model            # writes scripts/gb_tk_cat.artifact
+    python -m scripts.export_model --check    # also verify both backends on the holdout
+"""
+import argparse
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from pisa import ARTIFACT_PATH, HOLDOUT_PATH, MODEL_PATH, TARGET
+from pisa.artifact import export_artifact, load_artifact
+from pisa.model import load_pipeline
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--model", default=str(MODEL_PATH), help="pickled model pipeline")
+    parser.add_argument("--output", default=str(ARTIFACT_PATH))
+    parser.add_argument("--check", action="store_true",
+                        help="compare both artifact backends with the pipeline on the holdout")
+    parser.add_argument("--tolerance", type=float, default=1e-9)
+    args = parser.parse_args(argv)
+
+    pipeline = load_pipeline(args.model)
+    manifest = export_artifact(pipeline, args.output, source_path=args.model)
+    print(f"Exported {args.output} ({manifest['data_length']:,} data bytes, sha256 {manifest['sha256'][:12]})")
+
+    start = time.perf_counter()
+    load_artifact(args.output)
+    print(f"Cold load: {(time.perf_counter() - start) * 1000:.2f} ms")
+
+    if args.check:
+        X = pd.read_csv(HOLDOUT_PATH).drop(columns=[TARGET])
+        expected = pipeline.predict_proba(X)[:, 1]
+        for backend in ("numpy", "catboost"):
+            model = load_artifact(args.output, backend=backend)
+            difference = float(np.max(np.abs(model.predict_proba(X)[:, 1] - expected)))
+            print(f"{backend}: max |predict_proba difference| on holdout {difference:.3e}")
+            if difference > args.tolerance:
+                sys.exit(f"{backend} backend differs from the pipeline by more than {args.tolerance}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Load generator for the scoring service.
+
+Opens ``--concurrency`` keep-alive connections that each send requests of
+``--rows`` holdout rows back to back, then reports throughput, client-side
+latency percentiles and the server's batch size histogram.
+
+Usage:
+    python -m scripts.loadgen --concurrency 64 --requests 5000 --rows 1
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+
+import numpy as np
+import pandas as pd
+
+from pisa import HOLDOUT_PATH, TARGET
+
+
+async def _request(reader, writer, host, method, path, body=b""):
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+                 f"Content-Length: {len(body)}\r\n\r\n".encode() + body)
+    await writer.drain()
+    status = (await reader.readline()).split()[1]
+    length = 0
+    while (line := await reader.readline()) not in (b"\r\n", b""):
+        name, _, value = line.decode().partition(":")
+        if name.lower() == "content-length":
+            length = int(value)
+    return int(status), await reader.readexactly(length)
+
+
+async def _client(host, port, bodies, count, latencies):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for _ in range(count):
+            start = time.perf_counter()
+            status, _ = await _request(reader, writer, host, "POST", "/predict", random.choice(bodies))
+            if status != 200:
+                raise RuntimeError(f"Server answered {status}")
+            latencies.append(time.perf_counter() - start)
+    finally:
+        writer.close()
+
+
+async def run(host, port, concurrency, requests, rows):
+    records = pd.read_csv(HOLDOUT_PATH).drop(columns=[TARGET]).to_dict("records")
+    bodies = [json.dumps({"rows": random.sample(records, rows)}).encode() for _ in range(200)]
+
+    latencies = []
+    per_client = [requests // concurrency + (i < requests % concurrency) for i in range(concurrency)]
+    start = time.perf_counter()
+    await asyncio.gather(*(_client(host, port, bodies, n, latencies) for n in per_client))
+    seconds = time.perf_counter() - start
+
+    reader, writer = await asyncio.open_connection(host, port)
+    _, metrics = await _request(reader, writer, host, "GET", "/metrics")
+    writer.close()
+
+    ms = np.array(latencies) * 1000
+    print(f"{len(ms):,} requests x {rows} rows in {seconds:.2f}s: "
+          f"{len(ms) / seconds:,.0f} req/s, {len(ms) * rows / seconds:,.0f} rows/s")
+    print(f"latency ms: p50 {np.percentile(ms, 50):.2f}  p90 {np.percentile(ms, 90):.2f}  "
+          f"p99 {np.percentile(ms, 99):.2f}  max {ms.max():.2f}")
+    batch = json.loads(metrics)["batch_size"]
+    print(f"server batches: {batch['count']:,}, mean size {batch['mean']:.1f}, p99 <= {batch['p99']}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--rows", type=int, default=1, help="rows per request")
+    args = parser.parse_args(argv)
+    asyncio.run(run(args.host, args.port, args.concurrency, args.requests, args.rows))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+"""Start the dashboard with the warm-up worker already building its first snapshot.
+
+``streamlit run app.py`` only executes ``app.py`` when the first session
+connects, so the worker would start then and that visitor would wait for the
+first snapshot. This launcher starts the process-wide worker first and then
+hands over to Streamlit's own command line in the same process, where
+``app.py`` finds the worker running (usually finished).
+
+Usage:
+    python -m scripts.warmup && python -m scripts.run_app --server.port 8501
+"""
+import sys
+
+from pisa import ROOT, warmup
+
+
+def main(argv=None):
+    # Options after the script name are passed on to ``streamlit run``
+    argv = sys.argv[1:] if argv is None else argv
+    # Imported before the worker starts: Streamlit probes optional modules such
+    # as pandas in sys.modules, and must not find them half-imported by the worker
+    from streamlit.web import cli
+
+    warmup.default_worker()
+    cli.main(["run", str(ROOT / "app.py"), *argv], prog_name="streamlit")
+
+
+if __name__ == "__main__":
+    main()
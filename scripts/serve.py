@@ -0,0 +1,42 @@
+"""Run the micro-batching HTTP scoring service.
+
+Usage:
+    python -m scripts.serve --port 8000 --max-batch 256 --max-wait-ms 2
+    curl -X POST localhost:8000/predict -H 'Content-Type: text/csv' --data-binary @data/holdout.csv
+"""
+import argparse
+import asyncio
+
+from pisa.drift import DriftMonitor, load_reference
+from pisa.model import load_model
+from pisa.serving import ScoringServer
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--model", default=None,
+                        help="model artifact or pickled pipeline (default: artifact if exported)")
+    parser.add_argument("--max-batch", type=int, default=256, help="rows per model call")
+    parser.add_argument("--max-wait-ms", type=float, default=2.0,
+                        help="longest a request waits for its batch to fill")
+    parser.add_argument("--threshold", type=float, default=0.5, help="probability cutoff for labels")
+    parser.add_argument("--drift", action="store_true",
+                        help="track drift of the scored rows against the holdout (GET /drift)")
+    args = parser.parse_args(argv)
+
+    # Single rows and small batches on the NumPy evaluator, full batches on CatBoost
+    model = load_model(args.model, backend="auto")
+    drift = DriftMonitor(load_reference(model)) if args.drift else None
+    server = ScoringServer(model, args.max_batch, args.max_wait_ms, args.threshold, drift)
+    print(f"Serving on http://{args.host}:{args.port} "
+          f"(max batch {args.max_batch} rows, max wait {args.max_wait_ms} ms)")
+    try:
+        asyncio.run(server.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""Every artifact backend must score like the pickled pipeline."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from pisa import HOLDOUT_PATH, TARGET
+from pisa.artifact import SMALL_BATCH, export_artifact, load_artifact
+from pisa.model import load_pipeline
+
+
+@pytest.fixture(scope="module")
+def exported(tmp_path_factory):
+    pipeline = load_pipeline()
+    path = tmp_path_factory.mktemp("artifact") / "model.artifact"
+    export_artifact(pipeline, path)
+    return pipeline, path
+
+
+@pytest.fixture(scope="module")
+def holdout_features():
+    return pd.read_csv(HOLDOUT_PATH).drop(columns=[TARGET])
+
+
+@pytest.mark.parametrize("backend", ["numpy", "catboost", "auto"])
+def test_backends_match_pipeline(exported, holdout_features, backend):
+    pipeline, path = exported
+    model = load_artifact(path, backend=backend)
+    for X in (holdout_features.iloc[:1], holdout_features.iloc[:SMALL_BATCH + 1], holdout_features):
+        np.testing.assert_allclose(model.predict_proba(X), pipeline.predict_proba(X), rtol=0, atol=1e-12)
+
+
+def test_auto_loads_catboost_only_for_large_batches(exported, holdout_features):
+    model = load_artifact(exported[1], backend="auto")
+    model.predict_proba(holdout_features.iloc[:SMALL_BATCH])
+    assert model._native is None
+    model.predict_proba(holdout_features.iloc[:SMALL_BATCH + 1])
+    assert model._native is not None
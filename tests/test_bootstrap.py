@@ -0,0 +1,65 @@
+"""Bootstrap intervals must be reproducible and agree with sklearn on every resample."""
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.metrics import f1_score, precision_score, recall_score, roc_auc_score
+
+from pisa import HOLDOUT_PATH, TARGET
+from pisa.bootstrap import (BLOCK, METRICS, bootstrap_ci, bootstrap_metrics, paired_bootstrap,
+                            resample_indices)
+from pisa.model import load_model
+
+
+@pytest.fixture(scope="module")
+def scored():
+    holdout = pd.read_csv(HOLDOUT_PATH)
+    y = holdout[TARGET].to_numpy()
+    return y, load_model().predict_proba(holdout.drop(columns=[TARGET]))[:, 1]
+
+
+def test_fixed_seed_is_reproducible(scored):
+    y, proba = scored
+    first = bootstrap_metrics(y, proba, n_resamples=1200, seed=7)
+    again = bootstrap_metrics(y, proba, n_resamples=1200, seed=7)
+    other = bootstrap_metrics(y, proba, n_resamples=1200, seed=8)
+    for name in METRICS:
+        np.testing.assert_array_equal(first[name], again[name])
+        assert not np.array_equal(first[name], other[name])
+
+
+def test_result_does_not_depend_on_workers(scored):
+    y, proba = scored
+    serial = bootstrap_metrics(y, proba, n_resamples=2 * BLOCK, seed=3, workers=1)
+    pooled = bootstrap_metrics(y, proba, n_resamples=2 * BLOCK, seed=3, workers=2)
+    for name in METRICS:
+        np.testing.assert_array_equal(serial[name], pooled[name])
+
+
+def test_resamples_match_sklearn(scored):
+    y, proba = scored
+    samples = bootstrap_metrics(y, proba, n_resamples=20, seed=5)
+    # The first block is drawn from the first child of the seed
+    rng = np.random.default_rng(np.random.SeedSequence(5).spawn(1)[0])
+    for r, rows in enumerate(resample_indices(len(y), 20, rng)):
+        y_r, proba_r = y[rows], proba[rows]
+        predicted = (proba_r >= 0.5).astype(int)
+        assert samples["precision"][r] == pytest.approx(precision_score(y_r, predicted, zero_division=0))
+        assert samples["recall"][r] == pytest.approx(recall_score(y_r, predicted))
+        assert samples["f1"][r] == pytest.approx(f1_score(y_r, predicted))
+        assert samples["roc_auc"][r] == pytest.approx(roc_auc_score(y_r, proba_r))
+
+
+def test_intervals_contain_point_estimates(scored):
+    y, proba = scored
+    predicted = (proba >= 0.5).astype(int)
+    point = {"precision": precision_score(y, predicted), "recall": recall_score(y, predicted),
+             "f1": f1_score(y, predicted), "roc_auc": roc_auc_score(y, proba)}
+    for name, (low, high) in bootstrap_ci(y, proba, n_resamples=1000, seed=0).items():
+        assert low < point[name] < high
+
+
+def test_paired_bootstrap_of_a_model_with_itself(scored):
+    y, proba = scored
+    for result in paired_bootstrap(y, proba, proba, n_resamples=500).values():
+        assert result["difference"] == (0.0, 0.0)
+        assert result["p_value"] == 1.0
@@ -0,0 +1,52 @@
+"""The compiled oblivious-tree evaluator must reproduce the pickled pipeline."""
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pisa import HOLDOUT_PATH, TARGET
+from pisa.model import load_pipeline
+from pisa.oblivious import CompiledModel
+
+
+@pytest.fixture(scope="module")
+def pipeline():
+    return load_pipeline()
+
+
+@pytest.fixture(scope="module")
+def holdout_features():
+    return pd.read_csv(HOLDOUT_PATH).drop(columns=[TARGET])
+
+
+def test_probabilities_match_pipeline(pipeline, holdout_features):
+    compiled = CompiledModel.from_pipeline(pipeline)
+    expected = np.asarray(pipeline.predict_proba(holdout_features))
+    np.testing.assert_allclose(compiled.predict_proba(holdout_features), expected, rtol=0, atol=1e-12)
+
+
+def test_save_and_load_round_trip(pipeline, holdout_features, tmp_path):
+    compiled = CompiledModel.from_pipeline(pipeline)
+    compiled.save(tmp_path / "model.npz")
+    loaded = CompiledModel.load(tmp_path / "model.npz")
+    np.testing.assert_array_equal(loaded.predict_raw(holdout_features), compiled.predict_raw(holdout_features))
+
+
+def rows_per_second(model, X, repeat=15):
+    """Best-of-``repeat`` scoring rate, which is the least sensitive to other load."""
+    seconds = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        model.predict_proba(X)
+        seconds.append(time.perf_counter() - start)
+    return len(X) / min(seconds)
+
+
+def test_throughput_against_catboost(pipeline, holdout_features):
+    compiled = CompiledModel.from_pipeline(pipeline)
+    one_row, batch = holdout_features.iloc[:1], holdout_features.iloc[:1024]
+    # Single rows are what the evaluator is for: no CatBoost call overhead
+    assert rows_per_second(compiled, one_row) > 1.5 * rows_per_second(pipeline, one_row)
+    # Large batches measured at ~0.7x the pipeline; the first version managed ~0.4x
+    assert rows_per_second(compiled, batch) > 0.55 * rows_per_second(pipeline, batch)
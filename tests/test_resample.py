@@ -0,0 +1,56 @@
+"""The blocked NearMiss kernel must select the same rows as imblearn's NearMiss."""
+import numpy as np
+import pandas as pd
+import pytest
+from imblearn.under_sampling import NearMiss
+from sklearn.preprocessing import MinMaxScaler
+
+from pisa import HOLDOUT_PATH, TARGET, cache, resample
+from pisa.resample import CachedNearMiss, nearest_distances
+
+
+@pytest.fixture(scope="module")
+def training():
+    holdout = pd.read_csv(HOLDOUT_PATH)
+    X = MinMaxScaler().fit_transform(holdout.drop(columns=[TARGET]))
+    return X, holdout[TARGET].to_numpy()
+
+
+@pytest.fixture
+def small_blocks(monkeypatch):
+    # Several query and reference blocks, so the top-k merge is exercised
+    monkeypatch.setattr(resample, "QUERY_BLOCK", 100)
+    monkeypatch.setattr(resample, "REFERENCE_BLOCK", 64)
+
+
+def test_neighbors_match_brute_force(training, small_blocks):
+    X, y = training
+    queries, reference = X[y == 0][:300], X[y == 1]
+    distances, indices = nearest_distances(queries, reference, 5, n_threads=2)
+    expected = np.sqrt(((queries[:, None, :] - reference[None, :, :]) ** 2).sum(axis=2))
+    np.testing.assert_allclose(distances, np.sort(expected, axis=1)[:, :5], atol=1e-12)
+    np.testing.assert_allclose(expected[np.arange(len(queries))[:, None], indices], distances, atol=1e-12)
+
+
+@pytest.mark.parametrize("blocks", ["default", "small_blocks"])
+def test_selection_matches_imblearn(training, blocks, request):
+    if blocks == "small_blocks":
+        request.getfixturevalue(blocks)
+    X, y = training
+    expected = NearMiss(version=1, n_neighbors=3)
+    X_expected, y_expected = expected.fit_resample(X, y)
+    cached = CachedNearMiss(version=1, n_neighbors=3, cache=False)
+    X_actual, y_actual = cached.fit_resample(X, y)
+
+    np.testing.assert_array_equal(cached.sample_indices_, expected.sample_indices_)
+    np.testing.assert_array_equal(X_actual, X_expected)
+    np.testing.assert_array_equal(y_actual, y_expected)
+
+
+def test_selection_is_cached(training, tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, "_default", cache.DiskCache(tmp_path))
+    X, y = training
+    first = CachedNearMiss().fit_resample(X, y)
+    monkeypatch.setattr(CachedNearMiss, "_select", lambda self, X, y: pytest.fail("selection recomputed"))
+    again = CachedNearMiss().fit_resample(X, y)
+    np.testing.assert_array_equal(first[0], again[0])
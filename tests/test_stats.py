@@ -0,0 +1,59 @@
+"""Merging rows into the statistics index must match building it from scratch."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from pisa import HOLDOUT_PATH, TARGET, cache, stats, store
+from pisa.stats import StatsIndex
+
+
+@pytest.fixture(scope="module")
+def holdout():
+    return pd.read_csv(HOLDOUT_PATH)
+
+
+def assert_tables_equal(actual, expected):
+    pd.testing.assert_frame_equal(actual, expected, check_exact=False, rtol=1e-9, atol=1e-9)
+
+
+def test_update_matches_full_rebuild(holdout):
+    full = StatsIndex.build(holdout)
+    merged = StatsIndex.build(holdout.iloc[:500])
+    for start in range(500, len(holdout), 300):
+        merged.update(holdout.iloc[start:start + 300])
+
+    assert merged.rows == full.rows
+    assert_tables_equal(merged.describe(), full.describe())
+    assert_tables_equal(merged.describe_by_class(), full.describe_by_class())
+
+
+def test_describe_matches_pandas(holdout):
+    expected = holdout.describe().T
+    actual = StatsIndex.build(holdout).describe()[expected.columns]
+    assert_tables_equal(actual, expected)
+
+
+def test_load_index_merges_appended_rows(holdout, tmp_path, monkeypatch):
+    monkeypatch.setattr(store, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(cache, "_default", cache.DiskCache(tmp_path / "results"))
+    built, parsed = [], []
+    build, build_store = StatsIndex.build, store.build_store
+    monkeypatch.setattr(StatsIndex, "build", classmethod(lambda cls, df, **kw: built.append(len(df)) or build(df, **kw)))
+    monkeypatch.setattr(store, "build_store", lambda *args, **kw: parsed.append(1) or build_store(*args, **kw))
+
+    csv_path = tmp_path / "holdout.csv"
+    holdout.iloc[:1000].to_csv(csv_path, index=False)
+    first = stats.load_index(csv_path)
+    holdout.iloc[1000:].to_csv(csv_path, mode="a", header=False, index=False)
+    grown = stats.load_index(csv_path)
+
+    # Neither the old rows of the CSV nor those of the index were read again
+    assert built == [1000] and len(parsed) == 1
+    assert first.rows == 1000 and grown.rows == len(holdout)
+    assert_tables_equal(grown.describe(), build(store.load_columns(csv_path=csv_path)).describe())
+
+    # Any other change rebuilds the index
+    holdout.iloc[::-1].to_csv(csv_path, index=False)
+    stats.load_index(csv_path)
+    assert built[1:] == [len(holdout)]
+    assert np.isclose(stats.load_index(csv_path).describe().loc[TARGET, "mean"], holdout[TARGET].mean())
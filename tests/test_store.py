@@ -0,0 +1,65 @@
+"""Appending to the columnar store must give the same columns as rebuilding it."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from pisa import HOLDOUT_PATH, store
+
+
+@pytest.fixture(scope="module")
+def holdout():
+    return pd.read_csv(HOLDOUT_PATH)
+
+
+@pytest.fixture
+def csv_path(tmp_path, monkeypatch):
+    monkeypatch.setattr(store, "CACHE_DIR", tmp_path / "cache")
+    return tmp_path / "holdout.csv"
+
+
+def assert_matches_csv(csv_path):
+    expected = pd.read_csv(csv_path)[store.column_names(csv_path=csv_path)]
+    actual = store.load_columns(csv_path=csv_path)
+    pd.testing.assert_frame_equal(actual.astype(np.float64), expected.astype(np.float64))
+
+
+@pytest.mark.skipif(store.fcntl is None, reason="appends need fcntl")
+def test_appended_rows_are_parsed_alone(holdout, csv_path, monkeypatch):
+    holdout.iloc[:1000].to_csv(csv_path, index=False)
+    before = store.load_columns(csv_path=csv_path)
+    lineage = store.open_store(csv_path)[1]["lineage"]
+
+    monkeypatch.setattr(store, "build_store", lambda *args, **kw: pytest.fail("store rebuilt"))
+    for start, stop in ((1000, 1200), (1200, len(holdout))):
+        holdout.iloc[start:stop].to_csv(csv_path, mode="a", header=False, index=False)
+        assert_matches_csv(csv_path)
+
+    directory, manifest = store.open_store(csv_path)
+    assert manifest["rows"] == len(holdout) and manifest["lineage"] == lineage
+    # Frames mapped before the append still see their own rows
+    pd.testing.assert_frame_equal(before, store.load_columns(csv_path=csv_path).iloc[:1000])
+
+
+@pytest.mark.skipif(store.fcntl is None, reason="appends need fcntl")
+def test_leftovers_of_a_failed_append_are_dropped(holdout, csv_path, monkeypatch):
+    holdout.iloc[:1000].to_csv(csv_path, index=False)
+    store.open_store(csv_path)
+    holdout.iloc[1000:1100].to_csv(csv_path, mode="a", header=False, index=False)
+    write_manifest = store._write_manifest
+    monkeypatch.setattr(store, "_write_manifest", lambda *args: (_ for _ in ()).throw(OSError("disk full")))
+    with pytest.raises(OSError):
+        store.open_store(csv_path)
+
+    monkeypatch.setattr(store, "_write_manifest", write_manifest)
+    assert_matches_csv(csv_path)
+
+
+def test_other_changes_rebuild(holdout, csv_path):
+    holdout.iloc[:1000].to_csv(csv_path, index=False)
+    lineage = store.open_store(csv_path)[1]["lineage"]
+    # Same rows, one edited: the tail before the old end no longer matches
+    edited = holdout.copy()
+    edited.iloc[999, 0] += 1
+    edited.to_csv(csv_path, index=False)
+    assert_matches_csv(csv_path)
+    assert store.open_store(csv_path)[1]["lineage"] != lineage
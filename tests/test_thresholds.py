@@ -0,0 +1,56 @@
+"""The threshold sweep must agree with sklearn's metrics at every operating point."""
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.metrics import (average_precision_score, confusion_matrix, precision_recall_fscore_support,
+                             roc_auc_score, roc_curve)
+
+from pisa import HOLDOUT_PATH, TARGET
+from pisa.model import load_model
+from pisa.thresholds import ThresholdSweep
+
+
+@pytest.fixture(scope="module")
+def scored():
+    holdout = pd.read_csv(HOLDOUT_PATH)
+    y = holdout[TARGET].to_numpy()
+    return y, load_model().predict_proba(holdout.drop(columns=[TARGET]))[:, 1]
+
+
+@pytest.fixture
+def tied():
+    # Coarse scores with many ties, where the per-threshold grouping matters
+    rng = np.random.default_rng(0)
+    return rng.integers(0, 2, 500), rng.integers(0, 20, 500) / 20
+
+
+@pytest.mark.parametrize("data", ["scored", "tied"])
+def test_areas_match_sklearn(data, request):
+    y, proba = request.getfixturevalue(data)
+    sweep = ThresholdSweep(y, proba)
+    assert sweep.roc_auc == pytest.approx(roc_auc_score(y, proba), abs=1e-12)
+    assert sweep.average_precision == pytest.approx(average_precision_score(y, proba), abs=1e-12)
+
+
+@pytest.mark.parametrize("data", ["scored", "tied"])
+def test_roc_curve_matches_sklearn(data, request):
+    y, proba = request.getfixturevalue(data)
+    sweep = ThresholdSweep(y, proba)
+    fpr, tpr, thresholds = roc_curve(y, proba, drop_intermediate=False)
+    np.testing.assert_allclose(sweep.fpr, fpr, atol=1e-12)
+    np.testing.assert_allclose(sweep.recall, tpr, atol=1e-12)
+    np.testing.assert_array_equal(sweep.thresholds[1:], thresholds[1:])
+
+
+@pytest.mark.parametrize("threshold", [0.1, 0.25, 0.5, 0.75, 0.9])
+def test_operating_point_matches_sklearn(scored, threshold):
+    y, proba = scored
+    predicted = (proba >= threshold).astype(int)
+    precision, recall, f1, _ = precision_recall_fscore_support(y, predicted, average="binary", zero_division=0)
+    tn, fp, fn, tp = confusion_matrix(y, predicted, labels=[0, 1]).ravel()
+
+    point = ThresholdSweep(y, proba).at(threshold)
+    assert (point["tp"], point["fp"], point["fn"], point["tn"]) == (tp, fp, fn, tn)
+    assert point["precision"] == pytest.approx(precision, abs=1e-12)
+    assert point["recall"] == pytest.approx(recall, abs=1e-12)
+    assert point["f1"] == pytest.approx(f1, abs=1e-12)
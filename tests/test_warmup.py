@@ -0,0 +1,54 @@
+"""The warm-up worker must pick up a new model once, not its own artifact re-export."""
+import os
+import pickle
+import shutil
+import time
+import types
+
+import pytest
+
+from pisa import ARTIFACT_PATH, MODEL_PATH, warmup
+from pisa import model as pisa_model
+
+
+def wait_for(condition, timeout=30):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            pytest.fail("timed out")
+        time.sleep(0.05)
+
+
+def test_new_pickle_is_published_once(tmp_path, monkeypatch):
+    model_path, artifact_path = tmp_path / "model.pkl", tmp_path / "model.artifact"
+    shutil.copy(MODEL_PATH, model_path)
+    shutil.copy(ARTIFACT_PATH, artifact_path)
+    monkeypatch.setattr(pisa_model, "MODEL_PATH", model_path)
+    monkeypatch.setattr(pisa_model, "ARTIFACT_PATH", artifact_path)
+    assert ARTIFACT_PATH not in warmup.WATCHED_PATHS
+
+    builds = []
+
+    def build(version):
+        builds.append(version)
+        return types.SimpleNamespace(version=version, model=pisa_model.load_model())
+
+    worker = warmup.Worker(poll=0.05, build=build, paths=(model_path,)).start()
+    try:
+        first = worker.snapshot(timeout=30).model
+        pipeline = pisa_model.load_pipeline(model_path)
+        booster = pipeline.steps[-1][1]
+        scale, bias = booster.get_scale_and_bias()
+        booster.set_scale_and_bias(scale, [b + 1.0 for b in bias] if isinstance(bias, list) else bias + 1.0)
+        with open(f"{model_path}.tmp", "wb") as f:
+            pickle.dump(pipeline, f)
+        os.replace(f"{model_path}.tmp", model_path)
+
+        wait_for(lambda: len(builds) == 2)
+        # The build re-exported the artifact; that must not trigger another one
+        time.sleep(0.5)
+        assert builds == [1, 2]
+        assert worker.snapshot().model.bias == pytest.approx(first.bias + 1.0)
+        assert pisa_model.artifact_is_current(artifact_path, model_path)
+    finally:
+        worker.stop()